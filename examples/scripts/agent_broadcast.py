@@ -20,6 +20,8 @@ from typing import Optional
 
 ATHENA_DIR = Path.home() / ".athena"
 STATUS_FILE = ATHENA_DIR / "agent_status.json"
+BUS_DIR = ATHENA_DIR / "bus"
+STATUS_TOPIC = "agent_status"
 
 VALID_STATUSES = ["idle", "working", "needs_input", "finished", "error"]
 
@@ -54,9 +56,29 @@ def set_status(
     }
 
     STATUS_FILE.write_text(json.dumps(data, indent=2))
+    _notify_watchers()
     print(f"📡 Status: {status}" + (f" — {task}" if task else ""))
 
 
+def _notify_watchers():
+    """Wake `watch` processes immediately (they fall back to polling without athena)."""
+    try:
+        from athena.core.swarm_bus import bus_dir_for, ring
+
+        ring(bus_dir_for(BUS_DIR), STATUS_TOPIC)
+    except Exception:
+        pass
+
+
+def _open_doorbell():
+    try:
+        from athena.core.swarm_bus import Doorbell, bus_dir_for
+
+        return Doorbell(bus_dir_for(BUS_DIR), STATUS_TOPIC)
+    except Exception:
+        return None
+
+
 def get_status() -> Optional[dict]:
     """Get current agent status."""
     if not STATUS_FILE.exists():
@@ -80,9 +102,10 @@ def get_status() -> Optional[dict]:
 
 
 def watch_status(interval: float = 1.0):
-    """Watch for status changes."""
+    """Watch for status changes (woken by set_status; interval is the fallback)."""
     print("👀 Watching for status changes (Ctrl+C to stop)...")
 
+    bell = _open_doorbell()
     last_data = None
     while True:
         try:
@@ -98,10 +121,15 @@ def watch_status(interval: float = 1.0):
                     print(f"Task:    {data.get('current_task', 'N/A')}")
                     print(f"Updated: {data.get('updated_at')}")
                     last_data = data
-            time.sleep(interval)
+            if bell:
+                bell.wait(interval * 30)
+            else:
+                time.sleep(interval)
         except KeyboardInterrupt:
             print("\n👋 Stopped watching")
             break
+    if bell:
+        bell.close()
 
 
 def clear_status():
@@ -11,13 +11,16 @@ import sys
 from pathlib import Path
 import glob
 from datetime import datetime
+from itertools import zip_longest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 try:
-    from athena.core.pulse_check import ensure_active, is_daemon_running
+    from athena.core.supervisor import ensure_running, is_running
 except ImportError:
     # Fallback for if not in path
     sys.path.append(str(PROJECT_ROOT / "src"))
-    from athena.core.pulse_check import ensure_active, is_daemon_running
+    from athena.core.supervisor import ensure_running, is_running
 
 # ANSI Colors
 BLUE = "\033[94m"
@@ -29,8 +32,6 @@ BOLD = "\033[1m"
 DIM = "\033[2m"
 RESET = "\033[0m"
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-
 
 def count_files(directory, pattern="*"):
     path = PROJECT_ROOT / directory
@@ -78,6 +79,21 @@ def get_system_health():
     return "Unknown"
 
 
+def get_service_health():
+    """Connectivity from the published health status file (no live probe)."""
+    try:
+        from athena.core.health import read_status
+    except ImportError:
+        return f"{DIM}Unknown{RESET}"
+    status = read_status(max_age=None)
+    if not status:
+        return f"{DIM}Not checked{RESET}"
+    failed = [n for n, c in status["checks"].items() if c["status"] != "PASS"]
+    if failed:
+        return f"{RED}{', '.join(failed)} down{RESET}"
+    return f"{GREEN}OK{RESET}"
+
+
 def get_last_boot_time():
     log_file = PROJECT_ROOT / ".agent" / "state" / "last_boot.log"
     if not log_file.exists():
@@ -98,8 +114,8 @@ def get_graphrag_status():
 
 
 def main():
-    # Pulse check to revive the Active OS if dead
-    ensure_active()
+    # Revive the Active OS if dead (supervised, single instance)
+    ensure_running("athenad")
 
     print(f"\n{BOLD}{CYAN}🏛️  PROJECT ATHENA | SYSTEM DASHBOARD{RESET}")
     print(f"{CYAN}{'━' * 60}{RESET}")
@@ -118,9 +134,10 @@ def main():
     col1 += f"  📝 Sessions:   {GREEN}{sessions}{RESET}\n"
     col2 = f"{BOLD}Status:{RESET}\n"
     daemon_status = (
-        f"{GREEN}Active{RESET}" if is_daemon_running() else f"{RED}Offline{RESET}"
+        f"{GREEN}Active{RESET}" if is_running("athenad") else f"{RED}Offline{RESET}"
     )
     col2 += f"  🧠 Daemon:     {daemon_status}\n"
+    col2 += f"  🔌 Services:   {get_service_health()}\n"
     col2 += f"  🕒 Last Boot:  {DIM}{last_boot}{RESET}\n"
     col2 += f"  🕸️  GraphRAG:   {graph_status}\n"
     col2 += f"  📍 Root:       {DIM}{PROJECT_ROOT.name}/{RESET}\n"
@@ -132,7 +149,7 @@ def main():
     # Print columns (simple side-by-side)
     lines1 = col1.split("\n")
     lines2 = col2.split("\n")
-    for l1, l2 in zip(lines1, lines2):
+    for l1, l2 in zip_longest(lines1, lines2, fillvalue=""):
         print(f"{l1:<30} {l2}")
     print()
 
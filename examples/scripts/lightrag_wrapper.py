@@ -7,9 +7,14 @@ Purpose:
   - Usage:
       python3 lightrag_wrapper.py --index --dir .agent/skills/protocols/
       python3 lightrag_wrapper.py --query "How does Protocol 10 relate to Protocol 50?" --mode hybrid
+      python3 lightrag_wrapper.py --serve --max-parallel 2   # Persistent worker (athenad)
 """
 
 import os
+import sys
+import json
+import time
+import asyncio
 import argparse
 import logging
 from lightrag import LightRAG, QueryParam
@@ -23,6 +28,8 @@ DEFAULT_EMBED_MODEL = (
     "llama3.1:8b"  # Fallback to LLM for embedding if nomic is unavailable
 )
 
+MIN_CONTENT_CHARS = 50  # Skip empty/stub files
+
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
 
@@ -83,6 +90,54 @@ def query_graph(rag, query_text, mode="hybrid"):
     return result
 
 
+def serve(rag, loop, max_parallel=2):
+    """
+    Persistent worker mode (used by athenad's BackgroundIndexer).
+
+    Protocol (newline-delimited JSON):
+      stdin  <- {"paths": ["/abs/file.md", ...]}
+      stdout -> {"results": [{"path": ..., "status": "ok|skipped|error", "seconds": ...}]}
+
+    The model and storages load once; files are read here (never passed on argv)
+    and inserted concurrently, bounded by max_parallel.
+    """
+    # Reserve the real stdout for protocol replies; library chatter goes to stderr.
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+    async def index_one(path):
+        start = time.perf_counter()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            if len(content) < MIN_CONTENT_CHARS:
+                return {"path": path, "status": "skipped", "seconds": 0.0}
+            async with semaphore:
+                await rag.ainsert(f"File: {path}\nContent:\n{content}")
+            status = {"path": path, "status": "ok"}
+        except Exception as e:
+            status = {"path": path, "status": "error", "error": str(e)}
+        status["seconds"] = round(time.perf_counter() - start, 3)
+        return status
+
+    async def run_batch(paths):
+        return await asyncio.gather(*(index_one(p) for p in paths))
+
+    logging.info(f"LightRAG worker ready (max_parallel={max_parallel})")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            paths = json.loads(line).get("paths", [])
+            results = loop.run_until_complete(run_batch(paths))
+        except Exception as e:
+            results = [{"path": None, "status": "error", "error": str(e)}]
+        replies.write(json.dumps({"results": results}) + "\n")
+        replies.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Athena LightRAG Interface")
     parser.add_argument(
@@ -103,6 +158,17 @@ def main():
     parser.add_argument(
         "--insert", type=str, help="Insert text directly into the graph"
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a persistent worker reading JSON jobs from stdin",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=2,
+        help="Concurrent inserts per batch in --serve mode",
+    )
 
     args = parser.parse_args()
 
@@ -110,6 +176,10 @@ def main():
     loop = always_get_an_event_loop()
     loop.run_until_complete(rag.initialize_storages())
 
+    if args.serve:
+        serve(rag, loop, max_parallel=args.max_parallel)
+        return
+
     if args.test:
         print("Running smoke test...")
         rag.insert("Project Athena is a Sovereign AI system designed by [AUTHOR].")
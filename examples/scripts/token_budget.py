@@ -53,18 +53,26 @@ WARNING_THRESHOLD = 180000   # Approaching the cliff
 CRITICAL_THRESHOLD = 200000  # Price doubles beyond this point (RED ZONE)
 
 
+# Shared tokenizer service (cached encoder + per-file token cache)
+try:
+    from athena.boot.loaders.token_budget import count_tokens, count_file_tokens, get_token_cache
+except ImportError:
+    sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+    try:
+        from athena.boot.loaders.token_budget import count_tokens, count_file_tokens, get_token_cache
+    except ImportError:
+        count_tokens = count_file_tokens = get_token_cache = None
+
+
 def estimate_tokens(text):
     """
     Estimates token count.
-    Uses tiktoken if available, otherwise ~4 chars per token approximation.
+    Uses the shared athena tokenizer if available, otherwise ~4 chars per token.
     """
-    try:
-        import tiktoken
-        enc = tiktoken.encoding_for_model("gpt-4")
-        return len(enc.encode(text))
-    except ImportError:
-        # Fallback: ~4 characters per token (rough approximation)
-        return len(text) // 4
+    if count_tokens is not None:
+        return count_tokens(text)
+    # Fallback: ~4 characters per token (rough approximation)
+    return len(text) // 4
 
 
 def format_tokens(count):
@@ -97,6 +105,8 @@ def analyze_file(relative_path):
         return None, f"File not found"
     
     try:
+        if count_file_tokens is not None:
+            return count_file_tokens(full_path), None
         with open(full_path, "r", encoding="utf-8") as f:
             content = f.read()
         return estimate_tokens(content), None
@@ -211,3 +221,5 @@ def main():
 
 if __name__ == "__main__":
     main()
+    if get_token_cache is not None:
+        get_token_cache().save()
@@ -4,16 +4,25 @@ update_hot_manifest.py
 ======================
 Analyzes recent activity to update hot_manifest.json with the most relevant files.
 Restored and Upgraded for v8.2-Stable.
+
+Ranking: observed access frequency (.athena/file_access.json, written by the
+shared content cache) decayed by recency, then recently modified files to
+fill any remaining slots.
 """
 
 import os
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
 # Paths
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MANIFEST_PATH = PROJECT_ROOT / ".context" / "cache" / "hot_manifest.json"
+ACCESS_LOG_PATH = PROJECT_ROOT / ".athena" / "file_access.json"
+
+# Access counts lose half their weight every week
+ACCESS_HALF_LIFE_DAYS = 7
 
 # Core files that should ALWAYS be in the manifest (v8.2 Updated)
 CORE_FILES = [
@@ -35,6 +44,35 @@ CORE_FILES = [
 ]
 
 
+def get_frequent_files(limit=10):
+    """Ranks files by access count from telemetry, decayed by time since last access."""
+    if not ACCESS_LOG_PATH.exists():
+        return []
+    try:
+        access = json.loads(ACCESS_LOG_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return []
+
+    now = time.time()
+    scored = []
+    for rel_path, entry in access.items():
+        if not (PROJECT_ROOT / rel_path).is_file():
+            continue
+        age_days = max(0.0, now - entry.get("last", 0)) / 86400
+        score = entry.get("count", 0) * 0.5 ** (age_days / ACCESS_HALF_LIFE_DAYS)
+        scored.append((score, rel_path))
+
+    scored.sort(reverse=True)
+    return [
+        {
+            "name": Path(rel_path).name,
+            "path": rel_path,
+            "purpose": "Frequently accessed",
+        }
+        for _, rel_path in scored[:limit]
+    ]
+
+
 def get_recent_files(limit=5):
     """Finds recently modified markdown files in .agent and .context."""
     files = []
@@ -78,12 +116,13 @@ def main():
     # Start with core files
     manifest_files = list(CORE_FILES)
 
-    # Add recent files
+    # Add most-accessed files, then recent files
+    frequent = get_frequent_files(limit=10)
     recent = get_recent_files(limit=7)
 
     # Avoid duplicates
     existing_paths = {f["path"] for f in manifest_files}
-    for r in recent:
+    for r in frequent + recent:
         if r["path"] not in existing_paths:
             manifest_files.append(r)
             existing_paths.add(r["path"])
@@ -45,8 +45,21 @@ RESET = "\033[0m"
 DIM = "\033[2m"
 
 
+# Shared tokenizer service (cached encoder + per-file token cache)
+try:
+    from athena.boot.loaders.token_budget import count_file_tokens, get_token_cache
+except ImportError:
+    sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+    try:
+        from athena.boot.loaders.token_budget import count_file_tokens, get_token_cache
+    except ImportError:
+        count_file_tokens = get_token_cache = None
+
+
 def estimate_tokens(filepath):
-    """Estimates token count from file size."""
+    """Estimates token count (bounded just past the danger threshold)."""
+    if count_file_tokens is not None:
+        return count_file_tokens(filepath, cap=THRESHOLDS["danger"])
     try:
         with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
@@ -156,4 +169,6 @@ def main():
 
 if __name__ == "__main__":
     issues = main()
+    if get_token_cache is not None:
+        get_token_cache().save()
     sys.exit(1 if issues > 0 else 0)
@@ -18,12 +18,68 @@ Usage:
     python -m athena --help       # Show help
 """
 
+import os
+
 __version__ = "9.2.0"
 
-# Auto-load environment variables on import
-try:
-    from dotenv import load_dotenv
+# Subpackages resolved on first attribute access (PEP 562), so `import athena`
+# stays cheap for the CLI: `athena.memory` only loads when used.
+_LAZY_SUBMODULES = {
+    "auditors",
+    "boot",
+    "cli",
+    "core",
+    "generators",
+    "intelligence",
+    "mcp_server",
+    "memory",
+    "sessions",
+    "tools",
+}
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """
+    Load .env into os.environ (once per process).
+
+    Deferred: only commands and clients that need credentials call this
+    (directly or through getenv), so `athena --version` / `athena save`
+    never pay for python-dotenv.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional for minimal installs
+
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """
+    os.getenv that also sees .env: the first miss loads it (load_env), so
+    library imports get ATHENA_ROOT, API keys and knobs without paying for
+    python-dotenv when the variable is already set.
+    """
+    value = os.environ.get(name)
+    if value is None and not _env_loaded:
+        load_env()
+        value = os.environ.get(name)
+    return default if value is None else value
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional for minimal installs
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_SUBMODULES))
@@ -11,6 +11,7 @@ Usage:
     athena init --ide cursor   # Init with IDE-specific config
     athena check               # Run system health check
     athena save "summary"      # Quicksave checkpoint
+    athena services status     # Background services (athenad, sidecar)
     athena --version           # Show version
     athena --help              # Show help
 
@@ -29,13 +30,7 @@ import sys
 import os
 from pathlib import Path
 
-# Load environment variables FIRST (critical fix)
-try:
-    from dotenv import load_dotenv
-
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional for minimal installs
+from athena import load_env
 
 
 def supports_unicode() -> bool:
@@ -245,6 +240,17 @@ def main():
         help="Brief summary of the checkpoint",
     )
 
+    # services subcommand (supervised background services)
+    services_parser = subparsers.add_parser(
+        "services", help="Show or control background services (athenad, sidecar)"
+    )
+    services_parser.add_argument(
+        "action", nargs="?", choices=["status", "start", "stop"], default="status"
+    )
+    services_parser.add_argument(
+        "name", nargs="?", default=None, help="Service name (default: all)"
+    )
+
     args = parser.parse_args()
 
     if args.version:
@@ -253,6 +259,11 @@ def main():
         print(f"athena-cli v{__version__}")
         sys.exit(0)
 
+    # Credentials (.env) are only loaded for commands that talk to services;
+    # --version, init, save and services stay on the fast path.
+    if args.command not in ("init", "save", "services"):
+        load_env()
+
     # check subcommand or --doctor flag
     if args.command == "check" or args.doctor:
         run_check()
@@ -294,6 +305,25 @@ def main():
         success = run_quicksave(summary, project_root=args.root)
         sys.exit(0 if success else 1)
 
+    if args.command == "services":
+        from athena.core import supervisor
+
+        names = [args.name] if args.name else list(supervisor.SERVICES)
+        unknown = [n for n in names if n not in supervisor.SERVICES]
+        if unknown:
+            safe_print(f"❌ Unknown service: {', '.join(unknown)}")
+            sys.exit(2)
+        if args.action == "start":
+            for name in names:
+                print(f"   {name}: {supervisor.ensure_running(name)[0]}")
+        elif args.action == "stop":
+            for name in names:
+                stopped = supervisor.stop(name)
+                print(f"   {name}: {'stopping' if stopped else 'not running'}")
+        else:
+            supervisor.print_status()
+        sys.exit(0)
+
     # Default action: boot
     from athena.boot.orchestrator import main as boot_main
 
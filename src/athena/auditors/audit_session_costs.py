@@ -36,16 +36,14 @@ BOLD = "\033[1m"
 
 
 def estimate_tokens(text):
-    try:
-        import tiktoken
+    from athena.boot.loaders.token_budget import count_tokens
 
-        enc = tiktoken.encoding_for_model("gpt-4")
-        return len(enc.encode(text))
-    except ImportError:
-        return len(text) // 4
+    return count_tokens(text)
 
 
 def analyze_sessions():
+    from athena.boot.loaders.token_budget import count_file_tokens, get_token_cache
+
     files = sorted(
         glob.glob(os.path.join(SESSION_LOG_DIR, "*.md"))
         + glob.glob(os.path.join(SESSION_LOG_DIR, "archive", "*.md"))
@@ -67,12 +65,8 @@ def analyze_sessions():
     for log_path in files:
         filename = os.path.basename(log_path)
 
-        # Read content
-        with open(log_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Estimate session tokens
-        session_tokens = estimate_tokens(content)
+        # Estimate session tokens (cached by path/mtime/size across runs)
+        session_tokens = count_file_tokens(log_path)
 
         # Estimate turns (Rough heuristic: 1 turn per ~300 tokens of log? Or just assume 50 turns avg?)
         # Better heuristic: Count "Step Id" or speaker markers if available, but markdown is loose.
@@ -114,6 +108,7 @@ def analyze_sessions():
     print(
         f"  {BOLD}TOTAL SAVINGS:{RESET}              {GREEN}${total_monolith_cost - total_adaptive_cost:.2f} (-{((total_monolith_cost - total_adaptive_cost) / total_monolith_cost) * 100:.1f}%){RESET}"
     )
+    get_token_cache().save()
     print(
         f"\n{YELLOW}* Note: Assumes avg 50 turns/session. Adaptive model assumes 1 active module (5k) loaded.{RESET}"
     )
@@ -16,6 +16,7 @@ import os
 import re
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # ── ANSI Colors ──
@@ -89,8 +90,27 @@ def extract_session_date(filename: str) -> datetime | None:
     return None
 
 
+@lru_cache(maxsize=1)
+def _local_index():
+    """Shared local index, or None if it has not been built (fall back to rglob)."""
+    try:
+        from athena.memory.local_index import get_local_index
+
+        index = get_local_index()
+        return index if index.exists() else None
+    except Exception:
+        return None
+
+
 def find_referenced_file(ref: str) -> Path | None:
     """Search for a referenced file across known directories."""
+    index = _local_index()
+    if index is not None and "/" not in ref:
+        for search_dir in SEARCH_DIRS:
+            matches = index.find_by_name(ref, under=[search_dir])
+            if matches:
+                return Path(sorted(matches)[0])
+
     for search_dir in SEARCH_DIRS:
         if not search_dir.exists():
             continue
@@ -109,6 +129,13 @@ def resolve_protocol_ref(protocol_num: str) -> Path | None:
     protocols_dir = PROJECT_ROOT / ".agent" / "skills" / "protocols"
     if not protocols_dir.exists():
         return None
+
+    index = _local_index()
+    if index is not None:
+        matches = index.files_under(protocols_dir, f"%{protocol_num}%.md")
+        if matches:
+            return Path(matches[0])
+
     for match in protocols_dir.rglob(f"*{protocol_num}*"):
         if match.suffix == ".md":
             return match
@@ -21,6 +21,8 @@ import logging
 from pathlib import Path
 
 from athena.boot.constants import DIM, GREEN, PROJECT_ROOT, RESET
+from athena.boot.snapshot import get_boot_snapshot
+from athena.core.content_cache import get_content_cache
 
 logger = logging.getLogger("athena.boot.context_summaries")
 
@@ -60,7 +62,7 @@ def _extract_summary(path: Path) -> str:
     This is a heuristic extraction, not LLM-generated — zero API cost.
     """
     try:
-        content = path.read_text(encoding="utf-8")
+        content = get_content_cache().read_text(path)
     except Exception:
         return ""
 
@@ -102,7 +104,8 @@ def _extract_summary(path: Path) -> str:
 def generate_summaries(force: bool = False) -> dict:
     """Generate compressed summaries for all Memory Bank files.
 
-    Uses hash-based delta detection: only regenerates if source changed.
+    The boot snapshot short-circuits on unchanged sources (stat only);
+    otherwise hash-based delta detection regenerates only changed files.
 
     Args:
         force: If True, regenerate all summaries regardless of cache.
@@ -110,6 +113,16 @@ def generate_summaries(force: bool = False) -> dict:
     Returns:
         dict: {name: summary_text, ...}
     """
+    sources = [PROJECT_ROOT / rel_path for rel_path in SUMMARY_SOURCES.values()]
+    snapshot = get_boot_snapshot()
+    if force:
+        summaries = _build_summaries(force=True)
+        snapshot.put("context_summaries", sources, summaries)
+        return summaries
+    return snapshot.cached("context_summaries", sources, _build_summaries)
+
+
+def _build_summaries(force: bool = False) -> dict:
     SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     # Load existing caches
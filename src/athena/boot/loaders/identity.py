@@ -1,8 +1,8 @@
 import sys
-import json
 import re
 import hashlib
 from pathlib import Path
+from athena.boot.snapshot import get_boot_snapshot
 from athena.boot.constants import (
     PROJECT_ROOT,
     CORE_IDENTITY,
@@ -28,8 +28,11 @@ class IdentityLoader:
             return False
 
         try:
-            content = CORE_IDENTITY.read_bytes()
-            current_hash = hashlib.sha384(content).hexdigest()
+            current_hash = get_boot_snapshot().cached(
+                "core_identity_sha384",
+                [CORE_IDENTITY],
+                lambda: hashlib.sha384(CORE_IDENTITY.read_bytes()).hexdigest(),
+            )
         except Exception as e:
             print(f"{RED}[FATAL] Cannot read Core_Identity.md: {e}{RESET}")
             return False
@@ -91,106 +94,28 @@ class IdentityLoader:
         except Exception as e:
             print(f"{YELLOW}⚠️ Failed to load Athena Profile: {e}{RESET}")
 
-    @staticmethod
-    def _get_protocol_cache_path():
-        from athena.core.config import AGENT_DIR
-
-        return AGENT_DIR / "state" / "protocol_cache.json"
-
     @staticmethod
     def inject_auto_protocols(context_clues=""):
-        """Scans enabled protocols and injects relevant ones (with disk-backed caching)."""
+        """Scans enabled protocols and injects relevant ones (precompiled protocol index)."""
         if not PROTOCOLS_JSON.exists():
             return
 
-        cache_path = IdentityLoader._get_protocol_cache_path()
-        context_key = context_clues.lower().strip()
-
-        # Try cache first
-        if cache_path.exists():
-            try:
-                cache = json.loads(cache_path.read_text())
-                if context_key in cache:
-                    # In a real system, we'd check if PROTOCOLS_JSON mtime changed
-                    # But for now, simple cache return
-                    cached_loadout = cache[context_key]
-                    print(
-                        f"\n{BOLD}{CYAN}🧙‍♂️ ATHENA GUIDANCE SYSTEM (Cached Loadout){RESET}"
-                    )
-                    print(f"{DIM}Detected Context: {context_clues}{RESET}")
-                    print(f"\n{BOLD}⚡ Active Context Loadout:{RESET}")
-                    for p in cached_loadout:
-                        print(
-                            f"   ► {p['icon']} {GREEN}{p['type']} {p['pid']}{RESET}: {p['name']}"
-                        )
-                        print(f"     {DIM}Trigger: {p['trigger']}{RESET}")
-                    return
-            except Exception:
-                pass
-
         try:
-            with open(PROTOCOLS_JSON, "r") as f:
-                data = json.load(f)
-            protocols = data.get("protocols", {})
-            active_context = context_clues.lower().split()
-
-            matches = []
-            for pid, p in protocols.items():
-                protocol_path = p.get("path", "")
-                if protocol_path:
-                    full_path = PROJECT_ROOT / protocol_path
-                    if not full_path.exists():
-                        continue
-
-                score = 0
-                tags = [t.lower() for t in p.get("context_tags", [])]
-                cases = [c.lower() for c in p.get("applied_use_cases", [])]
-
-                for term in active_context:
-                    if term in tags or any(term in t for t in tags):
-                        score += 1
-                for term in active_context:
-                    if any(term in c for c in cases):
-                        score += 2
-
-                if score > 0:
-                    matches.append((score, pid, p))
-
-            matches.sort(key=lambda x: x[0], reverse=True)
-
-            if matches:
-                output_matches = []
-                print(f"\n{BOLD}{CYAN}🧙‍♂️ ATHENA GUIDANCE SYSTEM (Auto-Active){RESET}")
+            from athena.boot.protocol_index import load_protocol_index
+
+            index, cached = load_protocol_index()
+            loadout = index.loadout(context_clues)
+
+            if loadout:
+                label = "Cached Loadout" if cached else "Auto-Active"
+                print(f"\n{BOLD}{CYAN}🧙‍♂️ ATHENA GUIDANCE SYSTEM ({label}){RESET}")
                 print(f"{DIM}Detected Context: {context_clues}{RESET}")
                 print(f"\n{BOLD}⚡ Active Context Loadout:{RESET}")
-                for _, pid, p in matches[:5]:
-                    name = p["name"]
-                    ptype = p.get("type", "protocol").title()
-                    cases = p.get("applied_use_cases", ["General Application"])
-                    icon = "🧪" if ptype == "Case_Study" else "📜"
-                    print(f"   ► {icon} {GREEN}{ptype} {pid}{RESET}: {name}")
-                    print(f"     {DIM}Trigger: {cases[0]}{RESET}")
-
-                    output_matches.append(
-                        {
-                            "pid": pid,
-                            "name": name,
-                            "type": ptype,
-                            "trigger": cases[0],
-                            "icon": icon,
-                        }
+                for p in loadout:
+                    print(
+                        f"   ► {p['icon']} {GREEN}{p['type']} {p['pid']}{RESET}: {p['name']}"
                     )
-
-                # Save to cache
-                try:
-                    cache = {}
-                    if cache_path.exists():
-                        cache = json.loads(cache_path.read_text())
-                    cache[context_key] = output_matches
-                    cache_path.parent.mkdir(parents=True, exist_ok=True)
-                    cache_path.write_text(json.dumps(cache))
-                except Exception:
-                    pass
+                    print(f"     {DIM}Trigger: {p['trigger']}{RESET}")
             else:
                 print(
                     f"\n{DIM}No specific context detected. Running Standard Operating Procedures.{RESET}"
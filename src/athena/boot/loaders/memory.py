@@ -2,9 +2,9 @@ import sys
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from athena.boot.snapshot import get_boot_snapshot
 from athena.boot.constants import (
     PROJECT_ROOT,
-    LOGS_DIR,
     SUPABASE_SEARCH_SCRIPT,
     GREEN,
     YELLOW,
@@ -19,41 +19,23 @@ class MemoryLoader:
     @staticmethod
     def recall_last_session() -> str:
         """Display summary of last session with context handoff."""
-        if not LOGS_DIR.exists():
-            return ""
+        from athena.core.session_catalog import get_session_catalog
 
-        files = sorted(LOGS_DIR.glob("*-session-*.md"))
-        if not files:
+        catalog = get_session_catalog()
+        latest_file = catalog.latest_path()
+        if latest_file is None:
             return ""
 
-        latest_file = files[-1]
         filename = latest_file.name
         print(f"⏮️  Last Session: {BOLD}{filename}{RESET}")
 
         try:
-            content = latest_file.read_text(encoding="utf-8")
-            for line in content.split("\n"):
-                if line.startswith("**Focus**:"):
-                    focus = line.replace("**Focus**:", "").strip()
-                    if focus and focus != "...":
-                        print(f"   Focus: {focus}")
-                    break
+            header = catalog.header(latest_file)
+            if header["focus"]:
+                print(f"   Focus: {header['focus']}")
 
             # Deferred items logic
-            deferred_items = []
-            if "## 3. Action Items" in content or "## Action Items" in content:
-                in_action = False
-                for line in content.split("\n"):
-                    if "Action Items" in line and line.startswith("#"):
-                        in_action = True
-                        continue
-                    if in_action and line.startswith("#"):
-                        break
-                    if in_action and "Pending" in line and "|" in line:
-                        parts = [p.strip() for p in line.split("|")]
-                        if len(parts) >= 3 and parts[1] and parts[1] != "Action":
-                            deferred_items.append(f"📋 {parts[1]}")
-
+            deferred_items = [f"📋 {item}" for item in header["deferred"]]
             if deferred_items:
                 print(f"\n   {YELLOW}📌 Deferred from last session:{RESET}")
                 for item in deferred_items[:3]:
@@ -68,10 +50,9 @@ class MemoryLoader:
     def create_session() -> str:
         """Create a new session log."""
         try:
-            sys.path.insert(0, str(PROJECT_ROOT / ".agent" / "scripts"))
-            import create_session as cs
+            from athena.sessions import create_session
 
-            session_path = cs.create_session_log()
+            session_path = create_session()
             session_id = session_path.stem
             print(f"{GREEN}✅ Created: {session_id}{RESET}")
             return session_id
@@ -116,41 +97,40 @@ class MemoryLoader:
 
     @staticmethod
     def prewarm_search_cache():
-        """Pre-run common queries to populate the search cache."""
+        """Replay top queries from search telemetry into the cache (budgeted, concurrent)."""
         try:
-            from athena.tools.search import run_search
-
-            hot_queries = ["protocol", "session", "user profile"]
-            for query in hot_queries:
-                try:
-                    run_search(query, limit=5, json_output=True)
-                except Exception:
-                    pass  # Best effort
+            from athena.tools.prewarm import PrewarmEngine
+
+            engine = PrewarmEngine()
+            previous = engine.last_report()
+            if previous and previous["searches"]:
+                print(
+                    f"{DIM}   Last prewarm: {previous['warm_hits']}/{previous['searches']} "
+                    f"searches served warm ({previous['rate']:.0%}){RESET}"
+                )
+
+            report = engine.run()
             print(
-                f"{GREEN}🔥 Search cache pre-warmed ({len(hot_queries)} queries){RESET}"
+                f"{GREEN}🔥 Search cache pre-warmed ({len(report['warmed'])}/"
+                f"{report['planned']} queries, {report['elapsed']}s){RESET}"
             )
         except Exception as e:
             print(f"{YELLOW}⚠️ Cache pre-warm skipped: {e}{RESET}")
 
     @staticmethod
-    def display_learnings_snapshot():
-        """Show recent user preferences and learning snapshots."""
-        memory_dir = PROJECT_ROOT / ".athena" / "memory"
-        user_profile = memory_dir / "USER_PROFILE.yaml"
-        system_learnings = memory_dir / "SYSTEM_LEARNINGS.md"
+    def _read_learnings(user_profile: Path, system_learnings: Path) -> dict:
+        """Parse user prefs and the two most recent learnings (display-ready)."""
+        prefs, learnings = [], []
 
         if user_profile.exists():
             try:
                 content = user_profile.read_text()
-                prefs = []
                 if "wants_idempotent_compilers: true" in content:
                     prefs.append("idempotent compilers")
                 if "prefers_deterministic_inference: true" in content:
                     prefs.append("deterministic inference")
                 if "likes_enforcement_warnings: true" in content:
                     prefs.append("enforcement warnings")
-                if prefs:
-                    print(f"\n{DIM}📋 User Prefs: {', '.join(prefs[:3])}{RESET}")
             except Exception:
                 pass
 
@@ -160,17 +140,33 @@ class MemoryLoader:
                 rows = [
                     line for line in content.split("\n") if line.startswith("| 202")
                 ]
-                if rows:
-                    recent = rows[-2:]
-                    print(f"{DIM}📚 Recent Learnings:{RESET}")
-                    for row in recent:
-                        parts = [p.strip() for p in row.split("|")]
-                        if len(parts) >= 4:
-                            learning = (
-                                parts[3][:60] + "..."
-                                if len(parts[3]) > 60
-                                else parts[3]
-                            )
-                            print(f"   {DIM}• {learning}{RESET}")
+                for row in rows[-2:]:
+                    parts = [p.strip() for p in row.split("|")]
+                    if len(parts) >= 4:
+                        learnings.append(
+                            parts[3][:60] + "..." if len(parts[3]) > 60 else parts[3]
+                        )
             except Exception:
                 pass
+
+        return {"prefs": prefs, "learnings": learnings}
+
+    @staticmethod
+    def display_learnings_snapshot():
+        """Show recent user preferences and learning snapshots."""
+        memory_dir = PROJECT_ROOT / ".athena" / "memory"
+        user_profile = memory_dir / "USER_PROFILE.yaml"
+        system_learnings = memory_dir / "SYSTEM_LEARNINGS.md"
+
+        snapshot = get_boot_snapshot().cached(
+            "learnings_snapshot",
+            [user_profile, system_learnings],
+            lambda: MemoryLoader._read_learnings(user_profile, system_learnings),
+        )
+
+        if snapshot["prefs"]:
+            print(f"\n{DIM}📋 User Prefs: {', '.join(snapshot['prefs'][:3])}{RESET}")
+        if snapshot["learnings"]:
+            print(f"{DIM}📚 Recent Learnings:{RESET}")
+            for learning in snapshot["learnings"]:
+                print(f"   {DIM}• {learning}{RESET}")
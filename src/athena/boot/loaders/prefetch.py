@@ -5,26 +5,32 @@ from athena.boot.constants import PROJECT_ROOT, DIM, RESET
 
 class PrefetchLoader:
     @staticmethod
-    def prefetch_hot_files():
-        """Reads files from hot_manifest.json to prime them in the context."""
+    def prefetch_hot_files(load_content: bool = True):
+        """
+        Warms the files in hot_manifest.json.
+
+        Every file gets a parallel page-cache prefetch (posix_fadvise WILLNEED).
+        With load_content, the hot set is also decoded into the shared content
+        cache that search collectors, context summaries and recall read first.
+        """
         manifest_path = PROJECT_ROOT / ".context" / "cache" / "hot_manifest.json"
         if not manifest_path.exists():
             return
 
         try:
+            from athena.core.content_cache import get_content_cache, prefetch_pages
+
             with open(manifest_path, "r") as f:
                 manifest = json.load(f)
 
             files = manifest.get("files", [])
             print(f"\n{DIM}🔥 Prefetching {len(files)} hot files...{RESET}")
 
-            for f_info in files:
-                f_path = PROJECT_ROOT / f_info["path"]
-                if f_path.exists():
-                    # Just read it to bring it into the "conscious" memory of the system
-                    # In a real environment, this ensures the content is ready for the agent.
-                    f_path.read_text(encoding="utf-8")
-                    # print(f"   {DIM}• {f_info['name']}{RESET}")
+            paths = [PROJECT_ROOT / f_info["path"] for f_info in files]
+            paths = [p for p in paths if p.is_file()]
+            prefetch_pages(paths)
+            if load_content:
+                get_content_cache().warm(paths)
 
         except Exception as e:
             # print(f"{DIM}⚠️ Prefetch error: {e}{RESET}")
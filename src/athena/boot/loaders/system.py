@@ -1,5 +1,4 @@
 import subprocess
-import os
 from athena.boot.constants import GREEN, RESET
 
 
@@ -30,25 +29,19 @@ class SystemLoader:
 
     @staticmethod
     def enforce_daemon():
-        """Ensures the Athena Daemon (athenad) is active."""
-        from athena.boot.constants import PROJECT_ROOT, GREEN, BOLD, RESET
-
-        daemon_script = PROJECT_ROOT / "src" / "athena" / "core" / "athenad.py"
+        """Ensures the Athena Daemon (athenad) is active (supervised, single instance)."""
+        from athena.boot.constants import GREEN, YELLOW, RESET
+        from athena.core.supervisor import ensure_running
 
         try:
-            # Check if running
-            check = subprocess.run(["pgrep", "-f", "athenad.py"], capture_output=True)
-            if check.returncode != 0:
+            state, started = ensure_running("athenad")
+            if started:
                 print("🧠 Starting Athena Daemon (Titanium)...")
-                subprocess.Popen(
-                    [os.sys.executable, str(daemon_script)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True,
-                )
-                print(f"   {GREEN}✅ Daemon Started.{RESET}")
-            else:
+                print(f"   {GREEN}✅ Daemon Started (supervised).{RESET}")
+            elif state == "running":
                 print(f"   {GREEN}✅ Athena Daemon active.{RESET}")
+            else:
+                print(f"   {YELLOW}⚠️  Athena Daemon {state}.{RESET}")
         except Exception as e:
             print(f"   ⚠️  Daemon enforcement failed: {e}")
 
@@ -9,11 +9,22 @@ is exceeded.
 
 Operating Band:
   10K (post-compact target) ←→ 15K (hard cap, triggers compact)
+
+Also hosts the shared tokenizer service: one lazily-loaded encoder per
+process and a persisted (path, mtime, size) → tokens cache, so other token
+estimators (auditors, watchdog, token_budget script) never re-tokenize an
+unchanged file.
 """
 
+import json
+import os
 import sys
+import tempfile
+import threading
 from pathlib import Path
+from athena.boot.snapshot import get_boot_snapshot
 from athena.boot.constants import (
+    PROJECT_ROOT,
     BOOT_FILES,
     GREEN,
     YELLOW,
@@ -32,20 +43,162 @@ SYSTEM_INSTRUCTIONS_ESTIMATE = 3_000  # Fixed estimate for IDE-injected system p
 MAX_COMPACT_PASSES = 3  # Safety: max compaction retries
 
 
+# === Tokenizer Service ===
+TOKEN_CACHE_PATH = PROJECT_ROOT / ".agent" / "state" / "token_cache.json"
+STREAM_CHUNK_CHARS = 64 * 1024  # Streaming tokenizer read size
+
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+def get_encoder():
+    """Lazily load the cl100k_base tokenizer once per process (None if unavailable)."""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        with _encoder_lock:
+            if not _encoder_loaded:
+                try:
+                    import tiktoken
+
+                    _encoder = tiktoken.get_encoding("cl100k_base")
+                except Exception:
+                    _encoder = None
+                _encoder_loaded = True
+    return _encoder
+
+
 def count_tokens(text: str) -> int:
     """
     Count tokens using tiktoken (cl100k_base).
     Falls back to len(text) // 4 if tiktoken is unavailable.
     """
+    enc = get_encoder()
+    if enc is None:
+        return len(text) // 4
     try:
-        import tiktoken
-
-        enc = tiktoken.get_encoding("cl100k_base")
-        return len(enc.encode(text))
-    except (ImportError, Exception):
+        return len(enc.encode(text, disallowed_special=()))
+    except Exception:
         return len(text) // 4
 
 
+def count_tokens_bounded(path: Path, cap: int = HARD_CAP) -> tuple[int, bool]:
+    """
+    Streaming token count that stops once `cap` is exceeded.
+
+    The file is tokenized in line-aligned chunks, so a 5MB log over budget
+    costs one chunk past the cap instead of a full read + encode.
+
+    Returns:
+        (tokens, capped): capped is True if counting stopped early.
+    """
+    total = 0
+    carry = ""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_CHARS)
+            if not chunk:
+                break
+            chunk = carry + chunk
+            cut = chunk.rfind("\n") + 1
+            if cut:
+                chunk, carry = chunk[:cut], chunk[cut:]
+            else:
+                carry = ""
+            total += count_tokens(chunk)
+            if total > cap:
+                return total, True
+    if carry:
+        total += count_tokens(carry)
+    return total, total > cap
+
+
+class TokenCache:
+    """Persisted (path, mtime, size) → token count table, shared between boots."""
+
+    def __init__(self, path: Path = TOKEN_CACHE_PATH):
+        self.path = Path(path)
+        self._entries: dict | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except Exception:
+                self._entries = {}
+        return self._entries
+
+    def count_file(self, path: Path, cap: int | None = None) -> int:
+        """
+        Token count for a file, re-tokenizing only when (mtime, size) changed.
+
+        With `cap`, large files are counted with the bounded streaming
+        tokenizer; the result is then a lower bound greater than `cap`.
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return 0
+        key = str(path.resolve())
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            tokens, capped = entry[2], entry[3]
+            # A capped count answers any question asked with a cap below it
+            if not capped or (cap is not None and tokens > cap):
+                return tokens
+
+        try:
+            if cap is not None:
+                tokens, capped = count_tokens_bounded(path, cap)
+            else:
+                tokens = count_tokens(path.read_text(encoding="utf-8", errors="ignore"))
+                capped = False
+        except Exception:
+            return 0
+
+        with self._lock:
+            self._load()[key] = [st.st_mtime_ns, st.st_size, tokens, capped]
+            self._dirty = True
+        return tokens
+
+    def save(self) -> bool:
+        """Atomically persist the table if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = json.dumps(self._entries or {})
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    f.write(payload)
+                os.replace(tmp, self.path)
+                self._dirty = False
+                return True
+            except Exception:
+                return False
+
+
+_token_cache: TokenCache | None = None
+
+
+def get_token_cache() -> TokenCache:
+    """Get the process-wide token cache."""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache()
+    return _token_cache
+
+
+def count_file_tokens(path: Path, cap: int | None = None) -> int:
+    """Cached token count for a file (see TokenCache.count_file)."""
+    return get_token_cache().count_file(path, cap)
+
+
 def measure_boot_files() -> dict:
     """
     Read the 3 canonical Memory Bank files and return per-file token counts.
@@ -54,17 +207,19 @@ def measure_boot_files() -> dict:
     Returns:
         dict: {"filename": token_count, ...}
     """
-    counts = {}
-    for name, path in BOOT_FILES.items():
-        if path.exists():
-            try:
-                content = path.read_text(encoding="utf-8")
-                counts[name] = count_tokens(content)
-            except Exception:
-                counts[name] = 0
-        else:
-            counts[name] = 0
-
+    def read_counts() -> dict:
+        # A single file over HARD_CAP already forces compaction, so stop there
+        counts = {
+            name: count_file_tokens(path, cap=HARD_CAP)
+            for name, path in BOOT_FILES.items()
+        }
+        get_token_cache().save()
+        return counts
+
+    # Boot snapshot: unchanged files (by stat) skip the read + tokenize
+    counts = dict(
+        get_boot_snapshot().cached("boot_tokens", BOOT_FILES.values(), read_counts)
+    )
     counts["boot.py output"] = BOOT_SCRIPT_ESTIMATE
     counts["System instructions"] = SYSTEM_INSTRUCTIONS_ESTIMATE
     return counts
@@ -40,136 +40,158 @@ def main():
         # For now, just pass
         pass
 
-    # Phase 1: Watchdog & Pre-flight
-    StateLoader.enable_watchdog()
-    UILoader.divider("⚡ ATHENA BOOT SEQUENCE")
-
-    # Titanium Airlock
-    SystemLoader.verify_environment()
-    SystemLoader.enforce_daemon()
-
-    # Phase 1.1: Security Patch (CVE-2025-69872)
-    try:
-        from athena.core.security import patch_dspy_cache_security
-
-        patch_dspy_cache_security()
-        print(f"   🛡️  Security: DiskCache mitigation active.")
-    except ImportError:
-        pass
-    except Exception as e:
-        print(f"   ⚠️  Security Patch Failed: {e}")
-
-    StateLoader.check_prior_crashes()
-    StateLoader.check_canary_overdue()
-
-    # Phase 1.5: System Sync & Boot Timestamp Update
-    SystemLoader.sync_ui()
-    try:
-        last_boot_log = PROJECT_ROOT / ".agent" / "state" / "last_boot.log"
-        last_boot_log.parent.mkdir(parents=True, exist_ok=True)
-        with open(last_boot_log, "w") as f:
-            f.write(datetime.now().isoformat())
-    except Exception as e:
-        print(f"   ⚠️  Boot Log Update Fail: {e}")
-
-    # Phase 2: Integrity
-    if not IdentityLoader.verify_semantic_prime():
-        return 1
-
-    # Phase 3: Memory Recall
-    last_session = MemoryLoader.recall_last_session()
-
-    # Phase 3.5: Token Budget Check & Auto-Compaction
-    token_counts = measure_boot_files()
-    token_counts = auto_compact_if_needed(token_counts)
-
-    # Phase 4: Session Creation
-    session_id = MemoryLoader.create_session()
-
-    # Phase 4.1: Record session start reference (for passive observation)
-    try:
-        from athena.auditors.audit_observations import record_start_ref
-
-        record_start_ref()
-    except Exception:
-        pass  # Non-critical — observations are optional
-
-    # Phase 5: Audit (Reset)
-    try:
-        sys.path.insert(0, str(PROJECT_ROOT / ".agent" / "scripts"))
-        from semantic_audit import reset_audit
-
-        reset_audit()
-    except Exception:
-        pass
-
-    # Phase 6 & 7: Optimized Context & Semantic Activation (Parallel)
-    from concurrent.futures import ThreadPoolExecutor
+    from athena.boot.scheduler import BootScheduler
+    from athena.boot.snapshot import get_boot_snapshot
     from athena.core.health import HealthCheck
     from athena.boot.loaders.context_summaries import (
         generate_summaries,
         display_summary_status,
     )
 
+    # Phase 1: Watchdog & Pre-flight (main thread: SIGALRM needs it)
+    StateLoader.enable_watchdog()
+    UILoader.divider("⚡ ATHENA BOOT SEQUENCE")
+
+    def apply_security_patch():
+        # Phase 1.1: Security Patch (CVE-2025-69872)
+        try:
+            from athena.core.security import patch_dspy_cache_security
+
+            patch_dspy_cache_security()
+            print(f"   🛡️  Security: DiskCache mitigation active.")
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"   ⚠️  Security Patch Failed: {e}")
+
+    def write_boot_timestamp():
+        try:
+            last_boot_log = PROJECT_ROOT / ".agent" / "state" / "last_boot.log"
+            last_boot_log.parent.mkdir(parents=True, exist_ok=True)
+            with open(last_boot_log, "w") as f:
+                f.write(datetime.now().isoformat())
+        except Exception as e:
+            print(f"   ⚠️  Boot Log Update Fail: {e}")
+
+    def measure_tokens():
+        # Phase 3.5: Token Budget Check & Auto-Compaction
+        return auto_compact_if_needed(measure_boot_files())
+
+    def record_observation_ref():
+        # Phase 4.1: Record session start reference (for passive observation)
+        try:
+            from athena.auditors.audit_observations import record_start_ref
+
+            record_start_ref()
+        except Exception:
+            pass  # Non-critical — observations are optional
+
+    def reset_semantic_audit():
+        # Phase 5: Audit (Reset)
+        try:
+            sys.path.insert(0, str(PROJECT_ROOT / ".agent" / "scripts"))
+            from semantic_audit import reset_audit
+
+            reset_audit()
+        except Exception:
+            pass
+
+    def display_status():
+        MemoryLoader.display_learnings_snapshot()
+        IdentityLoader.display_cognitive_profile()
+        IdentityLoader.display_cos_status()
+        display_summary_status(boot.result("summaries") or {})
+
     def run_health_check_wrapper():
         if not HealthCheck.run_all():
             print(
                 f"{RED}⚠️  System health check failed. Proceeding with caution...{RESET}"
             )
 
-    # Tier 0: Pre-computed context summaries (hash-based delta, zero API cost)
-    context_summaries = {}
-
-    def run_context_summaries():
-        nonlocal context_summaries
-        context_summaries = generate_summaries()
+    def launch_sidecar():
+        # Phase 8: Sidecar Launch (Sovereign Index) — supervised, single instance
+        try:
+            from athena.core.supervisor import ensure_running
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        # 1. Non-blocking context capture
-        executor.submit(MemoryLoader.capture_context)
+            state, started = ensure_running("sidecar")
+            if started:
+                print("   🛡️  Sidecar Launched (supervised)")
+            elif state == "missing":
+                print("   ⚠️  Sidecar skipped (script not found)")
+        except Exception as e:
+            print(f"   ⚠️  Sidecar Fail: {e}")
 
-        # 2. Semantic priming (most expensive)
-        semantic_future = executor.submit(MemoryLoader.prime_semantic)
+    # Boot DAG: each step starts as soon as its dependencies finish.
+    boot = BootScheduler(max_workers=8)
 
-        # 3. Protocol injection
-        executor.submit(IdentityLoader.inject_auto_protocols, "startup session boot")
+    # Titanium Airlock & pre-flight (independent)
+    boot.add("airlock", SystemLoader.verify_environment)
+    boot.add("daemon", SystemLoader.enforce_daemon)
+    boot.add("security", apply_security_patch)
+    boot.add("crash_check", StateLoader.check_prior_crashes)
+    boot.add("canary", StateLoader.check_canary_overdue)
+    boot.add("boot_log", write_boot_timestamp)
 
-        # 4. Search cache pre-warming (new)
-        executor.submit(MemoryLoader.prewarm_search_cache)
+    # Phase 2: Integrity (gate — failure aborts boot)
+    boot.add("integrity", IdentityLoader.verify_semantic_prime, required=True)
 
-        # 5. System Health Check (Moved to background)
-        executor.submit(run_health_check_wrapper)
+    # Page-cache + content-cache warm of the hot set (recall/summaries read it)
+    boot.add("prefetch", PrefetchLoader.prefetch_hot_files)
 
-        # 6. Prefetch (Moved to background)
-        executor.submit(PrefetchLoader.prefetch_hot_files)
+    # Phase 3: Memory Recall (must read the previous session before Phase 4)
+    boot.add("recall", MemoryLoader.recall_last_session, deps=["prefetch"])
+    boot.add("tokens", measure_tokens)
 
-        # 7. Tier 0: Context Summary Pre-computation (Min-Latency × Max-Effectiveness)
-        executor.submit(run_context_summaries)
+    # Phase 4: Session Creation
+    boot.add(
+        "session",
+        MemoryLoader.create_session,
+        deps=["integrity", "recall"],
+        required=True,
+    )
+    boot.add("observations", record_observation_ref, deps=["session"])
+    boot.add("audit_reset", reset_semantic_audit)
+
+    # Phase 6 & 7: Optimized Context (semantic priming moved to the deferred prewarm)
+    boot.add("context", MemoryLoader.capture_context, deps=["integrity"])
+    boot.add(
+        "protocols",
+        lambda: IdentityLoader.inject_auto_protocols("startup session boot"),
+        deps=["integrity"],
+    )
+    # Tier 0: Pre-computed context summaries (hash-based delta, zero API cost)
+    boot.add("summaries", generate_summaries, deps=["tokens", "prefetch"])
 
-    # Display remaining sync items
-    MemoryLoader.display_learnings_snapshot()
-    IdentityLoader.display_cognitive_profile()
-    IdentityLoader.display_cos_status()
-    display_summary_status(context_summaries)
+    # Display after the parallel work so output is not interleaved
+    boot.add(
+        "display",
+        display_status,
+        deps=["session", "context", "protocols", "summaries"],
+    )
 
-    # Phase 8: Sidecar Launch (Sovereign Index)
-    try:
-        import subprocess
+    # Deferred: non-critical work that must not delay "Ready"
+    boot.add("ui_sync", SystemLoader.sync_ui, deferred=True)
+    boot.add("health", run_health_check_wrapper, deferred=True)
+    # Replays top queries from search telemetry into the exact + semantic cache
+    boot.add("prewarm", MemoryLoader.prewarm_search_cache, deferred=True)
+    boot.add("sidecar", launch_sidecar, deferred=True)
+
+    ok = boot.run()
+    # Persist derived outputs so an unchanged workspace boots from the snapshot
+    get_boot_snapshot().save()
+    if not ok:
+        StateLoader.disable_watchdog()
+        boot.write_trace()
+        return 1
 
-        sidecar_path = PROJECT_ROOT / ".agent" / "scripts" / "sidecar.py"
-        subprocess.Popen(
-            [sys.executable, str(sidecar_path)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        print("   🛡️  Sidecar Launched (PID: Independent)")
-    except Exception as e:
-        print(f"   ⚠️  Sidecar Fail: {e}")
+    session_id = boot.result("session")
+    token_counts = boot.result("tokens") or {}
 
     # Disable watchdog
     StateLoader.disable_watchdog()
 
     # Final Summary
+    boot.mark_ready()
     print(f"\n{BOLD}{'─' * 60}{RESET}")
     print(f"{GREEN}{BOLD}⚡ Ready.{RESET} Session: {session_id}")
     print(
@@ -180,6 +202,10 @@ def main():
     # Display Token Budget Gauge
     display_gauge(token_counts)
 
+    # Phase 9: Deferred tasks + timing trace (.agent/state/boot_trace.json)
+    boot.run(deferred=True)
+    boot.write_trace()
+
     return 0
 
 
@@ -0,0 +1,165 @@
+"""
+athena.boot.protocol_index
+==========================
+Precompiled protocol index for the boot-time context loadout.
+
+protocols.json is compiled once into:
+    - entries:  pid -> display fields (name, type, first use case)
+    - tags:     lowercased tag      -> [pid, ...]   (postings)
+    - cases:    lowercased use case -> [pid, ...]   (postings)
+Protocols whose file is missing are dropped at build time.
+
+Scoring keeps the original semantics (a context term scores +1 if it is a
+substring of any tag, +2 if a substring of any use case) but scans the
+deduplicated vocabulary once per term instead of every protocol's lists.
+
+The compiled index is persisted to .agent/state/protocol_index.json and
+keyed by protocols.json (mtime_ns, size) plus its SHA-256: a touched but
+unchanged file revalidates by hash, an edited one rebuilds.
+
+Usage:
+    index, cached = load_protocol_index()
+    loadout = index.loadout("startup session boot")
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from athena.boot.constants import PROJECT_ROOT, PROTOCOLS_JSON
+
+PROTOCOL_INDEX_PATH = PROJECT_ROOT / ".agent" / "state" / "protocol_index.json"
+INDEX_VERSION = 1
+LOADOUT_SIZE = 5
+
+
+class ProtocolIndex:
+    """Term -> protocol postings over context tags and applied use cases."""
+
+    def __init__(self, data: dict):
+        self.entries: dict = data["entries"]
+        self.order: dict = {pid: i for i, pid in enumerate(self.entries)}
+        self.tags: dict = data["tags"]
+        self.cases: dict = data["cases"]
+        self._match = lru_cache(maxsize=512)(self._match_uncached)
+
+    @classmethod
+    def build(cls, protocols_json: Path = PROTOCOLS_JSON) -> dict:
+        """Compile protocols.json into the serializable index payload."""
+        with open(protocols_json, "r") as f:
+            protocols = json.load(f).get("protocols", {})
+
+        entries = {}
+        tags, cases = defaultdict(list), defaultdict(list)
+        for pid, p in protocols.items():
+            protocol_path = p.get("path", "")
+            if protocol_path and not (PROJECT_ROOT / protocol_path).exists():
+                continue
+
+            use_cases = p.get("applied_use_cases", ["General Application"])
+            entries[pid] = {
+                "name": p["name"],
+                "type": p.get("type", "protocol").title(),
+                "trigger": (use_cases or ["General Application"])[0],
+            }
+            for tag in {t.lower() for t in p.get("context_tags", [])}:
+                tags[tag].append(pid)
+            for case in {c.lower() for c in p.get("applied_use_cases", [])}:
+                cases[case].append(pid)
+
+        return {"entries": entries, "tags": dict(tags), "cases": dict(cases)}
+
+    def _match_uncached(self, term: str) -> tuple[frozenset, frozenset]:
+        tag_pids = {pid for tag, pids in self.tags.items() if term in tag for pid in pids}
+        case_pids = {pid for case, pids in self.cases.items() if term in case for pid in pids}
+        return frozenset(tag_pids), frozenset(case_pids)
+
+    def loadout(self, context_clues: str, size: int = LOADOUT_SIZE) -> list:
+        """Top protocols for the context (same ranking as the original scan)."""
+        scores: dict[str, int] = defaultdict(int)
+        for term in context_clues.lower().split():
+            tag_pids, case_pids = self._match(term)
+            for pid in tag_pids:
+                scores[pid] += 1
+            for pid in case_pids:
+                scores[pid] += 2
+
+        # Stable on protocols.json order for equal scores, like the original sort
+        ranked = sorted(scores, key=lambda pid: (-scores[pid], self.order[pid]))
+        loadout = []
+        for pid in ranked[:size]:
+            entry = self.entries[pid]
+            loadout.append(
+                {
+                    "pid": pid,
+                    **entry,
+                    "icon": "🧪" if entry["type"] == "Case_Study" else "📜",
+                }
+            )
+        return loadout
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _write_index(payload: dict, path: Path):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+_loaded: Optional[tuple] = None  # ([path, key], ProtocolIndex) for this process
+
+
+def load_protocol_index(
+    protocols_json: Path = PROTOCOLS_JSON, index_path: Path = PROTOCOL_INDEX_PATH
+) -> tuple[ProtocolIndex, bool]:
+    """
+    The compiled index, rebuilt only when protocols.json changed.
+
+    Returns:
+        (index, cached) — cached is False when the index was (re)built.
+    """
+    global _loaded
+    st = os.stat(protocols_json)
+    key = [st.st_mtime_ns, st.st_size]
+    if _loaded and _loaded[0] == [str(protocols_json), key]:
+        return _loaded[1], True
+
+    try:
+        stored = json.loads(Path(index_path).read_text())
+        if stored.get("version") != INDEX_VERSION:
+            stored = None
+    except (OSError, ValueError):
+        stored = None
+
+    cached = False
+    if stored and stored["key"] == key:
+        cached = True
+    elif stored and stored["sha256"] == _file_sha256(protocols_json):
+        stored["key"] = key  # Touched, not edited
+        _write_index(stored, index_path)
+        cached = True
+    else:
+        stored = {
+            "version": INDEX_VERSION,
+            "key": key,
+            "sha256": _file_sha256(protocols_json),
+            "index": ProtocolIndex.build(protocols_json),
+        }
+        _write_index(stored, index_path)
+
+    index = ProtocolIndex(stored["index"])
+    _loaded = ([str(protocols_json), key], index)
+    return index, cached
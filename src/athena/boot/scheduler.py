@@ -0,0 +1,279 @@
+"""
+athena.boot.scheduler
+=====================
+Dependency-graph (DAG) task runner for the boot sequence.
+
+Each loader step is a BootTask with declared dependencies. The scheduler
+launches every task whose dependencies are satisfied, so independent steps
+overlap, and records per-task wall time.
+
+Steps run on daemon threads while the main thread waits on a queue, so the
+boot watchdog (SIGALRM -> sys.exit in the main thread) still aborts a boot
+with a hung step: run() re-raises and nothing joins the stuck thread. Each
+step's stdout is buffered and printed in dependency order, so parallel
+steps never interleave their output. After the run it computes the
+critical path, the chain of dependencies that bounded total boot time.
+
+The trace is written to .agent/state/boot_trace.json so boot regressions
+are visible:
+
+    {
+      "ready_ms": 812.4,
+      "total_ms": 2310.9,
+      "critical_path": ["integrity", "session", "display"],
+      "tasks": [{"name": "integrity", "start_ms": 0.3, "duration_ms": 4.1, ...}]
+    }
+
+Usage:
+    scheduler = BootScheduler()
+    scheduler.add("integrity", IdentityLoader.verify_semantic_prime, required=True)
+    scheduler.add("session", MemoryLoader.create_session, deps=["integrity"])
+    ok = scheduler.run()
+"""
+
+import io
+import json
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from athena.boot.constants import PROJECT_ROOT
+
+BOOT_TRACE_PATH = PROJECT_ROOT / ".agent" / "state" / "boot_trace.json"
+
+
+@dataclass
+class BootTask:
+    """A single boot step and its timing record."""
+
+    name: str
+    fn: Callable[[], Any]
+    deps: list[str] = field(default_factory=list)
+    required: bool = False  # Failure (False/exception) aborts the boot
+    deferred: bool = False  # Runs after "Ready"
+    status: str = "pending"  # pending | ok | failed | skipped
+    result: Any = None
+    error: Optional[str] = None
+    output: str = ""  # Buffered stdout of the step
+    start: float = 0.0
+    end: float = 0.0
+
+
+class _StepOutput:
+    """sys.stdout stand-in that buffers writes from step threads, one buffer per step."""
+
+    def __init__(self, target):
+        self.target = target
+        self.buffers: dict[int, io.StringIO] = {}  # thread ident -> buffer
+
+    def write(self, text: str) -> int:
+        return self.buffers.get(threading.get_ident(), self.target).write(text)
+
+    def flush(self):
+        self.target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+class BootScheduler:
+    """Runs BootTasks with maximal parallelism subject to their dependencies."""
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self.tasks: dict[str, BootTask] = {}
+        self.origin = time.perf_counter()
+        self.ready_at: Optional[float] = None
+        self.aborted = False
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        deps: Optional[list[str]] = None,
+        required: bool = False,
+        deferred: bool = False,
+    ) -> BootTask:
+        task = BootTask(
+            name=name,
+            fn=fn,
+            deps=list(deps or []),
+            required=required,
+            deferred=deferred,
+        )
+        self.tasks[name] = task
+        return task
+
+    def result(self, name: str) -> Any:
+        return self.tasks[name].result
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    def _order(self, batch: dict[str, BootTask]) -> list[str]:
+        """Topological order of batch, ties broken by insertion order."""
+        order: list[str] = []
+        placed: set[str] = set()
+        while len(order) < len(batch):
+            progressed = False
+            for name, task in batch.items():
+                if name not in placed and all(d in placed or d not in batch for d in task.deps):
+                    order.append(name)
+                    placed.add(name)
+                    progressed = True
+            if not progressed:  # Cycle: the tasks never launch and end up skipped
+                order.extend(n for n in batch if n not in placed)
+                break
+        return order
+
+    def _worker(
+        self, task: BootTask, buffer: io.StringIO, out: _StepOutput, finished: queue.Queue
+    ):
+        out.buffers[threading.get_ident()] = buffer
+        try:
+            self._execute(task)
+        finally:
+            del out.buffers[threading.get_ident()]
+            task.output = buffer.getvalue()
+            finished.put(task)
+
+    def _execute(self, task: BootTask) -> BootTask:
+        task.start = time.perf_counter()
+        try:
+            task.result = task.fn()
+            task.status = "failed" if (task.required and task.result is False) else "ok"
+        except (Exception, SystemExit) as e:  # Loaders may sys.exit() on failure
+            task.status = "failed"
+            task.error = f"{type(e).__name__}: {e}"
+        task.end = time.perf_counter()
+        return task
+
+    def run(self, deferred: bool = False) -> bool:
+        """
+        Run the (non-)deferred tasks. Returns False if a required task failed.
+        Dependents of a failed task are skipped; a required failure stops
+        new launches.
+        """
+        batch = {n: t for n, t in self.tasks.items() if t.deferred == deferred}
+        for task in batch.values():
+            unknown = [d for d in task.deps if d not in self.tasks]
+            if unknown:
+                raise ValueError(f"Boot task '{task.name}' has unknown deps: {unknown}")
+
+        order = self._order(batch)
+        printed = 0  # Prefix of `order` whose output has been emitted
+        done: set[str] = {n for n, t in self.tasks.items() if t.status != "pending"}
+        running = 0
+        buffers: dict[str, io.StringIO] = {}
+        finished: queue.Queue = queue.Queue()
+        out = _StepOutput(sys.stdout)
+        sys.stdout = out
+        try:
+            while True:
+                if not self.aborted:
+                    for name in order:
+                        task = batch[name]
+                        if name in done or name in buffers or running >= self.max_workers:
+                            continue
+                        dep_states = [self.tasks[d].status for d in task.deps]
+                        if any(s in ("failed", "skipped") for s in dep_states):
+                            task.status = "skipped"
+                            done.add(name)
+                        elif all(d in done for d in task.deps):
+                            buffers[name] = io.StringIO()
+                            threading.Thread(
+                                target=self._worker,
+                                args=(task, buffers[name], out, finished),
+                                name=f"boot-{name}",
+                                daemon=True,
+                            ).start()
+                            running += 1
+
+                while printed < len(order) and order[printed] in done:
+                    out.target.write(batch[order[printed]].output)
+                    printed += 1
+                out.target.flush()
+
+                if not running:
+                    break
+
+                # Interruptible wait: the watchdog's SystemExit surfaces here
+                task = finished.get()
+                running -= 1
+                done.add(task.name)
+                if task.status == "failed" and task.required:
+                    self.aborted = True
+        finally:
+            sys.stdout = out.target
+            for name in order[printed:]:  # Aborted: still show what steps printed
+                if name in buffers:
+                    sys.stdout.write(buffers[name].getvalue())
+            sys.stdout.flush()
+
+        for task in batch.values():
+            if task.status == "pending":
+                task.status = "skipped"
+        return not self.aborted
+
+    def mark_ready(self):
+        self.ready_at = time.perf_counter()
+
+    # -------------------------------------------------------------------------
+    # Trace
+    # -------------------------------------------------------------------------
+
+    def _ms(self, t: float) -> float:
+        return round((t - self.origin) * 1000, 1)
+
+    def critical_path(self) -> list[str]:
+        """Walk back from the last task to finish via its latest-finishing dependency."""
+        ran = [t for t in self.tasks.values() if t.end]
+        if not ran:
+            return []
+        path = []
+        task = max(ran, key=lambda t: t.end)
+        while task:
+            path.append(task.name)
+            deps = [self.tasks[d] for d in task.deps if self.tasks[d].end]
+            task = max(deps, key=lambda t: t.end) if deps else None
+        return path[::-1]
+
+    def trace(self) -> dict:
+        ran = [t for t in self.tasks.values() if t.end]
+        path = self.critical_path()
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "ready_ms": self._ms(self.ready_at) if self.ready_at else None,
+            "total_ms": self._ms(max((t.end for t in ran), default=self.origin)),
+            "critical_path": path,
+            "critical_path_ms": round(
+                sum((self.tasks[n].end - self.tasks[n].start) * 1000 for n in path), 1
+            ),
+            "tasks": [
+                {
+                    "name": t.name,
+                    "deps": t.deps,
+                    "deferred": t.deferred,
+                    "status": t.status,
+                    "start_ms": self._ms(t.start) if t.start else None,
+                    "duration_ms": round((t.end - t.start) * 1000, 1) if t.end else None,
+                    **({"error": t.error} if t.error else {}),
+                }
+                for t in sorted(self.tasks.values(), key=lambda t: t.start or float("inf"))
+            ],
+        }
+
+    def write_trace(self, path: Path = BOOT_TRACE_PATH) -> Optional[Path]:
+        """Persist the machine-readable timing trace (best effort)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.trace(), indent=2))
+            return path
+        except Exception:
+            return None
@@ -123,6 +123,9 @@ def run_shutdown(project_root: Optional[Path] = None) -> bool:
             print(f"   ⚠️  Observation report skipped: {e}")
 
         # Optional: Trigger Supabase sync if configured
+        from athena import load_env
+
+        load_env()
         supabase_url = os.getenv("SUPABASE_URL")
         if supabase_url:
             print(
@@ -0,0 +1,141 @@
+"""
+athena.boot.snapshot
+====================
+Boot snapshot cache: skip unchanged boot work.
+
+Each derived boot output (token counts, context summaries, learnings
+snapshot, identity verification) is stored together with the stat
+fingerprint of the files it was derived from. A fingerprint is
+(mtime_ns, size, inode, ctime_ns) per input, so a warm boot on an unchanged
+workspace is one stat pass plus one read of boot_snapshot.json.
+
+ctime is included because it cannot be set from userspace: a file rewritten
+with its mtime forged back still invalidates its entries (important for the
+Core_Identity.md integrity result).
+
+Usage:
+    snapshot = get_boot_snapshot()
+    counts = snapshot.cached("tokens", BOOT_FILES.values(), compute_counts)
+    ...
+    snapshot.save()  # once, at the end of boot
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from athena.boot.constants import PROJECT_ROOT
+
+BOOT_SNAPSHOT_PATH = PROJECT_ROOT / ".agent" / "state" / "boot_snapshot.json"
+SNAPSHOT_VERSION = 1  # Bump when the shape of any cached output changes
+
+MISS = object()
+
+
+def stat_key(path: Path) -> Optional[list]:
+    """(mtime_ns, size, inode, ctime_ns) for a path, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns]
+
+
+def fingerprint(inputs: Iterable[Path]) -> list:
+    return [[str(p), stat_key(p)] for p in inputs]
+
+
+class BootSnapshot:
+    """Stat-keyed store for derived boot outputs, persisted as one JSON file."""
+
+    def __init__(self, path: Path = BOOT_SNAPSHOT_PATH):
+        self.path = Path(path)
+        self._entries: Optional[dict] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get("version") == SNAPSHOT_VERSION:
+                    self._entries = data.get("entries", {})
+            except Exception:
+                pass
+            if self._entries is None:
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str, inputs: Iterable[Path]) -> Any:
+        """Cached value for key if its inputs are unchanged, else the MISS sentinel."""
+        fp = fingerprint(inputs)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None and entry.get("inputs") == fp:
+                self.hits += 1
+                return entry["value"]
+            self.misses += 1
+        return MISS
+
+    def put(self, key: str, inputs: Iterable[Path], value: Any, fp: list = None):
+        with self._lock:
+            self._load()[key] = {
+                "inputs": fp if fp is not None else fingerprint(inputs),
+                "value": value,
+            }
+            self._dirty = True
+
+    def cached(self, key: str, inputs: Iterable[Path], compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, or compute and store it."""
+        inputs = list(inputs)
+        value = self.get(key, inputs)
+        if value is not MISS:
+            return value
+        # Fingerprint before computing so a file edited mid-compute is re-read next boot
+        fp = fingerprint(inputs)
+        value = compute()
+        self.put(key, inputs, value, fp=fp)
+        return value
+
+    def invalidate(self, key: str = None):
+        with self._lock:
+            if key is None:
+                self._entries = {}
+            else:
+                self._load().pop(key, None)
+            self._dirty = True
+
+    def save(self) -> bool:
+        """Atomically persist the snapshot if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = json.dumps(
+                {"version": SNAPSHOT_VERSION, "entries": self._entries or {}}
+            )
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    f.write(payload)
+                os.replace(tmp, self.path)
+                self._dirty = False
+                return True
+            except Exception:
+                return False
+
+
+_snapshot: Optional[BootSnapshot] = None
+
+
+def get_boot_snapshot() -> BootSnapshot:
+    """Get the process-wide boot snapshot."""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = BootSnapshot()
+    return _snapshot
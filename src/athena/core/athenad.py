@@ -3,34 +3,48 @@ Athena Daemon (athenad)
 =======================
 Role: The Active OS Kernel.
 Responsibilities:
-  1.  File System Watcher (Polling) -> Updates SQLite Metadata
+  1.  File System Watcher (Polling) -> Updates the shared local index
+      (athena.memory.local_index: files, tags, links, FTS content)
   2.  Background Worker (Threading) -> Vectors Content into GraphRAG
   3.  Health Monitor -> Self-healing
 
 Architecture:
-  [Main Thread] --(Queue)--> [Indexer Thread]
-       ^                          |
-       | (File Change)            v
-  [File System] <-------- [GraphRAG Store]
+  [Main Thread] --(Dedup Queue)--> [Indexer Thread] --(JSON pipe)--> [LightRAG Worker]
+       ^                                                                  |
+       | (File Change)                                                    v
+  [File System] <------------------------------------------------ [GraphRAG Store]
 """
 
 import os
+import json
 import time
 import sqlite3
-import hashlib
-import re
+import select
 import sys
 import threading
-import queue
 import logging
 import logging.handlers
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
 
+# Fix sys.path for SDK access (athenad is launched as a script)
+SDK_PATH = Path(__file__).resolve().parents[2]
+if str(SDK_PATH) not in sys.path:
+    sys.path.insert(0, str(SDK_PATH))
+
+from athena.core.supervisor import claim, publish_stats  # noqa: E402
+from athena.memory.local_index import (  # noqa: E402
+    LOCAL_INDEX_PATH,
+    IndexRecord,
+    LocalIndex,
+    build_record,
+    file_checksum,
+)
+
 # --- CONFIGURATION ---
 PROJECT_ROOT = Path(__file__).resolve().parents[3]  # src/athena/core -> ROOT
-DB_PATH = PROJECT_ROOT / ".agent" / "inputs" / "athena.db"
-SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
+DB_PATH = LOCAL_INDEX_PATH  # Shared with search, heartbeat, doctor and auditors
 
 # Watch Configuration
 WATCH_DIRS = [
@@ -54,6 +68,16 @@ EXCLUDED_PATTERNS = [
 ]
 
 POLL_INTERVAL = 5
+BATCH_SIZE = 500  # Files per metadata transaction
+
+# Graph Indexer (persistent lightrag_wrapper.py --serve worker)
+GRAPH_BATCH_SIZE = 8  # Files per worker round-trip
+GRAPH_BATCH_LINGER = 2.0  # Seconds to wait for a burst to coalesce
+GRAPH_MAX_PARALLEL = 2  # Concurrent inserts inside the worker
+GRAPH_FILE_TIMEOUT = 120  # Seconds allowed per file in a batch
+GRAPH_RESPAWN_BACKOFF = 2.0  # Seconds before the first respawn, doubled per failure
+GRAPH_RESPAWN_BACKOFF_MAX = 300.0
+GRAPH_MAX_FAILURES = 8  # Consecutive worker failures before giving up
 LOG_LEVEL = logging.INFO
 
 # --- LOGGING SETUP (Rotating: 5MB max, 3 backups) ---
@@ -76,100 +100,222 @@ logging.basicConfig(
 # --- UTILITIES ---
 def calculate_checksum(filepath):
     """Fast checksum of file stats to detect changes."""
-    try:
-        stats = os.stat(filepath)
-        return f"{stats.st_size}-{stats.st_mtime}"
-    except FileNotFoundError:
-        return None
+    return file_checksum(filepath)
 
 
-def extract_tags(filepath):
-    """Extract tags from Markdown."""
-    tags = []
-    try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-            tags = re.findall(r"#([\w-]+)", content)
-    except Exception as e:
-        logging.warning(f"Failed to read tags from {filepath}: {e}")
-    return list(set(tags))
+# --- WORKER: BACKGROUND INDEXER ---
+class GraphIndexQueue:
+    """
+    Deduplicating FIFO of file paths awaiting graph indexing.
+    Repeated edits to a path while it is queued collapse into one job; the
+    worker reads the file at index time, so the latest content always wins.
+    """
+
+    def __init__(self):
+        self._items: "OrderedDict[str, float]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, filepath):
+        with self._cond:
+            if filepath is None:
+                self._closed = True
+            elif filepath not in self._items:
+                self._items[filepath] = time.monotonic()
+            self._cond.notify()
+
+    def get_batch(self, max_items, linger=0.0):
+        """
+        Block until work arrives, then linger briefly so bursts coalesce.
+        Returns a list of (filepath, enqueued_at); empty once closed and drained.
+        """
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if linger and not self._closed and len(self._items) < max_items:
+                self._cond.wait(linger)
+            batch = []
+            while self._items and len(batch) < max_items:
+                batch.append(self._items.popitem(last=False))
+            return batch
+
+    def qsize(self):
+        with self._cond:
+            return len(self._items)
 
 
-# --- WORKER: BACKGROUND INDEXER ---
 class BackgroundIndexer(threading.Thread):
+    """
+    Feeds queued files to one long-lived lightrag_wrapper.py --serve process.
+    The model loads once; jobs travel as JSON lines over the worker's stdin,
+    so file content never touches argv.
+    """
+
     def __init__(self, task_queue):
         super().__init__(daemon=True)
         self.task_queue = task_queue
         self.wrapper_path = PROJECT_ROOT / ".agent" / "scripts" / "lightrag_wrapper.py"
+        self._worker = None
+        self._failures = 0  # Consecutive worker failures
+        self._respawn_at = 0.0
+        self._stats = {
+            "indexed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "latency_sum": 0.0,
+            "spawns": 0,  # Graph workers started, first one included
+        }
 
     def run(self):
         logging.info("🧠 BackgroundIndexer: Online (Waiting for tasks...)")
         while True:
             try:
-                filepath = self.task_queue.get()
-                if filepath is None:
+                batch = self.task_queue.get_batch(GRAPH_BATCH_SIZE, GRAPH_BATCH_LINGER)
+                if not batch:
                     break
-
-                self.index_file_in_graph(filepath)
-                self.task_queue.task_done()
+                self.index_batch(batch)
             except Exception as e:
                 logging.error(f"Indexer Worker Crash: {e}")
+        self.stop_worker()
+
+    def _record_failure(self):
+        """Count a worker failure and schedule the next respawn with backoff."""
+        self._failures += 1
+        self.stop_worker()
+        if self._failures >= GRAPH_MAX_FAILURES:
+            logging.error(
+                f"🛑 Graph worker failed {self._failures} times in a row; "
+                "graph indexing disabled until athenad restarts"
+            )
+            return
+        delay = min(GRAPH_RESPAWN_BACKOFF * 2 ** (self._failures - 1), GRAPH_RESPAWN_BACKOFF_MAX)
+        self._respawn_at = time.monotonic() + delay
+        logging.warning(f"Graph worker failure #{self._failures}; next respawn in {delay:.0f}s")
+
+    def _ensure_worker(self):
+        """Spawn (or respawn, with backoff) the persistent graph worker."""
+        if self._worker and self._worker.poll() is None:
+            return self._worker
+        if self._worker is not None:
+            self._record_failure()  # Died between batches (e.g. crashed at startup)
+
+        if self._failures >= GRAPH_MAX_FAILURES or time.monotonic() < self._respawn_at:
+            return None
 
-    def index_file_in_graph(self, filepath):
-        """Calls lightrag_wrapper.py to index the file."""
         if not self.wrapper_path.exists():
             logging.error(f"Missing LightRAG wrapper: {self.wrapper_path}")
+            return None
+
+        cmd = [
+            sys.executable,
+            str(self.wrapper_path),
+            "--serve",
+            "--max-parallel",
+            str(GRAPH_MAX_PARALLEL),
+        ]
+        self._worker = subprocess.Popen(
+            cmd,
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._stats["spawns"] += 1
+        logging.info(f"🕸️  Graph worker started (PID: {self._worker.pid})")
+        return self._worker
+
+    def stop_worker(self):
+        if self._worker and self._worker.poll() is None:
+            self._worker.kill()
+            self._worker.wait()
+        self._worker = None
+
+    def index_batch(self, batch):
+        """Send one batch to the worker and record per-file latency."""
+        worker = self._ensure_worker()
+        if worker is None:
+            self._stats["failed"] += len(batch)
             return
 
+        paths = [filepath for filepath, _ in batch]
+        logging.info(
+            f"🕸️  Graph Vectorizing: {len(paths)} file(s) "
+            f"(queue depth: {self.task_queue.qsize()})"
+        )
+
         try:
-            # Read content to verify it's valid
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-                if len(content) < 50:  # Skip empty/stub files
-                    return
-
-            logging.info(f"🕸️  Graph Vectorizing: {Path(filepath).name}")
-
-            # Call wrapper via subprocess to ensure isolation
-            # usage: python3 lightrag_wrapper.py --insert "CONTENT"
-            # Note: This is a bit inefficient (reloads model every time).
-            # Optimization: In V2, import LightRAG directly. For V1 (Robustness), isolation is better.
-
-            cmd = [
-                sys.executable,
-                str(self.wrapper_path),
-                "--insert",
-                f"File: {filepath}\nContent:\n{content}",
-            ]
-
-            subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                check=True,
-                timeout=120,
+            worker.stdin.write(json.dumps({"paths": paths}) + "\n")
+            worker.stdin.flush()
+            timeout = GRAPH_FILE_TIMEOUT * len(paths)
+            ready, _, _ = select.select([worker.stdout], [], [], timeout)
+            if not ready:
+                raise TimeoutError(f"no reply within {timeout}s")
+            line = worker.stdout.readline()
+            if not line:
+                raise RuntimeError("graph worker exited")
+            results = json.loads(line).get("results", [])
+        except Exception as e:
+            logging.error(f"Graph Indexing Failed: {e}")
+            self._stats["failed"] += len(paths)
+            self._record_failure()
+            return
+
+        self._failures = 0
+
+        enqueued_at = dict(batch)
+        done_at = time.monotonic()
+        for result in results:
+            filepath = result.get("path")
+            status = result.get("status")
+            if status == "skipped":
+                self._stats["skipped"] += 1
+                continue
+            if status != "ok":
+                self._stats["failed"] += 1
+                logging.error(f"Graph Indexing Error: {filepath}: {result.get('error')}")
+                continue
+
+            latency = done_at - enqueued_at.get(filepath, done_at)
+            self._stats["indexed"] += 1
+            self._stats["latency_sum"] += latency
+            logging.info(
+                f"✅ Graph Updated: {Path(filepath).name} "
+                f"(index {result.get('seconds', 0):.2f}s, end-to-end {latency:.2f}s)"
             )
-            logging.info(f"✅ Graph Updated: {Path(filepath).name}")
 
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Graph Indexing Failed: {e.stderr.decode()}")
-        except Exception as e:
-            logging.error(f"Graph Indexing Error: {e}")
+    @property
+    def stats(self):
+        indexed = self._stats["indexed"]
+        return {
+            "queue_depth": self.task_queue.qsize(),
+            "indexed": indexed,
+            "skipped": self._stats["skipped"],
+            "failed": self._stats["failed"],
+            "avg_latency_s": (
+                round(self._stats["latency_sum"] / indexed, 3) if indexed else 0.0
+            ),
+            "worker_pid": self._worker.pid if self._worker else None,
+            "worker_respawns": max(0, self._stats["spawns"] - 1),
+            "worker_failures": self._failures,
+        }
 
 
 # --- DAEMON CORE ---
 class AthenaDaemon:
-    def __init__(self):
-        self.indexer_queue = queue.Queue()
+    def __init__(self, index=None):
+        self.indexer_queue = GraphIndexQueue()
         self.indexer_thread = BackgroundIndexer(self.indexer_queue)
-        self._conn = None
+        # Shared local index (files, tags, links, FTS). It keeps in-memory
+        # mirrors so unchanged files cost a stat and a dict lookup.
+        self.index = index or LocalIndex(DB_PATH)
+        self._pending: list[IndexRecord] = []
 
     def start(self):
         logging.info("🛡️  Athena Daemon (Titanium) Starting...")
 
         # 1. Initialize DB
-        if not DB_PATH.parent.exists():
-            DB_PATH.parent.mkdir(parents=True)
         self.init_db()
 
         # 2. Start Worker
@@ -182,22 +328,14 @@ class AthenaDaemon:
         except KeyboardInterrupt:
             logging.info("Stopping...")
 
-    def get_db_connection(self):
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
-
     def init_db(self):
-        if not DB_PATH.exists() and SCHEMA_PATH.exists():
-            conn = self.get_db_connection()
-            with open(SCHEMA_PATH, "r") as f:
-                conn.executescript(f.read())
-            conn.commit()
-            conn.close()
+        """Open the shared index (creating/migrating the schema) and warm mirrors."""
+        is_new = not self.index.exists()
+        self.index.load_state()
+        if is_new:
             logging.info("Initialized Metadata DB.")
 
     def watch_loop(self):
-        conn = self.get_db_connection()
         while True:
             changes = 0
             for watch_dir in WATCH_DIRS:
@@ -216,49 +354,66 @@ class AthenaDaemon:
                         if any(p in filepath for p in EXCLUDED_PATTERNS):
                             continue
 
-                        if self.check_and_update(conn, filepath):
+                        if self.check_and_update(filepath):
                             changes += 1
-                            # TRIGGER: Add to Indexer Queue
-                            self.indexer_queue.put(filepath)
 
+            self.flush_batch()
             if changes > 0:
-                conn.commit()
-                logging.info(f"Processed {changes} file updates.")
+                logging.info(
+                    f"Processed {changes} file updates. "
+                    f"(graph queue depth: {self.indexer_queue.qsize()})"
+                )
+            publish_stats(self.indexer_thread.stats)  # Served by the supervisor
 
             time.sleep(POLL_INTERVAL)
 
-    def check_and_update(self, conn, filepath):
-        """Returns True if file updated."""
+    def check_and_update(self, filepath):
+        """Returns True if file updated. Writes are staged and flushed in batches."""
         checksum = calculate_checksum(filepath)
-        if not checksum:
+        if not checksum or self.index.is_current(filepath, checksum):
             return False
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT checksum FROM files WHERE path = ?", (filepath,))
-        row = cursor.fetchone()
+        record = build_record(filepath, checksum)
+        if record is None:
+            return False
 
-        if not row or row["checksum"] != checksum:
-            # Index Metadata
-            cursor.execute(
-                "INSERT OR REPLACE INTO files (path, last_modified, checksum, type) VALUES (?, ?, ?, ?)",
-                (filepath, time.time(), checksum, "text/markdown"),
-            )
+        self._pending.append(record)
+        if len(self._pending) >= BATCH_SIZE:
+            self.flush_batch()
+        return True
 
-            # Index Tags
-            tags = extract_tags(filepath)
-            cursor.execute("DELETE FROM file_tags WHERE file_path = ?", (filepath,))
-            for tag in tags:
-                cursor.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag,))
-                cursor.execute("SELECT id FROM tags WHERE name = ?", (tag,))
-                tag_id = cursor.fetchone()[0]
-                cursor.execute(
-                    "INSERT OR IGNORE INTO file_tags (file_path, tag_id) VALUES (?, ?)",
-                    (filepath, tag_id),
-                )
-            return True
-        return False
+    def flush_batch(self):
+        """Write all staged records in one transaction, then queue graph indexing."""
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, []
+        try:
+            written = self.index.write_batch(batch)
+        except sqlite3.Error as e:
+            # Mirrors are untouched, so the same files are retried next poll.
+            logging.error(f"Metadata batch failed ({len(batch)} files): {e}")
+            return 0
+
+        for record in batch:
+            self.indexer_queue.put(record.path)
+        return written
 
 
 if __name__ == "__main__":
+    # Under the supervisor the runner holds the single-instance lock and
+    # serves our published stats; a direct launch claims it itself (and
+    # exits if one is already up), serving the indexer stats directly.
     daemon = AthenaDaemon()
-    daemon.start()
+    handle = None
+    if not os.environ.get("ATHENA_SUPERVISED"):
+        handle = claim("athenad", lambda: {"stats": daemon.indexer_thread.stats})
+        if handle is None:
+            logging.info("athenad is already running; exiting.")
+            sys.exit(0)
+
+    try:
+        daemon.start()
+    finally:
+        if handle is not None:
+            handle.release()
@@ -28,9 +28,10 @@ Usage:
 import hashlib
 import json
 import math
+import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 from athena.core.config import AGENT_DIR
@@ -59,6 +60,7 @@ class QueryCache:
         self.max_size = max_size
         self._cache_file = cache_dir / "search_cache.json"
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.RLock()  # Prewarm and MCP calls share the cache
         self._load_from_disk()
 
     def _hash_key(self, query: str) -> str:
@@ -77,24 +79,46 @@ class QueryCache:
                 if now - entry_data["timestamp"] < self.ttl_seconds:
                     if "embedding" not in entry_data:
                         entry_data["embedding"] = None
+                    entry_data["value"] = self._decode(entry_data["value"])
                     self._cache[key] = CacheEntry(**entry_data)
         except Exception:
             pass
 
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        """SearchResult lists are stored as tagged dicts so they survive JSON."""
+        from athena.core.models import SearchResult
+
+        if isinstance(value, list) and value and isinstance(value[0], SearchResult):
+            return {"__search_results__": [asdict(r) for r in value]}
+        return value
+
+    @staticmethod
+    def _decode(value: Any) -> Any:
+        if isinstance(value, dict) and "__search_results__" in value:
+            from athena.core.models import SearchResult
+
+            return [SearchResult(**r) for r in value["__search_results__"]]
+        return value
+
     def _save_to_disk(self):
         """Persist cache to disk (atomic write)."""
         try:
-            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                k: {
-                    "value": e.value,
-                    "timestamp": e.timestamp,
-                    "hits": e.hits,
-                    "embedding": e.embedding,
+            with self._lock:
+                data = {
+                    k: {
+                        "value": self._encode(e.value),
+                        "timestamp": e.timestamp,
+                        "hits": e.hits,
+                        "embedding": e.embedding,
+                    }
+                    for k, e in self._cache.items()
                 }
-                for k, e in self._cache.items()
-            }
-            self._cache_file.write_text(json.dumps(data))
+                payload = json.dumps(data)
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_text(payload)
+            tmp.replace(self._cache_file)
         except Exception:
             pass
 
@@ -106,21 +130,22 @@ class QueryCache:
         """Get cached result if exists and not expired (exact match)."""
         key = self._hash_key(query)
 
-        if key not in self._cache:
-            return None
+        with self._lock:
+            if key not in self._cache:
+                return None
 
-        entry = self._cache[key]
-        now = time.time()
+            entry = self._cache[key]
+            now = time.time()
 
-        if now - entry.timestamp > self.ttl_seconds:
-            del self._cache[key]
-            self._save_to_disk()
-            return None
+            if now - entry.timestamp > self.ttl_seconds:
+                del self._cache[key]
+                self._save_to_disk()
+                return None
 
-        entry.hits += 1
-        self._cache.move_to_end(key)  # LRU update
-        self._save_to_disk()
-        return entry.value
+            entry.hits += 1
+            self._cache.move_to_end(key)  # LRU update
+            self._save_to_disk()
+            return entry.value
 
     # -------------------------------------------------------------------------
     # Semantic Matching
@@ -159,19 +184,20 @@ class QueryCache:
         best_entry = None
         best_key = None
 
-        for key, entry in self._cache.items():
-            if entry.embedding:
-                sim = self._cosine_similarity(target_embedding, entry.embedding)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_entry = entry
-                    best_key = key
-
-        if best_sim >= threshold and best_entry and best_key:
-            best_entry.hits += 1
-            self._cache.move_to_end(best_key)
-            self._save_to_disk()
-            return best_entry.value
+        with self._lock:
+            for key, entry in self._cache.items():
+                if entry.embedding:
+                    sim = self._cosine_similarity(target_embedding, entry.embedding)
+                    if sim > best_sim:
+                        best_sim = sim
+                        best_entry = entry
+                        best_key = key
+
+            if best_sim >= threshold and best_entry and best_key:
+                best_entry.hits += 1
+                self._cache.move_to_end(best_key)
+                self._save_to_disk()
+                return best_entry.value
 
         return None
 
@@ -183,22 +209,25 @@ class QueryCache:
         """Cache a result with optional embedding for semantic retrieval."""
         key = self._hash_key(query)
 
-        # Evict oldest if at capacity (LRU)
-        while len(self._cache) >= self.max_size:
-            self._cache.popitem(last=False)
-
-        self._cache[key] = CacheEntry(
-            value=value,
-            timestamp=time.time(),
-            hits=0,
-            embedding=embedding,
-        )
-        self._save_to_disk()
+        with self._lock:
+            self._cache.pop(key, None)  # Re-set moves the key to the MRU end
+            # Evict oldest if at capacity (LRU)
+            while len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)
+
+            self._cache[key] = CacheEntry(
+                value=value,
+                timestamp=time.time(),
+                hits=0,
+                embedding=embedding,
+            )
+            self._save_to_disk()
 
     def invalidate(self) -> None:
         """Invalidate all cached results (call when underlying data changes)."""
-        self._cache.clear()
-        self._save_to_disk()
+        with self._lock:
+            self._cache.clear()
+            self._save_to_disk()
 
     def stats(self) -> dict:
         """Get cache statistics for monitoring."""
@@ -215,11 +244,14 @@ class QueryCache:
 
 # Singleton Instance
 _search_cache: QueryCache | None = None
+_search_cache_lock = threading.Lock()
 
 
 def get_search_cache() -> QueryCache:
-    """Singleton accessor for the search cache."""
+    """Singleton accessor for the search cache (safe under concurrent first use)."""
     global _search_cache
     if _search_cache is None:
-        _search_cache = QueryCache(cache_dir=AGENT_DIR / "state")
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = QueryCache(cache_dir=AGENT_DIR / "state")
     return _search_cache
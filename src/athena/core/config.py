@@ -7,7 +7,6 @@ Centralized configuration and path discovery.
 
 from pathlib import Path
 from typing import Optional
-import os
 
 
 # Global Cache for PROJECT_ROOT
@@ -31,7 +30,9 @@ def get_project_root() -> Path:
             return parent
 
     # Fallback to current environment variable or CWD
-    root = os.getenv("ATHENA_ROOT")
+    from athena import getenv
+
+    root = getenv("ATHENA_ROOT")
     if root:
         _PROJECT_ROOT_CACHE = Path(root)
         return _PROJECT_ROOT_CACHE
@@ -104,24 +105,8 @@ CANONICAL_PATH = CONTEXT_DIR / "CANONICAL.md"
 def get_current_session_log() -> Optional[Path]:
     """
     Find the most recent session log file (pattern: YYYY-MM-DD-session-XX.md).
+    Served from the session catalog (no directory scan).
     """
-    if not SESSIONS_DIR.exists():
-        return None
-
-    import re
-
-    pattern = re.compile(r"(\d{4}-\d{2}-\d{2})-session-(\d{2,3})\.md")
-    session_files = []
-
-    for f in SESSIONS_DIR.glob("*.md"):
-        match = pattern.match(f.name)
-        if match:
-            date_str, session_num = match.groups()
-            session_files.append((date_str, int(session_num), f))
-
-    if not session_files:
-        return None
+    from athena.core.session_catalog import get_session_catalog
 
-    # Sort by date then session number descending
-    session_files.sort(key=lambda x: (x[0], x[1]), reverse=True)
-    return session_files[0][2]
+    return get_session_catalog().latest_path()
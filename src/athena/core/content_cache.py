@@ -0,0 +1,195 @@
+"""
+athena.core.content_cache
+=========================
+Shared in-process file content cache and page-cache prefetch.
+
+    - ContentCache: path → text, validated by (mtime_ns, size) on every read,
+      LRU-bounded by total characters. Search collectors, context summaries
+      and session recall read through it, so files warmed at boot are served
+      from memory.
+    - advise_willneed / prefetch_pages: ask the kernel to pull files into
+      the OS page cache (posix_fadvise WILLNEED) without decoding them.
+    - Access telemetry: every cached read bumps a per-file counter, flushed
+      at exit to .athena/file_access.json. update_hot_manifest.py ranks the
+      hot set by it.
+
+Usage:
+    from athena.core.content_cache import get_content_cache
+
+    text = get_content_cache().read_text(path)
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from athena.core.config import PROJECT_ROOT
+
+ACCESS_LOG_PATH = PROJECT_ROOT / ".athena" / "file_access.json"
+MAX_CACHE_CHARS = 16_000_000  # ~16MB of text across all entries
+MAX_ENTRY_BYTES = 1_000_000  # Larger files are read through, not cached
+READAHEAD_BLOCK = 1 << 20  # Fallback readahead block size
+
+
+def advise_willneed(path: Path) -> bool:
+    """
+    Hint the kernel to read a file into the page cache.
+
+    Uses posix_fadvise(WILLNEED) where available (Linux). Elsewhere the file
+    is read in raw blocks into a reusable buffer: no decode, no copies kept.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            buf = bytearray(READAHEAD_BLOCK)
+            with os.fdopen(os.dup(fd), "rb", buffering=0) as f:
+                while f.readinto(buf):
+                    pass
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def prefetch_pages(paths: Iterable[Path], max_workers: int = 8) -> int:
+    """Issue page-cache prefetch for all paths in parallel. Returns count advised."""
+    paths = list(paths)
+    if not paths:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return sum(executor.map(advise_willneed, paths))
+
+
+class ContentCache:
+    """Thread-safe LRU of decoded file contents keyed by path, validated by mtime/size."""
+
+    def __init__(self, max_chars: int = MAX_CACHE_CHARS):
+        self.max_chars = max_chars
+        self._entries: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self._access: Counter = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def read_text(self, path: Path, record: bool = True) -> str:
+        """
+        Drop-in for Path.read_text(encoding="utf-8"); raises OSError likewise.
+
+        Args:
+            record: Count this read in the access telemetry (off for warming).
+        """
+        path = Path(path)
+        st = path.stat()
+        key = str(path)
+        with self._lock:
+            if record:
+                self._access[key] += 1
+            entry = self._entries.get(key)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        text = path.read_text(encoding="utf-8")
+        if st.st_size <= MAX_ENTRY_BYTES:
+            self._store(key, st.st_mtime_ns, st.st_size, text)
+        return text
+
+    def _store(self, key: str, mtime_ns: int, size: int, text: str):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._chars -= len(old[2])
+            self._entries[key] = (mtime_ns, size, text)
+            self._chars += len(text)
+            while self._chars > self.max_chars and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted[2])
+
+    def warm(self, paths: Iterable[Path], max_workers: int = 8) -> int:
+        """Load files into the cache in parallel. Returns the number loaded."""
+
+        def load(p: Path) -> bool:
+            try:
+                self.read_text(p, record=False)
+                return True
+            except (OSError, UnicodeDecodeError):
+                return False
+
+        paths = list(paths)
+        if not paths:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            return sum(executor.map(load, paths))
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "chars": self._chars,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def flush_access_log(self, path: Path = ACCESS_LOG_PATH) -> bool:
+        """Merge this process's access counts into the on-disk telemetry."""
+        with self._lock:
+            counts, self._access = self._access, Counter()
+        if not counts:
+            return False
+        try:
+            data = json.loads(path.read_text()) if path.exists() else {}
+        except Exception:
+            data = {}
+
+        now = time.time()
+        for key, n in counts.items():
+            try:
+                rel = str(Path(key).resolve().relative_to(PROJECT_ROOT))
+            except ValueError:
+                continue  # Only workspace files feed the hot manifest
+            entry = data.setdefault(rel, {"count": 0, "last": 0})
+            entry["count"] += n
+            entry["last"] = now
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+            return True
+        except Exception:
+            return False
+
+
+_content_cache: Optional[ContentCache] = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> ContentCache:
+    """Get the process-wide content cache (access counts flush at exit)."""
+    global _content_cache
+    if _content_cache is None:
+        with _content_cache_lock:
+            if _content_cache is None:
+                _content_cache = ContentCache()
+                atexit.register(_content_cache.flush_access_log)
+    return _content_cache
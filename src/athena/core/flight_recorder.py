@@ -3,17 +3,274 @@ athena.core.flight_recorder
 ===========================
 Immutable Action Log (The Black Box).
 Records every high-stakes tool call (Write, Delete, Git) for forensic audit.
+
+Entries are serialized on the caller's thread (a snapshot of params at
+call time) and handed to a background writer over a bounded queue; a full
+queue blocks the caller rather than dropping an entry. The writer
+group-commits whatever is queued in one write, fsyncs per FSYNC_POLICY
+("interval" syncs within FSYNC_INTERVAL of a write, even if no further
+entries arrive), and rotates the log by size or age into gzip-compressed
+segments.
+Pending entries are flushed (and fsynced) at interpreter exit.
+
+Several processes may record into the same log: appends hold a shared
+flock, rotation holds it exclusively, and writers reopen the active file
+when it was rotated under them. Without fcntl (Windows) there is no file
+locking, so only one process should write a given log.
+
+Usage:
+    record_action("git_push", {"branch": "main"}, rationale="Release")
+    last_actions(5)          # Newest last; reads backward from EOF
 """
 
+import atexit
+import gzip
+import itertools
 import json
-import time
 import os
+import queue
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from athena import getenv
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, one writing process per log
+    fcntl = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 LOG_FILE = PROJECT_ROOT / ".athena" / "flight_recorder.jsonl"
 
+QUEUE_SIZE = 10_000  # Entries buffered before record_action blocks
+GROUP_MAX = 512  # Entries per group commit
+FSYNC_POLICY = getenv("ATHENA_FLIGHT_FSYNC", "interval")  # always | interval | never
+FSYNC_INTERVAL = 1.0  # Seconds, for the "interval" policy
+MAX_SEGMENT_BYTES = 10 * 1024 * 1024
+MAX_SEGMENT_AGE = 7 * 24 * 3600  # Seconds
+
+
+class FlightRecorder:
+    """Background, group-committing writer for one flight recorder log."""
+
+    def __init__(
+        self,
+        log_file: Path = LOG_FILE,
+        queue_size: int = QUEUE_SIZE,
+        fsync_policy: str = FSYNC_POLICY,
+        max_bytes: int = MAX_SEGMENT_BYTES,
+        max_age: float = MAX_SEGMENT_AGE,
+    ):
+        self.log_file = Path(log_file)
+        self.fsync_policy = fsync_policy
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=queue_size)
+        self._fh = None
+        self._size = 0
+        self._segment_started = 0.0
+        self._last_fsync = 0.0
+        self._dirty = False  # Written since the last fsync
+        self._compressors: List[threading.Thread] = []
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._run, name="athena-flight-recorder", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    # --- Producer side ---
+
+    def record(self, entry: Dict[str, Any]):
+        """Queue one entry (blocks only if the writer is QUEUE_SIZE behind)."""
+        line = json.dumps(entry, default=str) + "\n"
+        if self._closed and not self._writer.is_alive():
+            self._commit(line, force_sync=True)  # Late entries during shutdown
+            return
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is written. Returns False on timeout."""
+        if self._closed:
+            # Markers queued behind the stop sentinel are never seen; the
+            # writer drains everything before exiting, so wait for that instead.
+            self._writer.join(timeout)
+            return not self._writer.is_alive()
+        done = threading.Event()
+        self._queue.put(done)  # Marker: set once all earlier entries are written
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0):
+        """Flush, fsync and stop the writer (registered with atexit)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout)
+        for thread in self._compressors:
+            thread.join(timeout)
+
+    # --- Writer thread ---
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self._dirty:
+                # Wake up while idle so the tail of a burst is still synced on time
+                timeout = max(0.0, self._last_fsync + FSYNC_INTERVAL - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                try:
+                    self._sync()
+                except OSError as e:
+                    self._dirty = False
+                    print(f"⚠️ Flight Recorder Failure: {e}")
+                continue
+            batch, markers, stop = [], [], False
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= GROUP_MAX:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._commit("".join(batch), force_sync=stop or bool(markers))
+            elif stop or markers:
+                self._sync(force=True)
+            for marker in markers:
+                marker.set()
+            if stop:
+                if self._fh:
+                    self._fh.close()
+                    self._fh = None
+                return
+
+    def _lock(self, exclusive: bool):
+        lock = open(self.log_file.with_name(self.log_file.name + ".lock"), "a")
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return lock
+
+    def _open(self):
+        """(Re)open the active segment if missing or rotated by another process."""
+        if self._fh is not None:
+            try:
+                if os.stat(self.log_file).st_ino == os.fstat(self._fh.fileno()).st_ino:
+                    return
+            except FileNotFoundError:
+                pass
+            self._fh.close()
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.log_file, "ab")
+        self._size = self._fh.tell()
+        self._segment_started = _first_timestamp(self.log_file) or time.time()
+
+    def _commit(self, data: str, force_sync: bool):
+        try:
+            if self._due_for_rotation():
+                self._rotate()
+            lock = self._lock(exclusive=False)
+            try:
+                self._open()
+                self._fh.write(data.encode("utf-8"))
+                self._fh.flush()
+                self._size = self._fh.tell()
+                self._dirty = True
+            finally:
+                lock.close()
+            self._sync(force=force_sync)
+        except Exception as e:
+            # We don't want to crash the system if logging fails, but it's a blind spot.
+            print(f"⚠️ Flight Recorder Failure: {e}")
+
+    def _sync(self, force: bool = False):
+        if self._fh is None or (self.fsync_policy == "never" and not force):
+            self._dirty = False  # Nothing to wait for
+            return
+        if not self._dirty:
+            return
+        now = time.monotonic()
+        if force or self.fsync_policy == "always" or now - self._last_fsync >= FSYNC_INTERVAL:
+            os.fsync(self._fh.fileno())
+            self._last_fsync = now
+            self._dirty = False
+
+    def _due_for_rotation(self) -> bool:
+        if self._fh is None or self._size == 0:
+            return False
+        return self._size >= self.max_bytes or time.time() - self._segment_started >= self.max_age
+
+    def _rotate(self):
+        """Move the active log aside and compress it in the background."""
+        lock = self._lock(exclusive=True)
+        try:
+            self._open()  # Another process may have rotated already
+            if not self._due_for_rotation():
+                return
+            self._sync(force=True)
+            self._fh.close()
+            self._fh = None
+            stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+            for seq in itertools.count():
+                segment = self.log_file.with_name(
+                    f"{self.log_file.stem}.{stamp}.{os.getpid()}.{seq}{self.log_file.suffix}"
+                )
+                if not segment.exists() and not segment.with_name(segment.name + ".gz").exists():
+                    break
+            os.replace(self.log_file, segment)
+        finally:
+            lock.close()
+        thread = threading.Thread(target=_compress, args=(segment,), daemon=True)
+        thread.start()
+        self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+
+
+def _first_timestamp(path: Path) -> Optional[float]:
+    try:
+        with open(path, "rb") as f:
+            return float(json.loads(f.readline())["timestamp"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _compress(segment: Path):
+    """gzip a rotated segment; the plain file is removed only once the archive is complete."""
+    target = segment.with_name(segment.name + ".gz")
+    tmp = segment.with_name(segment.name + ".gz.tmp")
+    try:
+        with open(segment, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, target)
+        os.unlink(segment)
+    except OSError as e:
+        print(f"⚠️ Flight Recorder compression failed for {segment.name}: {e}")
+
+
+_recorder: Optional[FlightRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_flight_recorder() -> FlightRecorder:
+    """Singleton accessor for the process-wide flight recorder."""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = FlightRecorder()
+    return _recorder
+
 
 def record_action(
     tool_name: str,
@@ -35,15 +292,49 @@ def record_action(
     }
 
     try:
-        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        get_flight_recorder().record(entry)
     except Exception as e:
-        # We don't want to crash the system if logging fails, but it's a blind spot.
         print(f"⚠️ Flight Recorder Failure: {e}")
 
 
+def last_actions(n: int = 1, log_file: Path = LOG_FILE) -> List[Dict[str, Any]]:
+    """
+    Last n recorded actions, oldest first. Reads backward from the end of
+    the active log, continuing into the newest rotated segment if needed.
+    """
+    from athena.core.session_log import tail_lines
+
+    if _recorder is not None and Path(log_file) == _recorder.log_file:
+        _recorder.flush(timeout=1.0)  # Include this process's queued entries
+
+    log_file = Path(log_file)
+    lines = tail_lines(log_file, n) if log_file.exists() else []
+    if len(lines) < n:
+        segments = sorted(
+            log_file.parent.glob(f"{log_file.stem}.*{log_file.suffix}*"),
+            key=lambda p: p.stat().st_mtime,
+        )
+        segments = [p for p in segments if not p.name.endswith(".tmp")]
+        if segments:
+            newest = segments[-1]
+            opener = gzip.open if newest.suffix == ".gz" else open
+            try:
+                with opener(newest, "rt", encoding="utf-8") as f:
+                    lines = f.read().splitlines()[-(n - len(lines)) :] + lines
+            except OSError:
+                pass
+
+    actions = []
+    for line in lines:
+        try:
+            actions.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return actions
+
+
 if __name__ == "__main__":
     # Test
     record_action("test_action", {"key": "value"}, rationale="Testing flight recorder.")
+    get_flight_recorder().flush()
     print(f"Action recorded to {LOG_FILE}")
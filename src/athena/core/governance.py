@@ -17,6 +17,7 @@ import hashlib
 import json
 import logging
 import time
+from collections import deque
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
@@ -29,6 +30,17 @@ logger = logging.getLogger("athena.governance")
 
 DOOM_LOOP_THRESHOLD = 3  # Number of identical calls before flagging
 DOOM_LOOP_WINDOW = 60  # Seconds — only count repeats within this window
+DOOM_LOOP_MAX_HISTORY = 4096  # Hard cap on calls remembered within the window
+_NONE_HASH = hashlib.sha256(b"jnull").hexdigest()[:16]
+_ARGS_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+_HASH_CHUNK = 64 * 1024  # Encoded characters fed to the hash per update
+
+STATE_NAMESPACE = "governance"
+DEFAULT_EXCHANGE_STATE: dict[str, Any] = {
+    "semantic_search_performed": False,
+    "web_search_performed": False,
+    "last_search_time": 0,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -75,21 +87,63 @@ class DoomLoopDetector:
     """
 
     def __init__(
-        self, threshold: int = DOOM_LOOP_THRESHOLD, window: int = DOOM_LOOP_WINDOW
+        self,
+        threshold: int = DOOM_LOOP_THRESHOLD,
+        window: int = DOOM_LOOP_WINDOW,
+        max_history: int = DOOM_LOOP_MAX_HISTORY,
     ):
         self.threshold = threshold
         self.window = window
-        self._history: list[dict[str, Any]] = []
+        self.max_history = max_history
+        # Sliding window of (timestamp, signature), oldest first, plus a
+        # per-signature count of the entries currently in the window.
+        self._history: deque[tuple[float, str]] = deque()
+        self._counts: dict[str, int] = {}
         self._violations: int = 0
 
     @staticmethod
     def _hash_args(args: Any) -> str:
-        """Create a deterministic hash of tool call arguments."""
-        try:
-            serialized = json.dumps(args, sort_keys=True, default=str)
-        except (TypeError, ValueError):
-            serialized = str(args)
-        return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+        """
+        Create a deterministic hash of tool call arguments.
+
+        Plain string/bytes payloads (the common case for large inputs) are
+        hashed directly, skipping JSON serialization. Anything else is
+        streamed into the hash in chunks as it is encoded, so a large dict
+        or list is never held as one serialized string (same digest as
+        json.dumps(args, sort_keys=True, default=str)).
+        """
+        if args is None:
+            return _NONE_HASH
+        if isinstance(args, str):
+            hasher = hashlib.sha256(b"s")
+            hasher.update(args.encode("utf-8", errors="surrogatepass"))
+        elif isinstance(args, (bytes, bytearray)):
+            hasher = hashlib.sha256(b"b")
+            hasher.update(args)
+        else:
+            hasher = hashlib.sha256(b"j")
+            chunk: list[str] = []
+            size = 0
+            try:
+                for piece in _ARGS_ENCODER.iterencode(args):
+                    chunk.append(piece)
+                    size += len(piece)
+                    if size >= _HASH_CHUNK:
+                        hasher.update("".join(chunk).encode("utf-8", errors="surrogatepass"))
+                        chunk, size = [], 0
+                hasher.update("".join(chunk).encode("utf-8", errors="surrogatepass"))
+            except (TypeError, ValueError):
+                hasher = hashlib.sha256(b"j")  # Unencodable: fall back to repr
+                hasher.update(str(args).encode("utf-8", errors="surrogatepass"))
+        return hasher.hexdigest()[:16]
+
+    def _evict_oldest(self):
+        _, signature = self._history.popleft()
+        remaining = self._counts[signature] - 1
+        if remaining:
+            self._counts[signature] = remaining
+        else:
+            del self._counts[signature]
 
     def record(self, tool_name: str, args: Any = None) -> bool:
         """
@@ -98,27 +152,21 @@ class DoomLoopDetector:
         Returns True if a doom loop is detected (same tool+args repeated
         >= threshold times within the time window).
         """
-        now = time.time()
+        now = time.monotonic()
         args_hash = self._hash_args(args)
         signature = f"{tool_name}:{args_hash}"
 
-        # Prune old entries outside the window
-        self._history = [
-            entry for entry in self._history if now - entry["timestamp"] <= self.window
-        ]
+        # Expire entries outside the window, and cap memory
+        history = self._history
+        while history and now - history[0][0] > self.window:
+            self._evict_oldest()
+        while len(history) >= self.max_history:
+            self._evict_oldest()
 
         # Add current call
-        self._history.append(
-            {
-                "signature": signature,
-                "tool": tool_name,
-                "args_hash": args_hash,
-                "timestamp": now,
-            }
-        )
-
-        # Count occurrences of this signature in the window
-        count = sum(1 for e in self._history if e["signature"] == signature)
+        history.append((now, signature))
+        count = self._counts.get(signature, 0) + 1
+        self._counts[signature] = count
 
         if count >= self.threshold:
             self._violations += 1
@@ -146,6 +194,7 @@ class DoomLoopDetector:
     def reset(self):
         """Clear history (e.g., on session end)."""
         self._history.clear()
+        self._counts.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -182,8 +231,11 @@ class GovernanceEngine:
                 self.state_dir = Path.home() / ".athena" / "state"
         else:
             self.state_dir = state_dir
-        self.state_file = self.state_dir / "exchange_state.json"
-        self._state: dict[str, Any] = self._load_state()
+        from athena.core.state_store import get_state_store
+
+        self.state_file = self.state_dir / "exchange_state.json"  # Legacy, imported once
+        self._store = get_state_store(self.state_dir / "state.db")
+        self._store.seed(STATE_NAMESPACE, self.state_file)
 
         # Doom Loop Detector
         self.doom_loop = DoomLoopDetector()
@@ -191,35 +243,21 @@ class GovernanceEngine:
         # Risk-Proportional Triple-Lock state
         self._risk_level: RiskLevel = DEFAULT_RISK_LEVEL
 
-    def _load_state(self) -> dict[str, Any]:
-        if self.state_file.exists():
-            try:
-                return json.loads(self.state_file.read_text())
-            except Exception:
-                pass
-        return {
-            "semantic_search_performed": False,
-            "web_search_performed": False,
-            "last_search_time": 0,
-        }
-
-    def _save_state(self):
-        try:
-            self.state_dir.mkdir(parents=True, exist_ok=True)
-            self.state_file.write_text(json.dumps(self._state))
-        except Exception:
-            pass
+    @property
+    def _state(self) -> dict[str, Any]:
+        """Current exchange state, shared across processes via the state store."""
+        return {**DEFAULT_EXCHANGE_STATE, **self._store.get(STATE_NAMESPACE)}
 
     def mark_search_performed(self, query: str):
         """Register that a semantic search was performed for the current turn."""
-        self._state["semantic_search_performed"] = True
-        self._state["last_search_time"] = time.time()
-        self._save_state()
+        self._store.update(
+            STATE_NAMESPACE,
+            {"semantic_search_performed": True, "last_search_time": time.time()},
+        )
 
     def mark_web_search_performed(self, query: str):
         """Register that a web search was performed for the current turn."""
-        self._state["web_search_performed"] = True
-        self._save_state()
+        self._store.update(STATE_NAMESPACE, {"web_search_performed": True})
 
     def record_tool_call(self, tool_name: str, args: Any = None) -> bool:
         """
@@ -255,28 +293,22 @@ class GovernanceEngine:
 
         Resets state after check.
         """
+        # Reset for next turn (read-and-reset in one atomic update)
+        previous = self._store.update(
+            STATE_NAMESPACE,
+            {"semantic_search_performed": False, "web_search_performed": False},
+        )
+        sniper = self._risk_level == RiskLevel.SNIPER
+        self._risk_level = DEFAULT_RISK_LEVEL  # Always reset to robust default
+
         # Sniper Mode: Triple-Lock exempt (low-risk, direct answer)
-        if self._risk_level == RiskLevel.SNIPER:
+        if sniper:
             logger.info("Triple-Lock: SNIPER MODE — search steps exempt.")
-            # Still reset state for next turn
-            self._state["semantic_search_performed"] = False
-            self._state["web_search_performed"] = False
-            self._risk_level = DEFAULT_RISK_LEVEL  # Reset to robust default
-            self._save_state()
             return True
 
-        semantic = self._state.get("semantic_search_performed", False)
-        web = self._state.get("web_search_performed", False)
-
-        integrity = semantic and web
-
-        # Reset for next turn
-        self._state["semantic_search_performed"] = False
-        self._state["web_search_performed"] = False
-        self._risk_level = DEFAULT_RISK_LEVEL  # Always reset to robust default
-        self._save_state()
-
-        return integrity
+        semantic = previous.get("semantic_search_performed", False)
+        web = previous.get("web_search_performed", False)
+        return semantic and web
 
     def get_integrity_score(self) -> float:
         """
@@ -285,16 +317,18 @@ class GovernanceEngine:
         """
         if self._risk_level == RiskLevel.SNIPER:
             return 1.0
-        semantic = self._state.get("semantic_search_performed", False)
-        web = self._state.get("web_search_performed", False)
+        state = self._state
+        semantic = state.get("semantic_search_performed", False)
+        web = state.get("web_search_performed", False)
         return 1.0 if (semantic and web) else 0.0
 
     def get_status(self) -> dict[str, Any]:
         """Return full governance status including doom loop stats and risk level."""
+        state = self._state
         return {
             "triple_lock": {
-                "semantic_search": self._state.get("semantic_search_performed", False),
-                "web_search": self._state.get("web_search_performed", False),
+                "semantic_search": state.get("semantic_search_performed", False),
+                "web_search": state.get("web_search_performed", False),
                 "integrity_score": self.get_integrity_score(),
                 "risk_level": self._risk_level.name,
                 "sniper_mode": self.is_sniper_mode(),
@@ -1,6 +1,70 @@
-from typing import Any
+"""
+athena.core.health
+==================
+Cached, non-blocking health checks for Athena services.
 
-from athena.memory.vectors import get_embedding, get_client
+Probes are deliberately cheap:
+    - Vectors:  GET on the embedding model's metadata (no embedding is
+                generated); dimensions are read from the local embedding cache.
+    - Database: HEAD select with count="planned" (planner estimate, no scan).
+
+Checks run concurrently with a per-check timeout. Results are published to
+.agent/state/health_status.json and reused for HEALTH_TTL_SECONDS, so boot,
+athena_status, system_pulse and doctor read the status file instead of
+re-probing.
+"""
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from athena.core.config import STATE_DIR
+
+HEALTH_STATUS_PATH = STATE_DIR / "health_status.json"
+HEALTH_TTL_SECONDS = 15 * 60
+HEALTH_FAIL_TTL_SECONDS = 60  # Failures are re-probed sooner
+CHECK_TIMEOUT_SECONDS = 5.0
+EXPECTED_DIMS = 3072
+EMBEDDING_MODEL = "gemini-embedding-001"
+
+
+def read_status(
+    max_age: Optional[float] = HEALTH_TTL_SECONDS, path: Path = HEALTH_STATUS_PATH
+) -> Optional[dict]:
+    """
+    Read the published health status.
+
+    Args:
+        max_age: Ignore results older than this many seconds (None = any age).
+        path: Status file (override for another workspace root).
+
+    Returns:
+        {"checked_at": ts, "overall": "PASS"|"FAIL", "checks": {...}} or None.
+    """
+    try:
+        status = json.loads(Path(path).read_text())
+    except Exception:
+        return None
+    if max_age is not None and time.time() - status.get("checked_at", 0) > max_age:
+        return None
+    return status
+
+
+def _write_status(status: dict):
+    try:
+        HEALTH_STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=HEALTH_STATUS_PATH.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(status, f, indent=2)
+        os.replace(tmp, HEALTH_STATUS_PATH)
+    except Exception:
+        pass
 
 
 class HealthCheck:
@@ -8,32 +72,44 @@ class HealthCheck:
 
     @staticmethod
     def check_vector_api() -> dict[str, Any]:
-        """Check if the Gemini Embedding API is responsive and returns correct dimensions."""
+        """Ping the embedding model endpoint; read dimensions from the local cache."""
         try:
-            test_text = "health check"
-            embedding = get_embedding(test_text)
-            dims = len(embedding)
-            if dims == 3072:
-                return {"status": "PASS", "dims": 3072, "model": "gemini-embedding-001"}
-            else:
+            import requests
+
+            from athena import load_env
+            from athena.memory.vectors import get_embedding_cache
+
+            load_env()
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                return {"status": "FAIL", "error": "GOOGLE_API_KEY missing."}
+
+            url = f"https://generativelanguage.googleapis.com/v1beta/models/{EMBEDDING_MODEL}"
+            response = requests.get(
+                url, params={"key": api_key}, timeout=CHECK_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+
+            dims = get_embedding_cache().dimensions()
+            if dims is not None and dims != EXPECTED_DIMS:
                 return {
                     "status": "FAIL",
-                    "error": f"Incorrect dimensions: {dims} (expected 3072)",
+                    "error": f"Incorrect dimensions: {dims} (expected {EXPECTED_DIMS})",
                 }
+            return {"status": "PASS", "dims": dims or EXPECTED_DIMS, "model": EMBEDDING_MODEL}
         except Exception as e:
             return {"status": "FAIL", "error": str(e)}
 
     @staticmethod
     def check_database() -> dict[str, Any]:
-        """Check Supabase connectivity and RPC health."""
+        """Check Supabase connectivity with a planner-estimated HEAD count."""
         try:
+            from athena.memory.vectors import get_client
+
             client = get_client()
-            # Test a lightweight RPC or query
-            # Checking sessions table count as a proxy for connectivity
             response = (
                 client.table("sessions")
-                .select("count", count="exact")
-                .limit(1)
+                .select("*", count="planned", head=True)
                 .execute()
             )
             count = response.count if hasattr(response, "count") else 0
@@ -42,12 +118,50 @@ class HealthCheck:
             return {"status": "FAIL", "error": str(e)}
 
     @classmethod
-    def run_all(cls) -> bool:
-        """Run all critical health checks and print results."""
-        print("\n🔍 SYSTEM HEALTH AUDIT")
+    def probe_all(cls, timeout: float = CHECK_TIMEOUT_SECONDS) -> dict:
+        """Run all probes concurrently, publish and return the status."""
+        checks = {"vector_api": cls.check_vector_api, "database": cls.check_database}
+        executor = ThreadPoolExecutor(max_workers=len(checks))
+        futures = {name: executor.submit(fn) for name, fn in checks.items()}
+
+        results = {}
+        deadline = time.monotonic() + timeout
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                results[name] = {"status": "FAIL", "error": f"Timed out after {timeout:.0f}s"}
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        status = {
+            "checked_at": time.time(),
+            "timestamp": datetime.now().isoformat(),
+            "overall": "PASS" if all(r["status"] == "PASS" for r in results.values()) else "FAIL",
+            "checks": results,
+        }
+        _write_status(status)
+        return status
+
+    @classmethod
+    def get_status(cls, force: bool = False) -> dict:
+        """Cached status if still fresh, otherwise a new concurrent probe."""
+        status = None if force else read_status()
+        if status and status["overall"] != "PASS":
+            if time.time() - status["checked_at"] > HEALTH_FAIL_TTL_SECONDS:
+                status = None
+        return status or cls.probe_all()
+
+    @classmethod
+    def run_all(cls, force: bool = False) -> bool:
+        """Run all critical health checks (cached within TTL) and print results."""
+        status = cls.get_status(force=force)
+        age = time.time() - status["checked_at"]
+        cached = f" (cached {int(age // 60)}m ago)" if age >= 1 else ""
+
+        print(f"\n🔍 SYSTEM HEALTH AUDIT{cached}")
         print("─" * 30)
 
-        vector = cls.check_vector_api()
+        vector = status["checks"]["vector_api"]
         v_status = (
             f"✅ {vector['model']} ({vector['dims']}d)"
             if vector["status"] == "PASS"
@@ -55,18 +169,18 @@ class HealthCheck:
         )
         print(f"   Vectors:  {v_status}")
 
-        db = cls.check_database()
+        db = status["checks"]["database"]
         db_status = (
-            f"✅ Connected ({db['record_count']} records)"
+            f"✅ Connected (~{db['record_count']} records)"
             if db["status"] == "PASS"
             else f"❌ {db.get('error')}"
         )
         print(f"   Database: {db_status}")
 
         print("─" * 30)
-        return vector["status"] == "PASS" and db["status"] == "PASS"
+        return status["overall"] == "PASS"
 
 
 if __name__ == "__main__":
     # Internal test
-    HealthCheck.run_all()
+    HealthCheck.run_all(force=True)
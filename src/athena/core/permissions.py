@@ -21,17 +21,31 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import fnmatch
 import json
 import logging
+import os
+import re
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from athena import getenv
+
+if TYPE_CHECKING:
+    from athena.core.state_store import StateStore
 
 logger = logging.getLogger("athena.permissions")
 
+STATE_NAMESPACE = "permissions"
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -157,10 +171,135 @@ INTERNAL_PATTERNS = [
 ]
 
 
+REDACTION_MARK = "[REDACTED]"
+
+
+class SensitivityMatcher:
+    """
+    Compiled matcher over the sensitivity pattern lists.
+
+    Patterns are folded into a trie-shaped regex, so labeling and redaction
+    are one C-level pass over the lowercased text instead of a lower() and
+    a substring scan per pattern. Matching is case-insensitive; at any
+    position the longest pattern wins.
+    """
+
+    def __init__(self, secret_patterns: list[str], internal_patterns: list[str]):
+        secret = {p.lower() for p in secret_patterns}
+        internal = {p.lower() for p in internal_patterns} - secret
+        self.max_len = max(map(len, [*secret, *internal, "x"]))
+        self._secret_set = secret
+        self._secret = _compile_trie(secret)
+        self._any = _compile_trie(secret | internal)
+        # Fallback for text whose lowercase form changes length (rare Unicode)
+        self._secret_nocase = _compile_trie(secret, re.IGNORECASE)
+        self._any_nocase = _compile_trie(secret | internal, re.IGNORECASE)
+
+    def _fold(self, content: str) -> tuple[str, bool]:
+        lowered = content.lower()
+        return (lowered, True) if len(lowered) == len(content) else (content, False)
+
+    def label(self, content: str) -> Sensitivity:
+        """SECRET if any secret pattern occurs, else INTERNAL/PUBLIC."""
+        text, folded = self._fold(content)
+        any_re = self._any if folded else self._any_nocase
+        if any_re is None:
+            return Sensitivity.PUBLIC
+        match = any_re.search(text)
+        if match is None:
+            return Sensitivity.PUBLIC
+        if match.group().lower() in self._secret_set:
+            return Sensitivity.SECRET
+        # Internal hit; a secret may still follow (or overlap this match)
+        secret_re = self._secret if folded else self._secret_nocase
+        if secret_re and secret_re.search(text, match.start()):
+            return Sensitivity.SECRET
+        return Sensitivity.INTERNAL
+
+    def _redact_spans(self, content: str, limit: int) -> tuple[str, int]:
+        """Redact matches starting before limit; returns (output, consumed)."""
+        text, folded = self._fold(content)
+        secret_re = self._secret if folded else self._secret_nocase
+        if secret_re is None:
+            return content[:limit], limit
+        out = []
+        pos = 0
+        for match in secret_re.finditer(text):
+            if match.start() >= limit:
+                break
+            out.append(content[pos : match.start()])
+            out.append(REDACTION_MARK)
+            pos = match.end()
+        cut = max(pos, limit)
+        out.append(content[pos:cut])
+        return "".join(out), cut
+
+    def redact(self, content: str) -> str:
+        """Replace every secret pattern occurrence, in any case."""
+        return self._redact_spans(content, len(content))[0]
+
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Redact an iterable of text chunks (e.g. a large file read in blocks).
+        Output is identical to redact() on the joined text: the last
+        max_len - 1 chars are held back so matches across chunk
+        boundaries are still found.
+        """
+        hold = self.max_len - 1
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            safe = len(buffer) - hold
+            if safe <= 0:
+                continue
+            out, cut = self._redact_spans(buffer, safe)
+            buffer = buffer[cut:]
+            yield out
+        if buffer:
+            yield self.redact(buffer)
+
+
+def _compile_trie(patterns: set[str], flags: int = 0) -> re.Pattern | None:
+    """Compile literals into a trie regex (shared prefixes, longest match first)."""
+    if not patterns:
+        return None
+    root: dict = {}
+    for pattern in patterns:
+        node = root
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(c) + build(node[c]) for c in sorted(k for k in node if k)]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:  # A pattern ends here; continuing is optional (greedy)
+            return "(?:" + body + ")?" if len(branches) == 1 else body + "?"
+        return body
+
+    return re.compile(build(root), flags)
+
+
+@lru_cache(maxsize=4)
+def _build_matcher(secret: tuple[str, ...], internal: tuple[str, ...]) -> SensitivityMatcher:
+    return SensitivityMatcher(list(secret), list(internal))
+
+
+def get_sensitivity_matcher() -> SensitivityMatcher:
+    """Matcher for the current pattern lists (rebuilt only if they change)."""
+    return _build_matcher(tuple(SECRET_PATTERNS), tuple(INTERNAL_PATTERNS))
+
+
 # ---------------------------------------------------------------------------
 # Granular Permission Rules (Stolen from OpenCode, Feb 2026)
 # ---------------------------------------------------------------------------
 
+DECISION_CACHE_SIZE = 4096  # Cached (tool, input) → action decisions
+DECISION_CACHE_MAX_INPUT = 1024  # Longer inputs are evaluated, not cached
+_UNCOMPILED = object()
+
 # Default rules: last match wins
 DEFAULT_GRANULAR_RULES: list[dict[str, str]] = [
     {"tool": "*", "pattern": "*", "action": "allow"},
@@ -203,6 +342,8 @@ class GranularPermissionEngine:
     def __init__(self, rules_path: Path | None = None):
         self._rules_path = rules_path
         self._rules: list[GranularRule] = []
+        self._tool_matchers: dict[str, re.Pattern | None] = {}
+        self._decide = lru_cache(maxsize=DECISION_CACHE_SIZE)(self._evaluate)
         self._load_rules()
 
     def _load_rules(self):
@@ -232,6 +373,38 @@ class GranularPermissionEngine:
                 )
                 for r in DEFAULT_GRANULAR_RULES
             ]
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drop compiled matchers and cached decisions after a rule change."""
+        self._tool_matchers = {}
+        self._decide.cache_clear()
+
+    def _matcher_for(self, tool_name: str) -> re.Pattern | None:
+        """
+        One regex per tool name, compiled on first use: the input patterns of
+        every rule that applies to this tool, highest priority (last) first,
+        each in its own named group. The first alternative that matches is
+        the winning rule.
+        """
+        matcher = self._tool_matchers.get(tool_name, _UNCOMPILED)
+        if matcher is _UNCOMPILED:
+            name = os.path.normcase(tool_name)
+            branches = [
+                f"(?P<r{i}>{fnmatch.translate(os.path.normcase(rule.pattern))})"
+                for i, rule in reversed(list(enumerate(self._rules)))
+                if rule.tool == "*" or fnmatch.fnmatchcase(name, os.path.normcase(rule.tool))
+            ]
+            matcher = re.compile("|".join(branches)) if branches else None
+            self._tool_matchers[tool_name] = matcher
+        return matcher
+
+    def _evaluate(self, tool_name: str, input_str: str) -> Action:
+        matcher = self._matcher_for(tool_name)
+        match = matcher.match(os.path.normcase(input_str)) if matcher else None
+        if match is None:
+            return Action.ALLOW  # Default if no rules match
+        return self._rules[int(match.lastgroup[1:])].action
 
     def save_rules(self):
         """Persist current rules to disk."""
@@ -247,16 +420,18 @@ class GranularPermissionEngine:
         """
         Evaluate rules for a tool call. Returns the action from the
         last matching rule (last-match-wins semantics).
+
+        Rules are compiled per tool and decisions are cached by
+        (tool, input) until the rules change.
         """
-        result = Action.ALLOW  # Default if no rules match
-        for rule in self._rules:
-            if rule.matches(tool_name, input_str):
-                result = rule.action
-        return result
+        if len(input_str) > DECISION_CACHE_MAX_INPUT:
+            return self._evaluate(tool_name, input_str)
+        return self._decide(tool_name, input_str)
 
     def add_rule(self, tool: str, pattern: str, action: Action):
         """Add a new rule. Appended at the end (highest priority)."""
         self._rules.append(GranularRule(tool=tool, pattern=pattern, action=action))
+        self._invalidate()
         self.save_rules()
 
     def get_rules(self) -> list[dict]:
@@ -267,6 +442,87 @@ class GranularPermissionEngine:
         ]
 
 
+# ---------------------------------------------------------------------------
+# Audit Log
+# ---------------------------------------------------------------------------
+
+AUDIT_LOG_SIZE = 1000  # Events kept in memory (ring buffer)
+AUDIT_FLUSH_INTERVAL = 5.0  # Seconds between background writes to the sink
+
+
+class AuditLog:
+    """
+    Fixed-size ring buffer of permission events.
+
+    Recording is a tuple append (no dict or timestamp formatting on the hot
+    path); entries are materialized when read. With a sink path, events are
+    also appended to a JSONL file by a background thread.
+    """
+
+    def __init__(self, size: int = AUDIT_LOG_SIZE, sink: Path | None = None):
+        self._entries: deque[tuple] = deque(maxlen=size)
+        self.sink = sink
+        self._unflushed: deque[tuple] = deque(maxlen=size * 10)
+        self._flusher: threading.Thread | None = None
+        self._flush_lock = threading.Lock()
+
+    def record(self, action: str, target: str, details: dict):
+        event = (time.time(), action, target, details)
+        self._entries.append(event)
+        if self.sink:
+            self._unflushed.append(event)
+            if self._flusher is None:
+                self._start_flusher()
+
+    @staticmethod
+    def _as_dict(event: tuple) -> dict:
+        timestamp, action, target, details = event
+        return {
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "action": action,
+            "target": target,
+            **details,
+        }
+
+    def entries(self) -> list[dict]:
+        """Buffered events, oldest first."""
+        return [self._as_dict(event) for event in list(self._entries)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _start_flusher(self):
+        with self._flush_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="athena-audit-flush", daemon=True
+                )
+                self._flusher.start()
+                atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(AUDIT_FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        """Append unflushed events to the sink file."""
+        if not self.sink:
+            return
+        with self._flush_lock:
+            lines = []
+            while self._unflushed:
+                lines.append(json.dumps(self._as_dict(self._unflushed.popleft()), default=str))
+            if not lines:
+                return
+            try:
+                self.sink.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.sink, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                logger.debug("Permission audit flush failed: %s", e)
+
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -324,46 +580,51 @@ class PermissionEngine:
     # Secret mode — when True, blocks access to INTERNAL and SECRET data
     secret_mode: bool = False
 
-    # Audit log
-    audit_log: list[dict] = field(default_factory=list)
+    # Audit log (ring buffer; mirrored to ATHENA_PERMISSION_AUDIT if set)
+    audit_log: AuditLog = field(default_factory=AuditLog)
 
-    # State file for persistence
-    _state_path: Path | None = None
+    # Shared state store for persistence (legacy permissions.json is imported once)
+    _store: StateStore | None = None
 
     # Granular permission engine (initialized in __post_init__)
     _granular: GranularPermissionEngine | None = None
 
     def __post_init__(self):
         from athena.core.config import PROJECT_ROOT
+        from athena.core.state_store import get_state_store
 
-        self._state_path = PROJECT_ROOT / ".agent" / "state" / "permissions.json"
-        rules_path = PROJECT_ROOT / ".agent" / "state" / "permission_rules.json"
+        state_dir = PROJECT_ROOT / ".agent" / "state"
+        rules_path = state_dir / "permission_rules.json"
         self._granular = GranularPermissionEngine(rules_path=rules_path)
+        self._store = get_state_store(state_dir / "state.db")
+        self._store.seed(STATE_NAMESPACE, state_dir / "permissions.json")
         self._load_state()
 
+        sink = getenv("ATHENA_PERMISSION_AUDIT", "")
+        if sink:
+            default_sink = PROJECT_ROOT / ".athena" / "permission_audit.jsonl"
+            self.audit_log.sink = default_sink if sink.lower() in ("1", "true") else Path(sink)
+
     def _load_state(self):
-        """Load persisted state."""
-        if self._state_path and self._state_path.exists():
+        """Load persisted state (cheap when nothing changed since the last load)."""
+        if self._store:
+            data = self._store.get(STATE_NAMESPACE)
             try:
-                data = json.loads(self._state_path.read_text())
                 self.secret_mode = data.get("secret_mode", False)
                 self.caller_level = Permission(data.get("caller_level", "write"))
-            except Exception:
+            except ValueError:
                 pass
 
     def _save_state(self):
-        """Persist state to disk."""
-        if self._state_path:
-            self._state_path.parent.mkdir(parents=True, exist_ok=True)
-            self._state_path.write_text(
-                json.dumps(
-                    {
-                        "secret_mode": self.secret_mode,
-                        "caller_level": self.caller_level.value,
-                        "last_updated": datetime.now().isoformat(),
-                    },
-                    indent=2,
-                )
+        """Persist state (buffered; flushed in the background)."""
+        if self._store:
+            self._store.update(
+                STATE_NAMESPACE,
+                {
+                    "secret_mode": self.secret_mode,
+                    "caller_level": self.caller_level.value,
+                    "last_updated": datetime.now().isoformat(),
+                },
             )
 
     # --- Core API ---
@@ -431,6 +692,7 @@ class PermissionEngine:
         Combined gate — checks permission, sensitivity, AND granular rules.
         This is the main entry point for the MCP middleware.
         """
+        self._load_state()  # Pick up mode changes made by other processes
         self.check(tool_name)
         self.check_sensitivity(tool_name)
 
@@ -455,31 +717,23 @@ class PermissionEngine:
         """
         Auto-classify content sensitivity based on pattern matching.
         """
-        content_lower = content.lower()
-
-        for pattern in SECRET_PATTERNS:
-            if pattern.lower() in content_lower:
-                return Sensitivity.SECRET
-
-        for pattern in INTERNAL_PATTERNS:
-            if pattern.lower() in content_lower:
-                return Sensitivity.INTERNAL
-
-        return Sensitivity.PUBLIC
+        return get_sensitivity_matcher().label(content)
 
     def redact(self, content: str) -> str:
         """
-        Redact secret patterns from content.
+        Redact secret patterns (case-insensitive) from content.
         Used when secret_mode is active but data must still flow.
         """
         if not self.secret_mode:
             return content
+        return get_sensitivity_matcher().redact(content)
 
-        for pattern in SECRET_PATTERNS:
-            if pattern.lower() in content.lower():
-                content = content.replace(pattern, "[REDACTED]")
-
-        return content
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Streaming redact() for large content read in chunks."""
+        if not self.secret_mode:
+            yield from chunks
+            return
+        yield from get_sensitivity_matcher().redact_stream(chunks)
 
     # --- Mode Control ---
 
@@ -578,20 +832,11 @@ class PermissionEngine:
 
     def _audit(self, action: str, target: str, details: dict):
         """Record a permission event."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "target": target,
-            **details,
-        }
-        self.audit_log.append(entry)
-
-        if len(self.audit_log) > 1000:
-            self.audit_log = self.audit_log[-500:]
+        self.audit_log.record(action, target, details)
 
         # Log only high-level metadata to avoid exposing potentially sensitive details.
         logger.debug(
-            "Permission %s: [REDACTED_TARGET] (details recorded in memory only)", action
+            "Permission %s: [REDACTED_TARGET] (details recorded in the audit log only)", action
         )
 
 
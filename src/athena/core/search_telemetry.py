@@ -0,0 +1,187 @@
+"""
+athena.core.search_telemetry
+============================
+
+Search query history via JSONL append log (same shape as skill_telemetry).
+Feeds the search-cache prewarm engine: which queries to warm, and how
+often the warmed entries were actually hit afterwards.
+
+Usage:
+    from athena.core.search_telemetry import log_search_query, get_top_queries
+
+    log_search_query("kelly sizing", hit="miss", limit=10)
+    top = get_top_queries(limit=8)
+
+Appends hold a shared flock on search_queries.jsonl.lock; compact_log()
+holds it exclusively, so no append lands in the file it is replacing.
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from athena.core.config import get_project_root
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, writers in one process only
+    fcntl = None
+
+MAX_LOG_LINES = 5000  # Older history is trimmed by compact_log()
+RECENCY_HALF_LIFE_DAYS = 3
+
+
+def _get_telemetry_path() -> Path:
+    """Returns the path to the search query JSONL log."""
+    root = get_project_root()
+    telemetry_dir = root / ".athena"
+    telemetry_dir.mkdir(parents=True, exist_ok=True)
+    return telemetry_dir / "search_queries.jsonl"
+
+
+@contextmanager
+def _locked(path: Path, exclusive: bool):
+    """Appenders share the lock; compaction takes it exclusively."""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def log_search_query(
+    query: str,
+    hit: str = "miss",
+    limit: int = 10,
+    strict: bool = False,
+    rerank: bool = False,
+    skills_only: bool = False,
+) -> dict:
+    """
+    Append a search record.
+
+    Args:
+        query: The query as typed.
+        hit: "exact" | "semantic" | "miss" — how the search cache answered.
+        limit/strict/rerank/skills_only: Parameters that form the cache key,
+            so the prewarm replays exactly what was asked.
+    """
+    record = {
+        "query": query,
+        "ts": time.time(),
+        "hit": hit,
+        "limit": limit,
+        "strict": strict,
+        "rerank": rerank,
+        "skills_only": skills_only,
+    }
+    path = _get_telemetry_path()
+    try:
+        with _locked(path, exclusive=False), open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass
+    return record
+
+
+def _read_log(since: Optional[float] = None) -> list[dict]:
+    path = _get_telemetry_path()
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if since is not None and record.get("ts", 0) < since:
+                continue
+            records.append(record)
+    return records
+
+
+def get_top_queries(limit: int = 8, days: int = 14) -> list[dict]:
+    """
+    Most valuable queries to prewarm: frequency weighted by recency.
+
+    Returns:
+        [{"query": ..., "limit": ..., "strict": ..., "rerank": ...,
+          "skills_only": ..., "score": float}, ...] — best first.
+    """
+    now = time.time()
+    records = _read_log(since=now - days * 86400)
+
+    scored: dict[tuple, float] = {}
+    spelling: dict[str, str] = {}  # Most recent casing, replayed as typed
+    for r in records:
+        query = r.get("query", "").strip()
+        if not query:
+            continue
+        spelling[query.lower()] = query
+        key = (
+            query.lower(),
+            r.get("limit", 10),
+            r.get("strict", False),
+            r.get("rerank", False),
+            r.get("skills_only", False),
+        )
+        age_days = (now - r.get("ts", now)) / 86400
+        scored[key] = scored.get(key, 0.0) + math.pow(
+            0.5, age_days / RECENCY_HALF_LIFE_DAYS
+        )
+
+    top = sorted(scored.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+    return [
+        {
+            "query": spelling[q],
+            "limit": lim,
+            "strict": strict,
+            "rerank": rerank,
+            "skills_only": skills_only,
+            "score": round(score, 3),
+        }
+        for (q, lim, strict, rerank, skills_only), score in top
+    ]
+
+
+def get_warm_hit_rate(warmed: list[str], since: float) -> dict:
+    """
+    How many searches since `since` were served by a warmed entry.
+
+    Returns:
+        {"searches": int, "warm_hits": int, "rate": float}
+    """
+    warmed_set = {q.lower().strip() for q in warmed}
+    records = _read_log(since=since)
+    warm_hits = sum(
+        1
+        for r in records
+        if r.get("hit") != "miss" and r.get("query", "").lower().strip() in warmed_set
+    )
+    searches = len(records)
+    return {
+        "searches": searches,
+        "warm_hits": warm_hits,
+        "rate": round(warm_hits / searches, 3) if searches else 0.0,
+    }
+
+
+def compact_log(max_lines: int = MAX_LOG_LINES) -> int:
+    """Keep only the newest max_lines records. Returns lines dropped."""
+    path = _get_telemetry_path()
+    if not path.exists():
+        return 0
+    with _locked(path, exclusive=True):
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        if len(lines) <= max_lines:
+            return 0
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(lines[-max_lines:]), encoding="utf-8")
+        tmp.replace(path)
+    return len(lines) - max_lines
@@ -0,0 +1,226 @@
+"""
+athena.core.session_catalog
+===========================
+Persisted index of session logs.
+
+Maps session_id -> {file, date, num} plus extracted header fields (Focus,
+pending Action Items) with the stat they were read at. Kept current by
+create_session / append_checkpoint / update_session_metadata, so "latest
+session", "next number for today" and "deferred items" are dictionary
+lookups instead of a directory scan plus a full read of the last log.
+
+Changes made outside athena (new/deleted files) change the directory
+mtime, which triggers one rescan of file names; a session log edited by
+hand fails its stat check and only that file is re-read.
+
+Usage:
+    catalog = get_session_catalog()
+    latest = catalog.latest_path()
+    header = catalog.header(latest)   # {"focus": ..., "deferred": [...]}
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from athena.core.config import SESSIONS_DIR, STATE_DIR
+
+SESSION_CATALOG_PATH = STATE_DIR / "session_catalog.json"
+CATALOG_VERSION = 1
+
+SESSION_FILE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-session-(\d{2,3})\.md$")
+
+
+def _stat(path: Path) -> Optional[list]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def extract_header(path: Path) -> dict:
+    """Focus line and pending Action Items, in a single pass over the log."""
+    focus, deferred = None, []
+    in_action = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for raw in f:
+            line = raw.rstrip("\n")
+            if focus is None and line.startswith("**Focus**:"):
+                value = line.replace("**Focus**:", "").strip()
+                focus = value if value and value != "..." else ""
+            elif line.startswith("#"):
+                if in_action:
+                    break
+                in_action = "Action Items" in line
+            elif in_action and "Pending" in line and "|" in line:
+                parts = [p.strip() for p in line.split("|")]
+                if len(parts) >= 3 and parts[1] and parts[1] != "Action":
+                    deferred.append(parts[1])
+    return {"focus": focus or "", "deferred": deferred}
+
+
+class SessionCatalog:
+    """Index of session logs persisted to .agent/state/session_catalog.json."""
+
+    def __init__(
+        self, sessions_dir: Path = SESSIONS_DIR, path: Path = SESSION_CATALOG_PATH
+    ):
+        self.sessions_dir = Path(sessions_dir)
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._data: Optional[dict] = None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> dict:
+        if self._data is not None:
+            if self._data["dir_mtime_ns"] != self._dir_mtime():
+                self._rescan()
+            return self._data
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != CATALOG_VERSION:
+                raise ValueError("stale catalog version")
+            self._data = data
+        except (OSError, ValueError):
+            self._data = None
+        if self._data is None or self._data["dir_mtime_ns"] != self._dir_mtime():
+            self._rescan()
+        return self._data
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.sessions_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _rescan(self):
+        """Rebuild the id index from file names (no file contents are read)."""
+        previous = (self._data or {}).get("sessions", {})
+        sessions = {}
+        if self.sessions_dir.exists():
+            for entry in os.scandir(self.sessions_dir):
+                match = SESSION_FILE_RE.match(entry.name)
+                if not match:
+                    continue
+                session_id = entry.name[:-3]
+                sessions[session_id] = previous.get(session_id) or {
+                    "file": entry.name,
+                    "date": match.group(1),
+                    "num": int(match.group(2)),
+                }
+        self._data = {
+            "version": CATALOG_VERSION,
+            "dir_mtime_ns": self._dir_mtime(),
+            "sessions": sessions,
+        }
+        self._reindex()
+        self.save()
+
+    def _reindex(self):
+        sessions = self._data["sessions"]
+        latest = max(sessions.values(), key=lambda e: (e["date"], e["num"]), default=None)
+        max_num: dict[str, int] = {}
+        for e in sessions.values():
+            max_num[e["date"]] = max(max_num.get(e["date"], 0), e["num"])
+        self._data["latest"] = latest["file"][:-3] if latest else None
+        self._data["max_num"] = max_num
+
+    def save(self):
+        """Atomic write of the catalog."""
+        if self._data is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def latest_path(self) -> Optional[Path]:
+        """Most recent session log (by date, then session number)."""
+        with self._lock:
+            latest = self._load().get("latest")
+        return self.sessions_dir / f"{latest}.md" if latest else None
+
+    def next_number(self, date: str) -> int:
+        """Next free session number for a YYYY-MM-DD date."""
+        with self._lock:
+            return self._load()["max_num"].get(date, 0) + 1
+
+    def header(self, path: Path) -> dict:
+        """Extracted header fields, re-read only if the file changed."""
+        path = Path(path)
+        with self._lock:
+            entry = self._load()["sessions"].get(path.stem)
+            stat = _stat(path)
+            if entry is None or stat is None:
+                return {"focus": "", "deferred": []}
+            if entry.get("stat") != stat:
+                entry.update(extract_header(path), stat=stat)
+                self.save()
+            return {"focus": entry["focus"], "deferred": entry["deferred"]}
+
+    # ------------------------------------------------------------------
+    # Updates (create / save hooks)
+    # ------------------------------------------------------------------
+
+    def register(self, path: Path):
+        """Record a newly created session log."""
+        path = Path(path)
+        match = SESSION_FILE_RE.match(path.name)
+        if not match:
+            return
+        with self._lock:
+            data = self._load()
+            data["sessions"][path.stem] = {
+                "file": path.name,
+                "date": match.group(1),
+                "num": int(match.group(2)),
+            }
+            data["dir_mtime_ns"] = self._dir_mtime()
+            self._reindex()
+            self._refresh_entry(path)
+            self.save()
+
+    def refresh(self, path: Path):
+        """Re-extract header fields after the log was written to."""
+        path = Path(path)
+        with self._lock:
+            if path.stem in self._load()["sessions"]:
+                self._refresh_entry(path)
+                self.save()
+
+    def _refresh_entry(self, path: Path):
+        entry = self._data["sessions"][path.stem]
+        try:
+            entry.update(extract_header(path), stat=_stat(path))
+        except OSError:
+            pass
+
+
+_catalog: Optional[SessionCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_session_catalog() -> SessionCatalog:
+    """Singleton accessor for the session catalog."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = SessionCatalog()
+    return _catalog
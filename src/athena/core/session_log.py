@@ -0,0 +1,147 @@
+"""
+athena.core.session_log
+=======================
+Constant-cost access to (growing) session logs.
+
+    tail(path, n)      Last n lines, read backward in blocks from EOF.
+    line_count(path)   Via a per-log line-offset index keyed by (size, mtime);
+                       an appended log only scans the new bytes.
+    read_text(path)    Full text, cached; appends are read incrementally.
+
+Session logs are append-mostly (checkpoints), so "grew, and both the head
+(frontmatter) and the bytes before the old EOF are unchanged" is checked
+with two short signatures; anything else falls back to a full rebuild.
+
+Usage:
+    reader = get_session_log_reader()
+    text = reader.tail(log_path, 50)
+    total = reader.line_count(log_path)
+"""
+
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+TAIL_BLOCK_BYTES = 8192
+SIGNATURE_BYTES = 64
+HEAD_BYTES = 4096  # Covers the frontmatter, which is edited in place
+MAX_TRACKED_LOGS = 4
+
+
+def tail_lines(path: Path, n: int, block_size: int = TAIL_BLOCK_BYTES) -> list[str]:
+    """Last n lines of a file (splitlines semantics), seeking backward in blocks."""
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # n lines need n newlines before them (plus one for a trailing newline)
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if pos > 0:
+        lines = lines[1:]  # First line may be partial
+    return lines[-n:]
+
+
+class _LogState:
+    __slots__ = ("size", "mtime_ns", "starts", "head", "signature", "text")
+
+    def __init__(self):
+        self.size = 0
+        self.mtime_ns = 0
+        self.starts = array("Q", [0])  # Byte offset where each line starts
+        self.head = b""
+        self.signature = b""
+        self.text: Optional[str] = None
+
+
+class SessionLogReader:
+    """Per-log line-offset index and text cache for the most recent logs."""
+
+    def __init__(self, max_logs: int = MAX_TRACKED_LOGS):
+        self.max_logs = max_logs
+        self._states: "OrderedDict[str, _LogState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _refresh(self, path: Path) -> _LogState:
+        key = str(path)
+        st = os.stat(path)
+        state = self._states.get(key)
+        if state and state.size == st.st_size and state.mtime_ns == st.st_mtime_ns:
+            self._states.move_to_end(key)
+            return state
+
+        with open(path, "rb") as f:
+            appended = state is not None and st.st_size > state.size
+            if appended:
+                appended = f.read(len(state.head)) == state.head
+            if appended and state.signature:
+                f.seek(state.size - len(state.signature))
+                appended = f.read(len(state.signature)) == state.signature
+            if not appended:
+                state = _LogState()
+            f.seek(state.size)
+            base = state.size
+            new_bytes = f.read(st.st_size - base)
+
+        pos = new_bytes.find(b"\n")
+        while pos != -1:
+            state.starts.append(base + pos + 1)
+            pos = new_bytes.find(b"\n", pos + 1)
+        if state.text is not None:
+            state.text += new_bytes.decode("utf-8", errors="replace")
+        state.size = st.st_size
+        state.mtime_ns = st.st_mtime_ns
+        with open(path, "rb") as f:
+            state.head = f.read(min(HEAD_BYTES, state.size))
+            sig_len = min(SIGNATURE_BYTES, state.size)
+            f.seek(state.size - sig_len)
+            state.signature = f.read(sig_len)
+
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_logs:
+            self._states.popitem(last=False)
+        return state
+
+    def line_count(self, path: Path) -> int:
+        """Number of lines (same as len(text.splitlines()) for \\n-terminated logs)."""
+        with self._lock:
+            state = self._refresh(Path(path))
+            count = len(state.starts)
+            return count - 1 if state.starts[-1] == state.size else count
+
+    def tail(self, path: Path, n: int) -> str:
+        """Last n lines joined with newlines (reverse block read)."""
+        return "\n".join(tail_lines(Path(path), n))
+
+    def read_text(self, path: Path) -> str:
+        """Full log text; unchanged logs are served from memory, appends read incrementally."""
+        with self._lock:
+            state = self._refresh(Path(path))
+            if state.text is None:
+                with open(path, "rb") as f:  # Exactly the indexed bytes
+                    state.text = f.read(state.size).decode("utf-8", errors="replace")
+            return state.text
+
+
+_reader: Optional[SessionLogReader] = None
+_reader_lock = threading.Lock()
+
+
+def get_session_log_reader() -> SessionLogReader:
+    """Singleton accessor for the session log reader."""
+    global _reader
+    if _reader is None:
+        with _reader_lock:
+            if _reader is None:
+                _reader = SessionLogReader()
+    return _reader
@@ -7,11 +7,14 @@ Extracted from OpenClaw's sessions_* tools pattern ("The Great Steal 2.0").
 
 Architecture:
   [Swarm Agent A] --(HTTP POST)--> [athenad /sessions/send] --(SQLite)--> [Master Agent polls /sessions/{id}/history]
+  [writer commit] --(unix datagram ring, athena.core.swarm_bus)--> [rpc.subscribe(id)] reads SQLite, acks in batches
 
 Uses the existing athena.db SQLite database. Zero external dependencies.
 """
 
+import asyncio
 import sqlite3
+import threading
 import time
 import uuid
 import logging
@@ -21,11 +24,15 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 
 from athena.core.config import get_project_root
+from athena.core.swarm_bus import Doorbell, bus_dir_for, ring
 
 logger = logging.getLogger("athenad")
 
 PROJECT_ROOT = get_project_root()
 DB_PATH = PROJECT_ROOT / ".agent" / "inputs" / "athena.db"
+BUSY_TIMEOUT_S = 30  # Swarm writers queue on the WAL write lock
+SUBSCRIBE_BATCH = 100  # Messages delivered (and acked) per receive
+SUBSCRIBE_FALLBACK_S = 5.0  # Re-check the log even without a ring
 
 
 # --- Pydantic Models ---
@@ -54,52 +61,75 @@ class SessionStatus(BaseModel):
 
 
 class SessionsRPC:
-    """SQLite-backed message bus for inter-agent communication."""
+    """
+    SQLite-backed message bus for inter-agent communication.
+
+    Each thread keeps one open connection (WAL pragmas applied once), so
+    calls reuse sqlite3's prepared-statement cache instead of reconnecting.
+    """
 
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self.bus_dir = bus_dir_for(Path(db_path).parent / "swarm_bus")
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, timeout=BUSY_TIMEOUT_S, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
         return conn
 
+    def close(self):
+        """Close every pooled connection (they reopen lazily on next use)."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
     def init_tables(self):
         """Create swarm tables if they don't exist."""
         conn = self._get_conn()
-        try:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS swarm_sessions (
-                    session_id TEXT PRIMARY KEY,
-                    role TEXT NOT NULL,
-                    goal TEXT,
-                    status TEXT DEFAULT 'active',
-                    metadata TEXT,
-                    created_at REAL NOT NULL,
-                    updated_at REAL NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS swarm_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    from_session TEXT NOT NULL,
-                    to_session TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    msg_type TEXT DEFAULT 'text',
-                    timestamp REAL NOT NULL,
-                    read INTEGER DEFAULT 0
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_messages_to
-                    ON swarm_messages(to_session, timestamp);
-                CREATE INDEX IF NOT EXISTS idx_messages_from
-                    ON swarm_messages(from_session, timestamp);
-            """)
-            conn.commit()
-            logger.info("✅ Swarm RPC tables initialized.")
-        finally:
-            conn.close()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS swarm_sessions (
+                session_id TEXT PRIMARY KEY,
+                role TEXT NOT NULL,
+                goal TEXT,
+                status TEXT DEFAULT 'active',
+                metadata TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS swarm_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                from_session TEXT NOT NULL,
+                to_session TEXT NOT NULL,
+                content TEXT NOT NULL,
+                msg_type TEXT DEFAULT 'text',
+                timestamp REAL NOT NULL,
+                read INTEGER DEFAULT 0
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_messages_to
+                ON swarm_messages(to_session, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_messages_from
+                ON swarm_messages(from_session, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_messages_unread
+                ON swarm_messages(to_session) WHERE read = 0;
+        """)
+        conn.commit()
+        logger.info("✅ Swarm RPC tables initialized.")
 
     def register_session(self, reg: SessionRegister) -> Dict[str, Any]:
         """Register a new swarm session. Returns the session record."""
@@ -108,123 +138,322 @@ class SessionsRPC:
         metadata_str = str(reg.metadata) if reg.metadata else None
 
         conn = self._get_conn()
-        try:
+        with conn:
             conn.execute(
                 """INSERT OR REPLACE INTO swarm_sessions
                    (session_id, role, goal, status, metadata, created_at, updated_at)
                    VALUES (?, ?, ?, 'active', ?, ?, ?)""",
                 (session_id, reg.role, reg.goal, metadata_str, now, now),
             )
-            conn.commit()
-            logger.info(f"📡 Session registered: {session_id} (role={reg.role})")
-            return {
-                "session_id": session_id,
-                "role": reg.role,
-                "status": "active",
-                "created_at": now,
-            }
-        finally:
-            conn.close()
+        logger.info(f"📡 Session registered: {session_id} (role={reg.role})")
+        return {
+            "session_id": session_id,
+            "role": reg.role,
+            "status": "active",
+            "created_at": now,
+        }
 
     def send_message(self, msg: SessionMessage) -> Dict[str, Any]:
         """Send a message from one session to another."""
+        return self.send_messages([msg])[0]
+
+    def send_messages(self, msgs: List[SessionMessage]) -> List[Dict[str, Any]]:
+        """Send a batch of messages in one transaction (executemany)."""
+        if not msgs:
+            return []
         now = time.time()
         conn = self._get_conn()
-        try:
-            cursor = conn.execute(
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # Hold the write lock: ids are consecutive
+            conn.executemany(
                 """INSERT INTO swarm_messages
                    (from_session, to_session, content, msg_type, timestamp)
                    VALUES (?, ?, ?, ?, ?)""",
-                (msg.from_session, msg.to_session, msg.content, msg.msg_type, now),
+                [(m.from_session, m.to_session, m.content, m.msg_type, now) for m in msgs],
             )
-            conn.commit()
-            msg_id = cursor.lastrowid
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        # Committed: wake subscribers of every recipient
+        for to_session in {m.to_session for m in msgs}:
+            ring(self.bus_dir, to_session)
+
+        first_id = last_id - len(msgs) + 1
+        results = []
+        for msg_id, msg in enumerate(msgs, start=first_id):
             logger.info(
                 f"💬 Message #{msg_id}: {msg.from_session} → {msg.to_session} ({msg.msg_type})"
             )
-            return {
-                "id": msg_id,
-                "from": msg.from_session,
-                "to": msg.to_session,
-                "timestamp": now,
-                "status": "delivered",
-            }
-        finally:
-            conn.close()
+            results.append(
+                {
+                    "id": msg_id,
+                    "from": msg.from_session,
+                    "to": msg.to_session,
+                    "timestamp": now,
+                    "status": "delivered",
+                }
+            )
+        return results
 
     def get_history(
         self, session_id: str, limit: int = 50, unread_only: bool = False
     ) -> List[Dict[str, Any]]:
         """Get message history for a session (messages sent TO this session)."""
+        query = """SELECT id, from_session, to_session, content, msg_type, timestamp, read
+                   FROM swarm_messages
+                   WHERE to_session = ?"""
+        if unread_only:
+            query += " AND read = 0"
+        query += " ORDER BY timestamp DESC LIMIT ?"
+
         conn = self._get_conn()
-        try:
-            query = """SELECT id, from_session, to_session, content, msg_type, timestamp, read
-                       FROM swarm_messages
-                       WHERE to_session = ?"""
-            params: list = [session_id]
+        with conn:
+            # Read and mark in one write transaction, so concurrent pollers
+            # never both receive the same unread message.
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(query, (session_id, limit)).fetchall()
+
+            # Mark as read
+            unread_ids = [(r["id"],) for r in rows if not r["read"]]
+            if unread_ids:
+                conn.executemany(
+                    "UPDATE swarm_messages SET read = 1 WHERE id = ?", unread_ids
+                )
 
-            if unread_only:
-                query += " AND read = 0"
+        return [dict(r) for r in rows]
 
-            query += " ORDER BY timestamp DESC LIMIT ?"
-            params.append(limit)
+    def subscribe(self, session_id: str, batch_size: int = SUBSCRIBE_BATCH) -> "Subscription":
+        """Push-style delivery of messages sent to session_id (see Subscription)."""
+        return Subscription(self, session_id, batch_size)
 
-            rows = conn.execute(query, params).fetchall()
+    def _fetch_unread(
+        self, session_id: str, after_id: int, limit: int, mark_read: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Unread messages for a session in delivery order (oldest first).
+        With mark_read, they are read and marked in one write transaction
+        (as in get_history), so concurrent subscribers and pollers never
+        both receive the same message.
+        """
+        query = """SELECT id, from_session, to_session, content, msg_type, timestamp, read
+                   FROM swarm_messages
+                   WHERE to_session = ? AND read = 0 AND id > ?
+                   ORDER BY id LIMIT ?"""
+        conn = self._get_conn()
+        if not mark_read:
+            return [dict(r) for r in conn.execute(query, (session_id, after_id, limit))]
 
-            # Mark as read
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(query, (session_id, after_id, limit)).fetchall()
             if rows:
-                ids = [r["id"] for r in rows]
-                placeholders = ",".join(["?"] * len(ids))
-                conn.execute(
-                    f"UPDATE swarm_messages SET read = 1 WHERE id IN ({placeholders})",
-                    ids,
+                conn.executemany(
+                    "UPDATE swarm_messages SET read = 1 WHERE id = ?",
+                    [(r["id"],) for r in rows],
                 )
-                conn.commit()
+        return [dict(r) for r in rows]
 
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+    def ack(self, message_ids: List[int]):
+        """Mark a batch of messages as read in one transaction."""
+        if not message_ids:
+            return
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                "UPDATE swarm_messages SET read = 1 WHERE id = ?",
+                [(mid,) for mid in message_ids],
+            )
 
     def list_sessions(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all swarm sessions, optionally filtered by status."""
-        conn = self._get_conn()
-        try:
-            if status:
-                rows = conn.execute(
-                    "SELECT * FROM swarm_sessions WHERE status = ? ORDER BY created_at DESC",
-                    (status,),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM swarm_sessions ORDER BY created_at DESC"
-                ).fetchall()
-
-            result = []
-            for r in rows:
-                session = dict(r)
-                # Count unread messages
-                unread = conn.execute(
-                    "SELECT COUNT(*) FROM swarm_messages WHERE to_session = ? AND read = 0",
-                    (r["session_id"],),
-                ).fetchone()[0]
-                session["unread_messages"] = unread
-                result.append(session)
-
-            return result
-        finally:
-            conn.close()
+        """List all swarm sessions (with unread counts), optionally filtered by status."""
+        # One aggregate over the partial unread index instead of a COUNT per session
+        query = """SELECT s.*, COALESCE(u.unread, 0) AS unread_messages
+                   FROM swarm_sessions s
+                   LEFT JOIN (
+                       SELECT to_session, COUNT(*) AS unread
+                       FROM swarm_messages WHERE read = 0
+                       GROUP BY to_session
+                   ) u ON u.to_session = s.session_id"""
+        params: tuple = ()
+        if status:
+            query += " WHERE s.status = ?"
+            params = (status,)
+        query += " ORDER BY s.created_at DESC"
+
+        rows = self._get_conn().execute(query, params).fetchall()
+        return [dict(r) for r in rows]
 
     def update_status(self, update: SessionStatus) -> Dict[str, Any]:
         """Update a session's status (active, completed, error)."""
         now = time.time()
         conn = self._get_conn()
-        try:
+        with conn:
             conn.execute(
                 "UPDATE swarm_sessions SET status = ?, updated_at = ? WHERE session_id = ?",
                 (update.status, now, update.session_id),
             )
-            conn.commit()
-            logger.info(f"📡 Session {update.session_id} → {update.status}")
-            return {"session_id": update.session_id, "status": update.status}
-        finally:
-            conn.close()
+        logger.info(f"📡 Session {update.session_id} → {update.status}")
+        return {"session_id": update.session_id, "status": update.status}
+
+
+class Subscription:
+    """
+    New messages for one session, pushed instead of polled.
+
+    The doorbell is bound before the first log check, so a message
+    committed at any point after subscribe() wakes receive() within
+    milliseconds. Each receive() returns up to batch_size messages,
+    oldest first, claimed and acked in the same transaction, so each
+    message reaches exactly one of several subscribers or get_history
+    pollers on a session. ack=False leaves them unread in the log (e.g.
+    to ack after processing with rpc.ack()) and gives no such guarantee.
+
+    Usage:
+        with rpc.subscribe("master") as sub:
+            for batch in sub:                 # or: await sub.areceive()
+                handle(batch)
+    """
+
+    def __init__(self, rpc: SessionsRPC, session_id: str, batch_size: int = SUBSCRIBE_BATCH):
+        self.rpc = rpc
+        self.session_id = session_id
+        self.batch_size = batch_size
+        self.doorbell = Doorbell(rpc.bus_dir, session_id)
+        self._last_id = 0  # Highest id delivered to this subscription
+
+    def _take(self, ack: bool) -> List[Dict[str, Any]]:
+        batch = self.rpc._fetch_unread(
+            self.session_id, self._last_id, self.batch_size, mark_read=ack
+        )
+        if batch:
+            self._last_id = batch[-1]["id"]
+        return batch
+
+    def receive(self, timeout: Optional[float] = None, ack: bool = True) -> List[Dict[str, Any]]:
+        """Next batch of messages; [] if none arrived within timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self._take(ack)
+            if batch:
+                return batch
+            wait = SUBSCRIBE_FALLBACK_S
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return []
+            self.doorbell.wait(wait)
+
+    async def areceive(self, timeout: Optional[float] = None, ack: bool = True) -> List[Dict[str, Any]]:
+        """asyncio variant of receive(): waits on the doorbell via the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            batch = await loop.run_in_executor(None, self._take, ack)
+            if batch:
+                return batch
+            wait = SUBSCRIBE_FALLBACK_S
+            if deadline is not None:
+                wait = min(wait, deadline - loop.time())
+                if wait <= 0:
+                    return []
+            rung = asyncio.Event()
+            loop.add_reader(self.doorbell.fileno(), rung.set)
+            try:
+                await asyncio.wait_for(rung.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                loop.remove_reader(self.doorbell.fileno())
+            self.doorbell.drain()
+
+    def __iter__(self):
+        while True:
+            yield self.receive()
+
+    def close(self):
+        self.doorbell.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Benchmark ---
+
+
+def benchmark(
+    agent_counts: tuple = (10, 100, 1000),
+    messages_per_agent: int = 20,
+    batch_size: int = 5,
+    max_threads: int = 32,
+) -> List[Dict[str, Any]]:
+    """
+    Swarm throughput: N agents each register, send messages_per_agent
+    messages to the master (in batches) and poll their own inbox, while
+    the master lists sessions. Runs against a throwaway database.
+    """
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    def run_agent(rpc: SessionsRPC, i: int) -> int:
+        sid = f"agent-{i}"
+        rpc.register_session(SessionRegister(session_id=sid, role="worker"))
+        ops = 1
+        for start in range(0, messages_per_agent, batch_size):
+            count = min(batch_size, messages_per_agent - start)
+            rpc.send_messages(
+                [
+                    SessionMessage(from_session=sid, to_session="master", content=f"m{start + k}")
+                    for k in range(count)
+                ]
+            )
+            rpc.get_history(sid, limit=10, unread_only=True)
+            ops += 2
+        if i % 10 == 0:
+            rpc.list_sessions()
+            ops += 1
+        return ops
+
+    results = []
+    for agents in agent_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            rpc = SessionsRPC(db_path=Path(tmp) / "bench.db")
+            rpc.init_tables()
+            rpc.register_session(SessionRegister(session_id="master", role="master"))
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=min(agents, max_threads)) as pool:
+                ops = sum(pool.map(partial(run_agent, rpc), range(agents)))
+            elapsed = time.perf_counter() - started
+
+            sessions = rpc.list_sessions()
+            rpc.close()
+
+        results.append(
+            {
+                "agents": agents,
+                "messages": agents * messages_per_agent,
+                "ops": ops,
+                "seconds": round(elapsed, 3),
+                "msgs_per_s": round(agents * messages_per_agent / elapsed),
+                "ops_per_s": round(ops / elapsed),
+                "master_unread": next(s["unread_messages"] for s in sessions if s["session_id"] == "master"),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--bench" in sys.argv:
+        print(f"{'agents':>7} {'messages':>9} {'seconds':>8} {'msgs/s':>8} {'ops/s':>8}")
+        for row in benchmark():
+            print(
+                f"{row['agents']:>7} {row['messages']:>9} {row['seconds']:>8} "
+                f"{row['msgs_per_s']:>8} {row['ops_per_s']:>8}"
+            )
+    else:
+        print("Usage: python -m athena.core.sessions_rpc --bench")
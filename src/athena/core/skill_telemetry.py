@@ -8,6 +8,11 @@ for Athena's solo-operator, local-first architecture.
 
 Philosophy: "You can't improve what you don't measure."
 
+Storage: the JSONL file is the append log; a roll-up table keyed by
+(day, skill) is maintained incrementally next to it (only bytes appended
+since the last query are parsed), so stats cost O(days × skills), not
+O(all events). Logs past MAX_LOG_BYTES are rotated once rolled up.
+
 Usage:
     from athena.core.skill_telemetry import log_skill_invocation, get_skill_stats
 
@@ -17,16 +22,27 @@ Usage:
 
 import json
 import os
-import time
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from athena.core.config import get_project_root
 
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, writers in one process only
+    fcntl = None
+
 
 # --- CONFIGURATION ---
 
+ROLLUP_VERSION = 1
+MAX_LOG_BYTES = 5 * 1024 * 1024  # Rotate the append log past this size
+ROTATED_LOGS = 2  # skill_usage.jsonl.1 … .N are kept for forensics
+ROLLUP_RETENTION_DAYS = 400  # Day buckets older than this are dropped
+
 
 def _get_telemetry_path() -> Path:
     """Returns the path to the skill usage JSONL log."""
@@ -36,6 +52,28 @@ def _get_telemetry_path() -> Path:
     return telemetry_dir / "skill_usage.jsonl"
 
 
+def _rollup_path(path: Path) -> Path:
+    return path.with_name(path.stem + ".rollup.json")
+
+
+@contextmanager
+def _locked(path: Path, exclusive: bool):
+    """Appenders share the lock; roll-up and rotation take it exclusively."""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def _append(record: dict):
+    path = _get_telemetry_path()
+    with _locked(path, exclusive=False):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
 # --- CORE API ---
 
 
@@ -66,10 +104,7 @@ def log_skill_invocation(
     if metadata:
         record["meta"] = metadata
 
-    path = _get_telemetry_path()
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
-
+    _append(record)
     return record
 
 
@@ -95,52 +130,118 @@ def log_skill_change(
         "timestamp": datetime.now().isoformat(),
     }
 
-    path = _get_telemetry_path()
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
-
+    _append(record)
     return record
 
 
-def _read_log(days: Optional[int] = None) -> list[dict]:
+def _empty_rollup() -> dict:
+    return {"version": ROLLUP_VERSION, "offset": 0, "days": {}}
+
+
+def _load_rollup(rollup_path: Path) -> dict:
+    try:
+        data = json.loads(rollup_path.read_text(encoding="utf-8"))
+        if data.get("version") == ROLLUP_VERSION:
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return _empty_rollup()
+
+
+def _save_rollup(rollup_path: Path, data: dict):
+    fd, tmp = tempfile.mkstemp(dir=rollup_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, rollup_path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _add_to_rollup(days: dict, record: dict):
+    """Fold one invocation into its (day, skill) bucket."""
+    # Filter: only invocations (not skill_change events)
+    if record.get("event") == "skill_change":
+        return
+    timestamp = record.get("timestamp", "")
+    bucket = days.setdefault(timestamp[:10], {}).setdefault(
+        record.get("skill", "unknown"),
+        {"count": 0, "auto_count": 0, "last_used": "", "sessions": []},
+    )
+    bucket["count"] += 1
+    bucket["last_used"] = max(bucket["last_used"], timestamp)
+    session = record.get("session")
+    if session and session not in bucket["sessions"]:
+        bucket["sessions"].append(session)
+    if record.get("trigger") == "auto":
+        bucket["auto_count"] += 1
+
+
+def _ingest(path: Path, data: dict) -> bool:
+    """Roll up complete lines appended since data["offset"]. Returns True if any."""
+    with open(path, "rb") as f:
+        f.seek(data["offset"])
+        chunk = f.read()
+    end = chunk.rfind(b"\n") + 1  # A torn last line waits for its newline
+    if end == 0:
+        return False
+    for line in chunk[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            _add_to_rollup(data["days"], record)
+    data["offset"] += end
+    return True
+
+
+def _rotate(path: Path):
+    for i in range(ROTATED_LOGS, 0, -1):
+        src = path if i == 1 else path.with_name(f"{path.name}.{i - 1}")
+        if src.exists():
+            os.replace(src, path.with_name(f"{path.name}.{i}"))
+
+
+def refresh_rollup() -> dict:
     """
-    Read the JSONL log and return records, optionally filtered by recency.
-
-    Args:
-        days: If set, only return records from the last N days.
+    Bring the (day, skill) roll-up up to date with the append log and
+    return it. Only new bytes are parsed; the log is rotated once it is
+    fully rolled up and past MAX_LOG_BYTES.
     """
     path = _get_telemetry_path()
-    if not path.exists():
-        return []
-
-    cutoff = None
-    if days is not None:
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-
-    records = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-                # Filter: only invocations (not skill_change events)
-                if record.get("event") == "skill_change":
-                    continue
-                if cutoff and record.get("timestamp", "") < cutoff:
-                    continue
-                records.append(record)
-            except json.JSONDecodeError:
-                continue
-
-    return records
+    rollup_path = _rollup_path(path)
+    with _locked(path, exclusive=True):
+        data = _load_rollup(rollup_path)
+        size = path.stat().st_size if path.exists() else 0
+        changed = False
+        if size < data["offset"]:  # Log replaced or truncated outside of rotation
+            data["offset"] = 0
+            changed = True
+        if size > data["offset"]:
+            changed |= _ingest(path, data)
+        if data["offset"] >= MAX_LOG_BYTES:
+            _rotate(path)
+            data["offset"] = 0
+            changed = True
+
+        horizon = (datetime.now() - timedelta(days=ROLLUP_RETENTION_DAYS)).date().isoformat()
+        for day in [d for d in data["days"] if d < horizon]:
+            del data["days"][day]
+            changed = True
+
+        if changed:
+            _save_rollup(rollup_path, data)
+    return data
 
 
 def get_skill_stats(days: int = 30) -> dict:
     """
     Get aggregated skill usage statistics.
 
+    The window is in whole days: today plus the previous `days` days.
+
     Returns:
         {
             "total_invocations": int,
@@ -157,26 +258,25 @@ def get_skill_stats(days: int = 30) -> dict:
             "top_skills": [("Protocol 367", 12), ...],
         }
     """
-    records = _read_log(days=days)
+    rollup = refresh_rollup()
+    cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
 
     skills: dict = {}
-    for r in records:
-        name = r.get("skill", "unknown")
-        if name not in skills:
-            skills[name] = {
-                "count": 0,
-                "last_used": "",
-                "sessions": set(),
-                "auto_count": 0,
-            }
-        skills[name]["count"] += 1
-        skills[name]["last_used"] = max(
-            skills[name]["last_used"], r.get("timestamp", "")
-        )
-        if r.get("session"):
-            skills[name]["sessions"].add(r["session"])
-        if r.get("trigger") == "auto":
-            skills[name]["auto_count"] += 1
+    for day, buckets in rollup["days"].items():
+        if day < cutoff:
+            continue
+        for name, bucket in buckets.items():
+            if name not in skills:
+                skills[name] = {
+                    "count": 0,
+                    "last_used": "",
+                    "sessions": set(),
+                    "auto_count": 0,
+                }
+            skills[name]["count"] += bucket["count"]
+            skills[name]["last_used"] = max(skills[name]["last_used"], bucket["last_used"])
+            skills[name]["sessions"].update(bucket["sessions"])
+            skills[name]["auto_count"] += bucket["auto_count"]
 
     # Serialize sets to lists and compute auto_pct
     result_skills = {}
@@ -194,7 +294,7 @@ def get_skill_stats(days: int = 30) -> dict:
     )
 
     return {
-        "total_invocations": len(records),
+        "total_invocations": sum(data["count"] for data in result_skills.values()),
         "unique_skills": len(result_skills),
         "skills": result_skills,
         "top_skills": [(name, data["count"]) for name, data in top_skills[:10]],
@@ -0,0 +1,222 @@
+"""
+athena.core.state_store
+=======================
+Shared key/value store for small engine state (``.agent/state/state.db``).
+
+Replaces the per-engine JSON files (exchange_state.json, permissions.json)
+that were rewritten synchronously, and non-atomically, on every call.
+
+    - SQLite in WAL mode: readers never block on the writer, and every
+      process sees the same committed state.
+    - Writes land in memory immediately and are coalesced by a background
+      flusher (one transaction per FLUSH_INTERVAL), so the hot path never
+      waits on disk.
+    - Multi-key updates are atomic: applied together in memory, committed
+      in one transaction.
+    - Only changed keys are upserted, so two processes touching different
+      keys of the same namespace do not clobber each other.
+    - Commits by other processes are picked up via PRAGMA data_version.
+
+Usage:
+    store = get_state_store()
+    store.get("governance")                          # dict snapshot
+    store.update("governance", {"web_search_performed": True})
+    store.flush()                                    # optional; also at exit
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from athena.core.config import STATE_DIR
+
+STATE_DB_PATH = STATE_DIR / "state.db"
+FLUSH_INTERVAL = 0.05  # Seconds; coalescing window for background writes
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+class StateStore:
+    """Write-behind view over a WAL SQLite key/value table."""
+
+    def __init__(self, path: Path = STATE_DB_PATH, flush_interval: float = FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._writer = self._connect()
+        self._writer.executescript(_SCHEMA)
+        self._reader = self._connect()
+
+        self._lock = threading.Lock()  # Guards _cache / _pending / _data_version
+        self._write_lock = threading.Lock()  # Serializes commits
+        self._cache: dict[str, dict[str, Any]] = {}
+        self._pending: dict[tuple[str, str], str] = {}
+        self._inflight: dict[tuple[str, str], str] = {}  # Swapped out, not yet committed
+        self._data_version: Optional[int] = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+        self._closed_conn = False
+        self.flushes = 0
+
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="athena-state-flush", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.path), timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # --- Reads ---
+
+    def _sync(self):
+        """Drop cached namespaces if another connection committed (lock held)."""
+        version = self._reader.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._cache.clear()
+
+    def _namespace(self, namespace: str) -> dict[str, Any]:
+        """Cached namespace with unflushed local writes overlaid (lock held)."""
+        self._sync()
+        data = self._cache.get(namespace)
+        if data is None:
+            rows = self._reader.execute(
+                "SELECT key, value FROM kv WHERE namespace = ?", (namespace,)
+            ).fetchall()
+            data = {key: json.loads(value) for key, value in rows}
+            for overlay in (self._inflight, self._pending):
+                for (ns, key), value in overlay.items():
+                    if ns == namespace:
+                        data[key] = json.loads(value)
+            self._cache[namespace] = data
+        return data
+
+    def get(self, namespace: str) -> dict[str, Any]:
+        """Snapshot of a namespace (local writes visible immediately)."""
+        with self._lock:
+            return dict(self._namespace(namespace))
+
+    # --- Writes ---
+
+    def update(self, namespace: str, values: dict[str, Any]) -> dict[str, Any]:
+        """
+        Atomically set several keys. Returns the namespace as it was just
+        before the update, so callers can read-and-reset in one step.
+        Persisted by the background flusher.
+        """
+        encoded = {key: json.dumps(value) for key, value in values.items()}
+        with self._lock:
+            data = self._namespace(namespace)
+            previous = dict(data)
+            data.update(values)
+            for key, value in encoded.items():
+                self._pending[(namespace, key)] = value
+        self._wakeup.set()
+        return previous
+
+    def seed(self, namespace: str, legacy_path: Optional[Path]) -> dict[str, Any]:
+        """Import a legacy JSON state file into an empty namespace, once."""
+        data = self.get(namespace)
+        if data or not legacy_path or not Path(legacy_path).exists():
+            return data
+        try:
+            legacy = json.loads(Path(legacy_path).read_text())
+        except Exception:
+            return data
+        if isinstance(legacy, dict) and legacy:
+            self.update(namespace, legacy)
+        return self.get(namespace)
+
+    def flush(self):
+        """Commit all pending writes in a single transaction."""
+        with self._write_lock:
+            if self._closed_conn:
+                return
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+            if not pending:
+                return
+            try:
+                self._writer.execute("BEGIN IMMEDIATE")
+                self._writer.executemany(
+                    "INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                    [(ns, key, value) for (ns, key), value in pending.items()],
+                )
+                self._writer.execute("COMMIT")
+                self.flushes += 1
+            except sqlite3.Error:
+                if self._writer.in_transaction:
+                    self._writer.execute("ROLLBACK")
+                with self._lock:  # Retry on the next flush; newer writes win
+                    for item, value in pending.items():
+                        self._pending.setdefault(item, value)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+    def _flush_loop(self):
+        while not self._stop.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stop.wait(self.flush_interval):  # Let a burst coalesce
+                break
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        """Flush and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._wakeup.set()
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+        with self._write_lock:
+            self._closed_conn = True
+            self._writer.close()
+        with self._lock:
+            self._reader.close()
+
+
+_stores: dict[str, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(path: Optional[Path] = None) -> StateStore:
+    """Shared StateStore per database path (default: .agent/state/state.db)."""
+    key = str(Path(path or STATE_DB_PATH).resolve())
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = _stores[key] = StateStore(Path(key))
+    return store
@@ -0,0 +1,460 @@
+"""
+athena.core.supervisor
+======================
+Lightweight supervisor for Athena background services (athenad, sidecar).
+
+Per service, under .agent/state/services/:
+    <name>.lock  POSIX record lock (lockf) held for the lifetime of the
+                 (single) instance
+    <name>.pid   pid of the lock holder
+    <name>.sock  unix-socket health endpoint (one JSON status per connect)
+    <name>.stats.json
+                 stats the supervised child publishes (publish_stats());
+                 the runner serves them on the health socket as "stats"
+
+`ensure_running()` tests the lock without taking it (F_TEST: no pgrep, no
+subprocess, and no window in which a probe blocks a starting runner or
+another probe) and, only if
+the service is down, spawns `python -m athena.core.supervisor run <name>`.
+That runner owns the lock and the health socket, runs the service script
+as a child and restarts it with exponential backoff if it crashes. A
+second runner for the same service exits immediately.
+
+Usage:
+    from athena.core.supervisor import ensure_running, status
+
+    ensure_running("athenad")
+    status("athenad")  # {"name": ..., "state": "running", "pid": ..., ...}
+
+    athena services status
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from athena.core.config import AGENT_DIR, PROJECT_ROOT, STATE_DIR
+
+RUN_DIR = STATE_DIR / "services"
+SDK_PATH = Path(__file__).resolve().parents[2]  # src/
+
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 60.0
+STABLE_AFTER_SECONDS = 60.0  # A run this long resets the backoff
+HEALTH_TIMEOUT_SECONDS = 0.5
+SUPERVISED_ENV = "ATHENA_SUPERVISED"
+STATS_ENV = "ATHENA_SERVICE_STATS"  # Where a supervised child publishes its stats
+HAS_LOCKF = hasattr(os, "lockf")  # False on Windows: pidfile liveness only
+
+# Lock files claimed by this process. POSIX locks are per process: F_TEST
+# does not see our own lock, and closing any fd on the file would drop it.
+_held_locks: set[str] = set()
+_held_guard = threading.Lock()  # Serializes in-process probes with claims/releases
+
+
+@dataclass
+class ServiceSpec:
+    name: str
+    script: Path
+    description: str = ""
+
+
+SERVICES = {
+    "athenad": ServiceSpec(
+        "athenad",
+        Path(__file__).resolve().parent / "athenad.py",
+        "File watcher + local/graph indexer",
+    ),
+    "sidecar": ServiceSpec(
+        "sidecar", AGENT_DIR / "scripts" / "sidecar.py", "Sovereign index sidecar"
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Paths & probes
+# ---------------------------------------------------------------------------
+
+
+def _lock_path(name: str, run_dir: Path = RUN_DIR) -> Path:
+    return Path(run_dir) / f"{name}.lock"
+
+
+def _pid_path(name: str, run_dir: Path = RUN_DIR) -> Path:
+    return Path(run_dir) / f"{name}.pid"
+
+
+def _stats_path(name: str, run_dir: Path = RUN_DIR) -> Path:
+    return Path(run_dir) / f"{name}.stats.json"
+
+
+def socket_path(name: str, run_dir: Path = RUN_DIR) -> str:
+    """Health socket path (falls back to the temp dir past the AF_UNIX length limit)."""
+    path = str(Path(run_dir) / f"{name}.sock")
+    if len(path) < 100:
+        return path
+    digest = hashlib.sha1(str(run_dir).encode()).hexdigest()[:10]
+    return os.path.join(tempfile.gettempdir(), f"athena-{digest}-{name}.sock")
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+
+def read_pid(name: str, run_dir: Path = RUN_DIR) -> Optional[int]:
+    try:
+        return int(_pid_path(name, run_dir).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _lock_key(lock: Path) -> str:
+    return os.path.abspath(lock)
+
+
+def is_running(name: str, run_dir: Path = RUN_DIR) -> bool:
+    """True if some process holds the service lock (O(1), no subprocess)."""
+    lock = _lock_path(name, run_dir)
+    if not HAS_LOCKF:
+        return _pid_alive(read_pid(name, run_dir))
+    with _held_guard:
+        if _lock_key(lock) in _held_locks:
+            return True
+        try:
+            fd = os.open(lock, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+        try:
+            os.lockf(fd, os.F_TEST, 0)  # Tests only; never takes the lock
+            return False
+        except (BlockingIOError, PermissionError):  # EAGAIN / EACCES: held elsewhere
+            return True
+        finally:
+            os.close(fd)
+
+
+def probe(name: str, run_dir: Path = RUN_DIR, timeout: float = HEALTH_TIMEOUT_SECONDS):
+    """Query the service's health socket. Returns its status dict or None."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            s.connect(socket_path(name, run_dir))
+            chunks = []
+            while chunk := s.recv(4096):
+                chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+
+def status(name: str, run_dir: Path = RUN_DIR) -> dict:
+    """
+    Service state from the lock and the health socket.
+
+    state: "running" | "unresponsive" (lock held, no health reply) |
+           "stopped" | "missing" (script not found).
+    """
+    spec = SERVICES.get(name)
+    result = {"name": name, "state": "stopped", "pid": None}
+    if is_running(name, run_dir):
+        result["pid"] = read_pid(name, run_dir)
+        health = probe(name, run_dir)
+        if health:
+            result.update(health, state="running")
+        else:
+            result["state"] = "unresponsive"
+    elif spec is not None and not spec.script.exists():
+        result["state"] = "missing"
+    return result
+
+
+def status_all(run_dir: Path = RUN_DIR) -> list[dict]:
+    return [status(name, run_dir) for name in SERVICES]
+
+
+# ---------------------------------------------------------------------------
+# Single-instance claim + health endpoint
+# ---------------------------------------------------------------------------
+
+
+class ServiceClaim:
+    """Holds a service's lock, pidfile and health socket for this process."""
+
+    def __init__(self, name: str, info: Callable[[], dict], run_dir: Path = RUN_DIR):
+        self.name = name
+        self.info = info
+        self.run_dir = Path(run_dir)
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[socket.socket] = None
+        self.started_at = time.time()
+
+    def acquire(self) -> bool:
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        lock = _lock_path(self.name, self.run_dir)
+        if not HAS_LOCKF:
+            if _pid_alive(read_pid(self.name, self.run_dir)):
+                return False
+        else:
+            with _held_guard:
+                if _lock_key(lock) in _held_locks:
+                    return False
+                fd = os.open(lock, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    os.lockf(fd, os.F_TLOCK, 0)
+                except OSError:
+                    os.close(fd)
+                    return False
+                self._lock_fd = fd
+                _held_locks.add(_lock_key(lock))
+        _pid_path(self.name, self.run_dir).write_text(str(os.getpid()))
+        self._serve_health()
+        return True
+
+    def _serve_health(self):
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        path = socket_path(self.name, self.run_dir)
+        try:
+            os.unlink(path)  # Stale socket from a crashed holder; we own the lock now
+        except FileNotFoundError:
+            pass
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen(8)
+        threading.Thread(
+            target=self._health_loop, name=f"{self.name}-health", daemon=True
+        ).start()
+
+    def _health_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return  # Socket closed on release
+            with conn:
+                payload = {
+                    "name": self.name,
+                    "pid": os.getpid(),
+                    "uptime": round(time.time() - self.started_at, 1),
+                    **self.info(),
+                }
+                try:
+                    conn.sendall(json.dumps(payload).encode())
+                except OSError:
+                    pass
+
+    def release(self):
+        if self._server is not None:
+            try:
+                self._server.shutdown(socket.SHUT_RDWR)  # Wakes the blocked accept()
+            except OSError:
+                pass
+            self._server.close()
+            try:
+                os.unlink(socket_path(self.name, self.run_dir))
+            except OSError:
+                pass
+        try:
+            if read_pid(self.name, self.run_dir) == os.getpid():
+                _pid_path(self.name, self.run_dir).unlink()
+        except OSError:
+            pass
+        if self._lock_fd is not None:
+            with _held_guard:
+                _held_locks.discard(_lock_key(_lock_path(self.name, self.run_dir)))
+                os.close(self._lock_fd)  # Drops the lock
+                self._lock_fd = None
+
+
+def claim(
+    name: str, info: Optional[Callable[[], dict]] = None, run_dir: Path = RUN_DIR
+) -> Optional[ServiceClaim]:
+    """Claim single-instance ownership of a service; None if already running."""
+    handle = ServiceClaim(name, info or (lambda: {}), run_dir)
+    return handle if handle.acquire() else None
+
+
+def publish_stats(stats: dict):
+    """
+    Called by a supervised service: hand its stats to the runner, which
+    serves them on the health socket. No-op when not run by a supervisor.
+    """
+    path = os.environ.get(STATS_ENV)
+    if not path:
+        return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(stats, f)
+        os.replace(tmp, path)  # Readers never see a partial file
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Runner (restart with backoff)
+# ---------------------------------------------------------------------------
+
+
+class ServiceRunner:
+    """Runs a service script as a child and restarts it after crashes."""
+
+    def __init__(self, spec: ServiceSpec, run_dir: Path = RUN_DIR):
+        self.spec = spec
+        self.run_dir = Path(run_dir)
+        self.child: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.last_exit: Optional[int] = None
+        self.backoff = BACKOFF_INITIAL
+        self._stopping = False
+
+    def info(self) -> dict:
+        try:
+            stats = json.loads(_stats_path(self.spec.name, self.run_dir).read_text())
+        except (OSError, ValueError):
+            stats = None
+        return {
+            "child_pid": self.child.pid if self.child else None,
+            "restarts": self.restarts,
+            "last_exit": self.last_exit,
+            "backoff": self.backoff,
+            "stats": stats,
+        }
+
+    def _stop(self, signum, frame):
+        self._stopping = True
+        if self.child and self.child.poll() is None:
+            self.child.terminate()
+
+    def run(self) -> int:
+        handle = claim(self.spec.name, self.info, self.run_dir)
+        if handle is None:
+            pid = read_pid(self.spec.name, self.run_dir)
+            print(f"{self.spec.name} already running (pid {pid})")
+            return 0
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._stop)
+            signal.signal(signal.SIGINT, self._stop)
+        stats_file = _stats_path(self.spec.name, self.run_dir)
+        env = dict(os.environ, **{SUPERVISED_ENV: "1", STATS_ENV: str(stats_file)})
+        try:
+            while not self._stopping:
+                stats_file.unlink(missing_ok=True)  # Only the live child's stats
+                started = time.monotonic()
+                self.child = subprocess.Popen(
+                    [sys.executable, str(self.spec.script)], cwd=PROJECT_ROOT, env=env
+                )
+                self.last_exit = self.child.wait()
+                if self._stopping or self.last_exit == 0:
+                    break  # Clean exit is not a crash
+
+                if time.monotonic() - started >= STABLE_AFTER_SECONDS:
+                    self.backoff = BACKOFF_INITIAL
+                time.sleep(self.backoff)
+                self.backoff = min(self.backoff * 2, BACKOFF_MAX)
+                self.restarts += 1
+        finally:
+            stats_file.unlink(missing_ok=True)
+            handle.release()
+        return 0
+
+
+def ensure_running(name: str) -> tuple[str, bool]:
+    """
+    Start the service under a runner unless an instance already holds its lock.
+
+    Returns:
+        (state, started) — state as in status(); started is True if spawned.
+    """
+    spec = SERVICES[name]
+    if is_running(name):
+        return "running", False
+    if not spec.script.exists():
+        return "missing", False
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SDK_PATH), env.get("PYTHONPATH")) if p
+    )
+    subprocess.Popen(
+        [sys.executable, "-m", "athena.core.supervisor", "run", name],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return "starting", True
+
+
+def stop(name: str) -> bool:
+    """SIGTERM the lock holder (the runner forwards it to the service)."""
+    pid = read_pid(name)
+    if not (is_running(name) and _pid_alive(pid)):
+        return False
+    os.kill(pid, signal.SIGTERM)
+    return True
+
+
+def print_status(run_dir: Path = RUN_DIR):
+    """Render `athena services status`."""
+    icons = {"running": "✅", "unresponsive": "⚠️", "stopped": "⭕", "missing": "❓"}
+    print("\n🛰️  ATHENA SERVICES")
+    print("─" * 60)
+    for s in status_all(run_dir):
+        line = f"   {icons.get(s['state'], '•')} {s['name']:<9} {s['state']:<13}"
+        if s.get("pid"):
+            line += f" pid {s['pid']}"
+        if s.get("child_pid"):
+            line += f" (child {s['child_pid']})"
+        if s.get("uptime") is not None:
+            line += f" up {int(s['uptime'] // 60)}m"
+        if s.get("restarts"):
+            line += f" restarts {s['restarts']}"
+        if (s.get("stats") or {}).get("queue_depth") is not None:
+            line += f" queue {s['stats']['queue_depth']}"
+        print(line.rstrip())
+    print("─" * 60)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Athena service supervisor")
+    parser.add_argument("action", choices=["run", "start", "stop", "status"])
+    parser.add_argument("name", nargs="?", choices=sorted(SERVICES))
+    args = parser.parse_args()
+
+    if args.action == "run" and not args.name:
+        parser.error("run requires a service name")
+    if args.action == "run":
+        sys.exit(ServiceRunner(SERVICES[args.name]).run())
+    elif args.action == "start":
+        for name in [args.name] if args.name else SERVICES:
+            print(f"{name}: {ensure_running(name)[0]}")
+    elif args.action == "stop":
+        for name in [args.name] if args.name else SERVICES:
+            print(f"{name}: {'stopping' if stop(name) else 'not running'}")
+    else:
+        print_status()
@@ -0,0 +1,139 @@
+"""
+athena.core.swarm_bus
+=====================
+Wake-ups for the swarm message bus over unix datagram sockets.
+
+SQLite (athena.core.sessions_rpc) stays the durable log; this only tells
+subscribers "something new arrived for <topic>" so they stop polling.
+
+    - A Doorbell is a datagram socket bound at
+      <bus_dir>/<topic-key>.<pid>.<n>.sock (one per subscriber).
+    - ring(bus_dir, topic) sends one byte to every doorbell of a topic.
+      Rings are best effort and coalesce: a full socket buffer already
+      means "wake up", and sockets left by dead subscribers are removed.
+    - Subscribers still re-check on a fallback timeout, so a lost ring
+      costs latency, never messages. ring() never raises: it runs after
+      the writer committed, and a failure there must not look like a
+      failed send.
+
+Usage:
+    with Doorbell(bus_dir, "master") as bell:
+        ...check the durable log...
+        bell.wait(timeout=5)          # Returns as soon as someone rings
+
+    ring(bus_dir, "master")           # From the writer, after commit
+"""
+
+import hashlib
+import itertools
+import os
+import select
+import socket
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+MAX_SOCKET_PATH = 100  # AF_UNIX paths are limited to ~104-108 bytes
+_KEY_CHARS = 16
+_counter = itertools.count()
+_sender: Optional[socket.socket] = None
+HAS_UNIX_DGRAM = hasattr(socket, "AF_UNIX")  # False on older Windows builds
+
+
+def bus_dir_for(base: Path) -> Path:
+    """Doorbell directory for base (moved to the temp dir if paths would be too long)."""
+    base = Path(base)
+    if len(str(base)) + _KEY_CHARS + 32 < MAX_SOCKET_PATH:
+        return base
+    digest = hashlib.sha1(str(base).encode()).hexdigest()[:10]
+    return Path(tempfile.gettempdir()) / f"athena-bus-{digest}"
+
+
+def topic_key(topic: str) -> str:
+    """Filesystem-safe, fixed-length key for a topic."""
+    return hashlib.sha1(topic.encode()).hexdigest()[:_KEY_CHARS]
+
+
+class Doorbell:
+    """A subscriber's wake-up socket for one topic."""
+
+    def __init__(self, bus_dir: Path, topic: str):
+        self.bus_dir = Path(bus_dir)
+        self.topic = topic
+        self.bus_dir.mkdir(parents=True, exist_ok=True)
+        self.path = str(
+            self.bus_dir / f"{topic_key(topic)}.{os.getpid()}.{next(_counter)}.sock"
+        )
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._sock.bind(self.path)
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def drain(self) -> int:
+        """Consume pending rings; returns how many were queued."""
+        rings = 0
+        while True:
+            try:
+                self._sock.recv(64)
+                rings += 1
+            except (BlockingIOError, InterruptedError):
+                return rings
+            except OSError:
+                return rings
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until rung (True) or timeout (False)."""
+        if self.drain():
+            return True
+        readable, _, _ = select.select([self._sock], [], [], timeout)
+        return bool(readable) and self.drain() > 0
+
+    def close(self):
+        self._sock.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def ring(bus_dir: Path, topic: str) -> int:
+    """Wake every doorbell subscribed to topic. Returns how many were reached."""
+    global _sender
+    if _sender is None:
+        if not HAS_UNIX_DGRAM:
+            return 0  # Subscribers fall back to their timed re-check
+        try:
+            sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sender.setblocking(False)
+        except OSError:
+            return 0
+        _sender = sender
+
+    prefix = topic_key(topic) + "."
+    reached = 0
+    try:
+        entries = [e.path for e in os.scandir(bus_dir) if e.name.startswith(prefix)]
+    except OSError:
+        return 0
+    for path in entries:
+        try:
+            _sender.sendto(b"!", path)
+            reached += 1
+        except BlockingIOError:
+            reached += 1  # Buffer full: a wake-up is already pending
+        except (ConnectionRefusedError, FileNotFoundError):
+            try:
+                os.unlink(path)  # Nobody bound: subscriber died without closing
+            except FileNotFoundError:
+                pass
+        except OSError:
+            pass
+    return reached
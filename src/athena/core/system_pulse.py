@@ -5,7 +5,7 @@ Real-time Health Dashboard (System Pulse).
 Displays connectivity, memory, and daemon status.
 """
 
-import json
+import time
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -14,11 +14,28 @@ FLIGHT_RECORDER = PROJECT_ROOT / ".athena" / "flight_recorder.jsonl"
 
 
 def get_daemon_status():
+    """athenad state from the supervisor lock + health socket (no pgrep)."""
     try:
-        import subprocess
+        from athena.core.supervisor import status
 
-        res = subprocess.run(["pgrep", "-f", "athenad.py"], capture_output=True)
-        return "ONLINE" if res.returncode == 0 else "OFFLINE"
+        state = status("athenad")["state"]
+        return {"running": "ONLINE", "unresponsive": "DEGRADED"}.get(state, "OFFLINE")
+    except Exception:
+        return "UNKNOWN"
+
+
+def get_service_health():
+    """Connectivity from the published health status (no live probe)."""
+    try:
+        from athena.core.health import read_status
+
+        status = read_status(max_age=None)
+        if not status:
+            return "UNKNOWN (no health check yet)"
+        age_min = int((time.time() - status["checked_at"]) // 60)
+        failed = [n for n, c in status["checks"].items() if c["status"] != "PASS"]
+        detail = f"FAIL: {', '.join(failed)}" if failed else "PASS"
+        return f"{detail} ({age_min}m ago)"
     except Exception:
         return "UNKNOWN"
 
@@ -31,15 +48,15 @@ def get_session_count():
 
 
 def get_last_action():
+    """Newest flight recorder entry, read backward from the end of the log."""
     try:
-        if not FLIGHT_RECORDER.exists():
+        from athena.core.flight_recorder import last_actions
+
+        actions = last_actions(1, log_file=FLIGHT_RECORDER)
+        if not actions:
             return "None"
-        with open(FLIGHT_RECORDER, "r") as f:
-            lines = f.readlines()
-            if not lines:
-                return "None"
-            last = json.loads(lines[-1])
-            return f"{last['tool']} ({last['status']})"
+        last = actions[-1]
+        return f"{last['tool']} ({last['status']})"
     except Exception:
         return "Error"
 
@@ -49,6 +66,7 @@ def main():
     print("      ATHENA SYSTEM PULSE (v8.7.2)")
     print("=" * 40)
     print(f"Daemon Status    : {get_daemon_status()}")
+    print(f"Connectivity     : {get_service_health()}")
     print(f"Total Sessions   : {get_session_count()}")
     print(f"Last Action      : {get_last_action()}")
     print(f"Memory Integrity : SEALED")
@@ -0,0 +1,181 @@
+"""
+athena.core.tool_runtime
+========================
+Shared runtime for the MCP server: a bounded worker pool, a warm-up of the
+heavy singletons, and per-tool latency / cache metrics.
+
+Blocking tool bodies run on the pool (`await runtime.run(name, fn, ...)`),
+so concurrent SSE clients no longer serialize on the event loop, and at
+most MCP_WORKERS calls execute at once.
+
+Metrics per tool: calls, errors, in-flight, p50/p95/p99 over the last
+LATENCY_WINDOW calls, and a cache hit ratio for tools that report one.
+
+Usage:
+    runtime = get_tool_runtime()
+    runtime.warm()
+    result = await runtime.run("smart_search", search_payload, query)
+    runtime.record_cache("smart_search", hit=True)
+    runtime.snapshot()
+"""
+
+import asyncio
+import functools
+import importlib
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from athena import getenv
+
+MCP_WORKERS = int(getenv("ATHENA_MCP_WORKERS") or min(8, (os.cpu_count() or 2) * 2))
+LATENCY_WINDOW = 1024
+
+
+def _percentile(sorted_values: list[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+
+class ToolStats:
+    """Thread-safe per-tool counters and a ring buffer of latencies (ms)."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=window))
+        self._calls = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._in_flight = defaultdict(int)
+        self._cache_hits = defaultdict(int)
+        self._cache_lookups = defaultdict(int)
+
+    def begin(self, tool: str):
+        with self._lock:
+            self._in_flight[tool] += 1
+
+    def end(self, tool: str, elapsed_ms: float, ok: bool):
+        with self._lock:
+            self._in_flight[tool] -= 1
+            self._calls[tool] += 1
+            if not ok:
+                self._errors[tool] += 1
+            self._latencies[tool].append(elapsed_ms)
+
+    def record_cache(self, tool: str, hit: bool):
+        with self._lock:
+            self._cache_lookups[tool] += 1
+            if hit:
+                self._cache_hits[tool] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            tools = set(self._calls) | set(self._in_flight)
+            latencies = {t: sorted(self._latencies[t]) for t in tools}
+            report = {}
+            for tool in sorted(tools):
+                lat = latencies[tool]
+                lookups = self._cache_lookups[tool]
+                report[tool] = {
+                    "calls": self._calls[tool],
+                    "errors": self._errors[tool],
+                    "in_flight": self._in_flight[tool],
+                    "p50_ms": _round(_percentile(lat, 50)),
+                    "p95_ms": _round(_percentile(lat, 95)),
+                    "p99_ms": _round(_percentile(lat, 99)),
+                    "cache_hit_ratio": (
+                        round(self._cache_hits[tool] / lookups, 3) if lookups else None
+                    ),
+                }
+            return report
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+class ToolRuntime:
+    """Bounded executor + metrics shared by all MCP tools."""
+
+    def __init__(self, max_workers: int = MCP_WORKERS):
+        self.max_workers = max_workers
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self.stats = ToolStats()
+        self.started_at = time.time()
+        self.warmed: dict[str, Any] = {}
+
+    def call(self, tool: str, fn: Callable, *args, **kwargs):
+        """Run fn inline with metrics (for cheap in-memory tools)."""
+        self.stats.begin(tool)
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            self.stats.end(tool, (time.perf_counter() - start) * 1000, ok)
+
+    async def run(self, tool: str, fn: Callable, *args, **kwargs):
+        """Run a blocking fn on the worker pool with metrics."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, functools.partial(self.call, tool, fn, *args, **kwargs)
+        )
+
+    def record_cache(self, tool: str, hit: bool):
+        self.stats.record_cache(tool, hit)
+
+    def warm(self) -> dict:
+        """
+        Preload the shared engines so the first tool call does not pay for
+        imports, cache loads or state reads. Each step is best effort.
+        """
+        steps = {
+            "search": lambda: importlib.import_module("athena.tools.search"),
+            "search_cache": lambda: _call("athena.core.cache", "get_search_cache"),
+            "embedding_cache": lambda: _call("athena.memory.vectors", "get_embedding_cache"),
+            "permissions": lambda: _call("athena.core.permissions", "get_permissions"),
+            "governance": lambda: _call("athena.core.governance", "get_governance"),
+            "sessions": lambda: _call("athena.core.session_catalog", "get_session_catalog"),
+        }
+        for name, step in steps.items():
+            start = time.perf_counter()
+            try:
+                step()
+                self.warmed[name] = round((time.perf_counter() - start) * 1000, 1)
+            except Exception as e:
+                self.warmed[name] = f"failed: {e}"
+        return self.warmed
+
+    def snapshot(self) -> dict:
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "workers": self.max_workers,
+            "warmed": self.warmed,
+            "tools": self.stats.snapshot(),
+        }
+
+
+def _call(module: str, attr: str):
+    return getattr(importlib.import_module(module), attr)()
+
+
+_runtime: Optional[ToolRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_tool_runtime() -> ToolRuntime:
+    """Singleton accessor for the MCP tool runtime."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = ToolRuntime()
+    return _runtime
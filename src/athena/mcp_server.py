@@ -8,6 +8,10 @@ standardized MCP tools, consumable by any MCP-compatible client.
 
 Transport: stdio (default), SSE (optional via --sse flag).
 
+Blocking tools run on the shared worker pool (athena.core.tool_runtime) so
+concurrent clients do not serialize; per-tool latency and cache metrics are
+exposed as the athena://server/stats resource.
+
 Usage:
     # stdio (for IDE integration like Antigravity / Claude Desktop)
     python -m athena.mcp_server
@@ -20,18 +24,19 @@ from __future__ import annotations
 
 import json
 import logging
-import sys
 from datetime import datetime
 
 from fastmcp import FastMCP
 
-from athena.core.permissions import (
-    get_permissions,
-    PermissionDenied,
-    SecretModeViolation,
-    Permission,
-    Sensitivity,
-)
+from athena.core.tool_runtime import get_tool_runtime
+
+
+def get_permissions():
+    """Permission engine, imported on first tool call rather than at server load."""
+    from athena.core.permissions import get_permissions as _get_permissions
+
+    return _get_permissions()
+
 
 # ---------------------------------------------------------------------------
 # Server Init
@@ -50,6 +55,7 @@ mcp = FastMCP(
 )
 
 logger = logging.getLogger("athena.mcp")
+runtime = get_tool_runtime()
 
 # ---------------------------------------------------------------------------
 # TOOL: smart_search
@@ -59,7 +65,7 @@ logger = logging.getLogger("athena.mcp")
 @mcp.tool(
     tags={"read", "memory", "search"},
 )
-def smart_search(
+async def smart_search(
     query: str,
     limit: int = 10,
     strict: bool = False,
@@ -78,7 +84,13 @@ def smart_search(
     Returns:
         dict with 'results' (list of matches) and 'meta' (query info).
     """
-    from athena.tools.search import run_search
+    return await runtime.run(
+        "smart_search", _smart_search, query, limit, strict, rerank
+    )
+
+
+def _smart_search(query: str, limit: int, strict: bool, rerank: bool) -> dict:
+    from athena.tools.search import search_payload
     from athena.core.governance import get_governance
 
     # Permission gate
@@ -88,37 +100,18 @@ def smart_search(
     # Governance: Mark search as performed
     get_governance().mark_search_performed(query)
 
-    # Capture results via json_output mode
-    import io
-
-    old_stdout = sys.stdout
-    sys.stdout = buffer = io.StringIO()
-
-    try:
-        run_search(
-            query=query,
-            limit=limit,
-            strict=strict,
-            rerank=rerank,
-            json_output=True,
-        )
-        output = buffer.getvalue()
-    finally:
-        sys.stdout = old_stdout
-
-    # Parse the JSON output
-    try:
-        results = json.loads(output)
-    except json.JSONDecodeError:
-        results = {"raw_output": output}
+    # Same payload as `--json`, built directly (no global stdout capture)
+    results, hit = search_payload(query, limit=limit, strict=strict, rerank=rerank)
+    runtime.record_cache("smart_search", hit != "miss")
 
     return {
-        "results": results if isinstance(results, list) else results,
+        "results": results,
         "meta": {
             "query": query,
             "limit": limit,
             "strict": strict,
             "rerank": rerank,
+            "cache": hit,
             "timestamp": datetime.now().isoformat(),
         },
     }
@@ -132,7 +125,7 @@ def smart_search(
 @mcp.tool(
     tags={"read", "memory", "search", "admin"},
 )
-def agentic_search(
+async def agentic_search(
     query: str,
     limit: int = 10,
     validate: bool = True,
@@ -151,6 +144,10 @@ def agentic_search(
     Returns:
         dict with 'results', 'sub_queries', 'decomposed', and 'meta'.
     """
+    return await runtime.run("agentic_search", _agentic_search_tool, query, limit, validate)
+
+
+def _agentic_search_tool(query: str, limit: int, validate: bool) -> dict:
     from athena.tools.agentic_search import agentic_search as _agentic_search
 
     # Permission gate
@@ -178,7 +175,7 @@ def agentic_search(
 @mcp.tool(
     tags={"write", "session", "checkpoint"},
 )
-def quicksave(
+async def quicksave(
     summary: str,
     bullets: list[str] | None = None,
 ) -> dict:
@@ -193,6 +190,10 @@ def quicksave(
     Returns:
         dict with 'status', 'log_file', and 'timestamp'.
     """
+    return await runtime.run("quicksave", _quicksave, summary, bullets)
+
+
+def _quicksave(summary: str, bullets: list[str] | None) -> dict:
     from athena.sessions import append_checkpoint
     from athena.core.governance import get_governance
 
@@ -202,8 +203,9 @@ def quicksave(
 
     # Governance: Check Triple-Lock compliance
     gov = get_governance()
-    semantic = gov._state.get("semantic_search_performed", False)
-    web = gov._state.get("web_search_performed", False)
+    state = gov._state
+    semantic = state.get("semantic_search_performed", False)
+    web = state.get("web_search_performed", False)
 
     violation = None
     if not (semantic and web):
@@ -240,26 +242,34 @@ def quicksave(
 @mcp.tool(
     tags={"read", "system", "health"},
 )
-def health_check() -> dict:
+async def health_check() -> dict:
     """
     Run a health audit of Athena's core services (Vector API, Database).
 
     Returns:
         dict with check results for each subsystem.
     """
+    return await runtime.run("health_check", _health_check)
+
+
+def _health_check() -> dict:
+    import time
+
     from athena.core.health import HealthCheck
 
     # Permission gate
     get_permissions().gate("health_check")
 
-    vector = HealthCheck.check_vector_api()
-    db = HealthCheck.check_database()
+    # Served from the published status file while fresh (cheap concurrent probes otherwise)
+    called_at = time.time()
+    status = HealthCheck.get_status()
+    runtime.record_cache("health_check", status["checked_at"] < called_at)
 
     return {
-        "vector_api": vector,
-        "database": db,
-        "overall": "PASS" if (vector["status"] == "PASS" and db["status"] == "PASS") else "FAIL",
-        "timestamp": datetime.now().isoformat(),
+        "vector_api": status["checks"]["vector_api"],
+        "database": status["checks"]["database"],
+        "overall": status["overall"],
+        "timestamp": status["timestamp"],
     }
 
 
@@ -271,7 +281,7 @@ def health_check() -> dict:
 @mcp.tool(
     tags={"read", "session", "memory"},
 )
-def recall_session(lines: int = 50) -> dict:
+async def recall_session(lines: int = 50) -> dict:
     """
     Retrieve the most recent session log content.
 
@@ -281,6 +291,10 @@ def recall_session(lines: int = 50) -> dict:
     Returns:
         dict with session file path and recent content.
     """
+    return await runtime.run("recall_session", _recall_session, lines)
+
+
+def _recall_session(lines: int) -> dict:
     from athena.sessions import recall_last_session
 
     # Permission gate
@@ -295,12 +309,15 @@ def recall_session(lines: int = 50) -> dict:
             "error": "No active session log found.",
         }
 
-    content = log_path.read_text(encoding="utf-8")
-    content_lines = content.splitlines()
+    from athena.core.session_log import get_session_log_reader
 
-    # Return the last N lines
-    tail = content_lines[-lines:] if len(content_lines) > lines else content_lines
-    tail_text = "\n".join(tail)
+    # Return the last N lines (backward block read + cached line-offset index)
+    reader = get_session_log_reader()
+    total_lines = reader.line_count(log_path)
+    if lines > 0:
+        tail_text = reader.tail(log_path, lines)
+    else:
+        tail_text = "\n".join(reader.read_text(log_path).splitlines())
 
     # Redact if in secret mode
     if perms.secret_mode:
@@ -310,7 +327,7 @@ def recall_session(lines: int = 50) -> dict:
         "status": "ok",
         "session_file": str(log_path),
         "session_id": log_path.stem,
-        "total_lines": len(content_lines),
+        "total_lines": total_lines,
         "content": tail_text,
     }
 
@@ -331,6 +348,10 @@ def governance_status() -> dict:
     Returns:
         dict with governance state and integrity score.
     """
+    return runtime.call("governance_status", _governance_status)
+
+
+def _governance_status() -> dict:
     from athena.core.governance import get_governance
 
     # Permission gate
@@ -365,6 +386,10 @@ def list_memory_paths() -> dict:
     Returns:
         dict with core and extended memory paths.
     """
+    return runtime.call("list_memory_paths", _list_memory_paths)
+
+
+def _list_memory_paths() -> dict:
     from athena.core.config import (
         CORE_DIRS,
         EXTENDED_DIRS,
@@ -395,14 +420,21 @@ def list_memory_paths() -> dict:
     name="Current Session Log",
     description="The full content of the active session log file.",
 )
-def current_session_resource() -> str:
+async def current_session_resource() -> str:
     """Return the full current session log as a resource."""
+    return await runtime.run("session_resource", _current_session_resource)
+
+
+def _current_session_resource() -> str:
     from athena.sessions import recall_last_session
 
+    from athena.core.session_log import get_session_log_reader
+
     log_path = recall_last_session()
     if not log_path or not log_path.exists():
         return "No active session."
-    return log_path.read_text(encoding="utf-8")
+    # Served from memory while unchanged; checkpoints are read incrementally
+    return get_session_log_reader().read_text(log_path)
 
 
 # ---------------------------------------------------------------------------
@@ -415,8 +447,12 @@ def current_session_resource() -> str:
     name="Canonical Memory",
     description="The Canonical Memory (CANONICAL.md) — Athena's constitution.",
 )
-def canonical_memory_resource() -> str:
+async def canonical_memory_resource() -> str:
     """Return the Canonical Memory content."""
+    return await runtime.run("canonical_resource", _canonical_memory_resource)
+
+
+def _canonical_memory_resource() -> str:
     from athena.core.config import CANONICAL_PATH
 
     if not CANONICAL_PATH.exists():
@@ -432,6 +468,24 @@ def canonical_memory_resource() -> str:
     return content
 
 
+# ---------------------------------------------------------------------------
+# RESOURCE: server_stats
+# ---------------------------------------------------------------------------
+
+
+@mcp.resource(
+    uri="athena://server/stats",
+    name="server_stats",
+    description=(
+        "Per-tool latency (p50/p95/p99), in-flight calls, errors and cache "
+        "hit ratios for this MCP server process."
+    ),
+)
+def server_stats_resource() -> str:
+    """Return the tool runtime metrics as JSON."""
+    return json.dumps(runtime.snapshot(), indent=2)
+
+
 # ---------------------------------------------------------------------------
 # TOOL: set_secret_mode
 # ---------------------------------------------------------------------------
@@ -451,8 +505,9 @@ def set_secret_mode(enabled: bool) -> dict:
     Returns:
         dict with mode state and list of blocked tools.
     """
-    perms = get_permissions()
-    return perms.set_secret_mode(enabled)
+    return runtime.call(
+        "set_secret_mode", lambda: get_permissions().set_secret_mode(enabled)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -471,6 +526,10 @@ def permission_status() -> dict:
     Returns:
         dict with full permission state and tool manifest.
     """
+    return runtime.call("permission_status", _permission_status)
+
+
+def _permission_status() -> dict:
     perms = get_permissions()
     status = perms.get_status()
     status["manifest"] = perms.get_tool_manifest()
@@ -489,6 +548,12 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8765, help="SSE port")
     args = parser.parse_args()
 
+    from athena import load_env
+
+    load_env()
+    # Preload search, caches, permissions and governance before serving
+    warmed = runtime.warm()
+    logger.info("Runtime warmed: %s", warmed)
     if args.sse:
         mcp.run(transport="sse", port=args.port)
     else:
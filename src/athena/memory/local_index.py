@@ -0,0 +1,534 @@
+"""
+athena.memory.local_index
+=========================
+
+The shared local SQLite index (``.agent/inputs/athena.db``).
+
+One store, one owner. athenad and heartbeat write to it; search, doctor and
+the auditors read from it. It replaces rglob/read_text scans with indexed
+queries.
+
+Tables:
+    files       path, checksum (size-mtime), content_hash, name, title
+    tags        tag names
+    file_tags   file ↔ tag links
+    links       markdown links ([x](y.md) = explicit) and wikilinks ([[y]] = implicit)
+    files_fts   FTS5 full-text content
+
+Schema is versioned with ``PRAGMA user_version`` and upgraded in place by
+``migrate()``; every writable connection is migrated before use.
+
+Usage:
+    from athena.memory.local_index import get_local_index
+
+    index = get_local_index()
+    index.index_paths(["/abs/path/note.md"])      # writer
+    index.search_content("kelly criterion")       # reader
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from athena.core.config import AGENT_DIR
+
+LOCAL_INDEX_PATH = AGENT_DIR / "inputs" / "athena.db"
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "core" / "schema.sql"
+SCHEMA_VERSION = 2
+
+SQL_VARIABLE_CHUNK = 500  # Stay below SQLite's bound-parameter limit
+MAX_FTS_CHARS = 200_000  # Cap indexed body per file
+
+TAG_PATTERN = re.compile(r"#([\w-]+)")
+MD_LINK_PATTERN = re.compile(r"\[[^\]]*\]\(([^)\s]+\.md)(?:#[^)]*)?\)")
+WIKI_LINK_PATTERN = re.compile(r"\[\[([^\]|#]+)(?:[#|][^\]]*)?\]\]")
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+# --- Extraction ---
+
+
+def extract_tags(content: str) -> set[str]:
+    """Extract #tags from Markdown content."""
+    return set(TAG_PATTERN.findall(content))
+
+
+def extract_links(content: str, source_path: str) -> dict[str, str]:
+    """
+    Extract outgoing links as {target: type}.
+    Markdown links are resolved against the source directory ('explicit');
+    wikilinks are kept as bare note names ('implicit').
+    """
+    links: dict[str, str] = {}
+    base = os.path.dirname(source_path)
+    for target in MD_LINK_PATTERN.findall(content):
+        if "://" in target:
+            continue
+        resolved = os.path.normpath(os.path.join(base, target.replace("%20", " ")))
+        links[resolved] = "explicit"
+    for name in WIKI_LINK_PATTERN.findall(content):
+        name = name.strip()
+        if name:
+            links.setdefault(name if name.endswith(".md") else f"{name}.md", "implicit")
+    return links
+
+
+@dataclass
+class IndexRecord:
+    """Everything the index stores about one file, built from a single read."""
+
+    path: str
+    checksum: str
+    content_hash: str
+    title: Optional[str]
+    content: str
+    tags: set[str] = field(default_factory=set)
+    links: dict[str, str] = field(default_factory=dict)
+    type: str = "text/markdown"
+
+
+def file_checksum(path: str) -> Optional[str]:
+    """Fast change detector: size-mtime from a single stat."""
+    try:
+        stats = os.stat(path)
+        return f"{stats.st_size}-{stats.st_mtime}"
+    except FileNotFoundError:
+        return None
+
+
+def build_record(path: str, checksum: Optional[str] = None) -> Optional[IndexRecord]:
+    """Read a file once and extract everything the index needs."""
+    checksum = checksum or file_checksum(path)
+    if not checksum:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    title = TITLE_PATTERN.search(content)
+    return IndexRecord(
+        path=path,
+        checksum=checksum,
+        content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        title=title.group(1).strip() if title else None,
+        content=content,
+        tags=extract_tags(content),
+        links=extract_links(content, path),
+    )
+
+
+# --- Schema Migrations ---
+
+
+def _execute_statements(conn: sqlite3.Connection, sql: str):
+    """Run a multi-statement script inside the caller's transaction.
+
+    executescript() would COMMIT first, splitting a migration in two.
+    """
+    statement = ""
+    for line in sql.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+def _migrate_v1(conn: sqlite3.Connection):
+    """Baseline: files, tags, file_tags, links (core/schema.sql)."""
+    _execute_statements(conn, SCHEMA_PATH.read_text())
+
+
+def _migrate_v2(conn: sqlite3.Connection):
+    """Add name/title columns, link and name indexes, and the FTS content table."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+    if "name" not in columns:
+        conn.execute("ALTER TABLE files ADD COLUMN name TEXT")
+    if "title" not in columns:
+        conn.execute("ALTER TABLE files ADD COLUMN title TEXT")
+    conn.executemany(
+        "UPDATE files SET name = ? WHERE path = ?",
+        [
+            (os.path.basename(path), path)
+            for (path,) in conn.execute("SELECT path FROM files WHERE name IS NULL")
+        ],
+    )
+    _execute_statements(
+        conn,
+        """
+        CREATE INDEX IF NOT EXISTS idx_files_name ON files(name);
+        CREATE INDEX IF NOT EXISTS idx_links_target ON links(target_path);
+        CREATE INDEX IF NOT EXISTS idx_file_tags_tag ON file_tags(tag_id);
+        CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+            path UNINDEXED, title, content, tokenize = 'porter unicode61'
+        );
+        """
+    )
+    # Existing rows predate content indexing; clear checksums so the next
+    # athenad/heartbeat pass re-reads them and fills content_hash, links and FTS.
+    conn.execute("UPDATE files SET checksum = NULL WHERE content_hash IS NULL")
+
+
+MIGRATIONS = [
+    (1, _migrate_v1),
+    (2, _migrate_v2),
+]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Upgrade the schema in place. Returns the resulting version.
+
+    All pending steps and the new user_version commit as one transaction
+    under the write lock; the version is re-read once the lock is held, so
+    a process that lost the race to migrate does nothing.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return version
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for target, step in MIGRATIONS:
+            if version >= target:
+                continue
+            step(conn)
+            version = target
+        conn.execute(f"PRAGMA user_version = {version}")
+    return version
+
+
+# --- Store ---
+
+
+class LocalIndex:
+    """
+    Owner of the shared local index.
+
+    Writers keep in-memory mirrors of checksums and tag ids so a poll over
+    thousands of unchanged files costs dict lookups. Changed files are
+    written with executemany in one transaction per batch; their tag links,
+    links and FTS rows are replaced from the database, not diffed against a
+    mirror, because athenad and heartbeat write the same file concurrently.
+    Readers open short-lived WAL connections and never block the writer.
+    """
+
+    def __init__(self, db_path: Path = LOCAL_INDEX_PATH):
+        self.db_path = Path(db_path)
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._state_loaded = False
+        self._checksums: dict[str, Optional[str]] = {}
+        self._tag_ids: dict[str, int] = {}
+
+    # -------------------------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        return self.db_path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a WAL connection with the schema migrated to SCHEMA_VERSION."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        migrate(conn)
+        return conn
+
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """Read connection, or None when the index has not been built yet."""
+        if not self.exists():
+            return None
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.row_factory = sqlite3.Row
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            conn.close()
+            conn = self.connect()
+        return conn
+
+    def _writer(self) -> sqlite3.Connection:
+        if self._write_conn is None:
+            self._write_conn = self.connect()
+        return self._write_conn
+
+    def close(self):
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+                self._state_loaded = False
+
+    # -------------------------------------------------------------------------
+    # Writer
+    # -------------------------------------------------------------------------
+
+    def load_state(self):
+        """Warm the checksum and tag-id mirrors (one query each)."""
+        with self._write_lock:
+            conn = self._writer()
+            self._checksums = {
+                row["path"]: row["checksum"]
+                for row in conn.execute("SELECT path, checksum FROM files")
+            }
+            self._tag_ids = {
+                row["name"]: row["id"]
+                for row in conn.execute("SELECT id, name FROM tags")
+            }
+            self._state_loaded = True
+
+    def is_current(self, path: str, checksum: str) -> bool:
+        """True if the index already holds this exact version of the file."""
+        if not self._state_loaded:
+            self.load_state()
+        return self._checksums.get(path) == checksum
+
+    def write_batch(self, records: list[IndexRecord]) -> int:
+        """
+        Write records in a single transaction. Tag links, links and FTS rows
+        are deleted and re-inserted for each changed file, so links written
+        by another process are never left behind. Returns the number of
+        files written.
+        """
+        if not records:
+            return 0
+
+        with self._write_lock:
+            if not self._state_loaded:
+                self.load_state()
+            conn = self._writer()
+            now = time.time()
+
+            new_names = {t for r in records for t in r.tags} - self._tag_ids.keys()
+            paths = [(r.path,) for r in records]
+            tag_ids = dict(self._tag_ids)
+            with conn:
+                conn.executemany(
+                    """INSERT INTO files
+                           (path, last_modified, checksum, content_hash, type,
+                            created_at, name, title)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(path) DO UPDATE SET
+                           last_modified = excluded.last_modified,
+                           checksum = excluded.checksum,
+                           content_hash = excluded.content_hash,
+                           type = excluded.type,
+                           name = excluded.name,
+                           title = excluded.title""",
+                    [
+                        (
+                            r.path,
+                            now,
+                            r.checksum,
+                            r.content_hash,
+                            r.type,
+                            now,
+                            os.path.basename(r.path),
+                            r.title,
+                        )
+                        for r in records
+                    ],
+                )
+
+                if new_names:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO tags (name) VALUES (?)",
+                        [(name,) for name in new_names],
+                    )
+                    for chunk in _chunks(list(new_names)):
+                        placeholders = ",".join("?" * len(chunk))
+                        for row in conn.execute(
+                            f"SELECT id, name FROM tags WHERE name IN ({placeholders})",
+                            chunk,
+                        ):
+                            tag_ids[row["name"]] = row["id"]
+
+                conn.executemany("DELETE FROM file_tags WHERE file_path = ?", paths)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO file_tags (file_path, tag_id) VALUES (?, ?)",
+                    [(r.path, tag_ids[t]) for r in records for t in r.tags],
+                )
+
+                conn.executemany("DELETE FROM links WHERE source_path = ?", paths)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO links (source_path, target_path, type) VALUES (?, ?, ?)",
+                    [
+                        (r.path, target, link_type)
+                        for r in records
+                        for target, link_type in r.links.items()
+                    ],
+                )
+
+                conn.executemany("DELETE FROM files_fts WHERE path = ?", paths)
+                conn.executemany(
+                    "INSERT INTO files_fts (path, title, content) VALUES (?, ?, ?)",
+                    [(r.path, r.title or "", r.content[:MAX_FTS_CHARS]) for r in records],
+                )
+
+            # Committed: update mirrors
+            self._tag_ids = tag_ids
+            for r in records:
+                self._checksums[r.path] = r.checksum
+            return len(records)
+
+    def index_paths(self, paths: Iterable[str]) -> int:
+        """Index the given files if they changed since the last write."""
+        records = []
+        for path in paths:
+            path = str(path)
+            checksum = file_checksum(path)
+            if checksum and not self.is_current(path, checksum):
+                record = build_record(path, checksum)
+                if record:
+                    records.append(record)
+        written = 0
+        for start in range(0, len(records), SQL_VARIABLE_CHUNK):
+            written += self.write_batch(records[start : start + SQL_VARIABLE_CHUNK])
+        return written
+
+    def remove_paths(self, paths: Iterable[str]) -> int:
+        """Drop files (and their tags, links and FTS rows) from the index."""
+        rows = [(str(p),) for p in paths]
+        if not rows:
+            return 0
+        with self._write_lock:
+            conn = self._writer()
+            with conn:
+                conn.executemany("DELETE FROM file_tags WHERE file_path = ?", rows)
+                conn.executemany("DELETE FROM links WHERE source_path = ?", rows)
+                conn.executemany("DELETE FROM files_fts WHERE path = ?", rows)
+                conn.executemany("DELETE FROM files WHERE path = ?", rows)
+            for (path,) in rows:
+                self._checksums.pop(path, None)
+        return len(rows)
+
+    # -------------------------------------------------------------------------
+    # Reader
+    # -------------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        conn = self._reader()
+        if conn is None:
+            return []
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def search_paths(self, query: str, limit: int = 10) -> list[str]:
+        rows = self._query(
+            "SELECT path FROM files WHERE path LIKE ? LIMIT ?", (f"%{query}%", limit)
+        )
+        return [row["path"] for row in rows]
+
+    def search_tags(self, query: str, limit: int = 10) -> list[tuple[str, str]]:
+        """Return (path, tag) pairs whose tag matches the query."""
+        rows = self._query(
+            """SELECT f.path, t.name
+               FROM tags t
+               JOIN file_tags ft ON ft.tag_id = t.id
+               JOIN files f ON f.path = ft.file_path
+               WHERE t.name LIKE ?
+               LIMIT ?""",
+            (f"%{query}%", limit),
+        )
+        return [(row["path"], row["name"]) for row in rows]
+
+    def search_content(self, query: str, limit: int = 10) -> list[dict]:
+        """Full-text search. Returns [{path, title, snippet, rank}] best first."""
+        tokens = [t for t in query.split() if t]
+        if not tokens:
+            return []
+        match = " ".join('"' + t.replace('"', '""') + '"' for t in tokens)
+        rows = self._query(
+            """SELECT path, title,
+                      snippet(files_fts, 2, '', '', '…', 16) AS snippet,
+                      rank
+               FROM files_fts WHERE files_fts MATCH ?
+               ORDER BY rank LIMIT ?""",
+            (match, limit),
+        )
+        return [dict(row) for row in rows]
+
+    def find_by_name(self, name: str, under: Optional[Iterable[Path]] = None) -> list[str]:
+        """Exact filename lookup, optionally restricted to directory prefixes."""
+        paths = [
+            row["path"]
+            for row in self._query("SELECT path FROM files WHERE name = ?", (name,))
+        ]
+        if under is not None:
+            prefixes = tuple(str(p).rstrip(os.sep) + os.sep for p in under)
+            paths = [p for p in paths if p.startswith(prefixes)]
+        return paths
+
+    def files_under(self, directory: Path, pattern: str = "%") -> list[str]:
+        """Indexed equivalent of directory.rglob(...) (pattern is a SQL LIKE on the name)."""
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        rows = self._query(
+            "SELECT path FROM files WHERE path >= ? AND path < ? AND name LIKE ? ORDER BY path",
+            (prefix, prefix + "\U0010ffff", pattern),
+        )
+        return [row["path"] for row in rows]
+
+    def links_from(self, path: str) -> list[tuple[str, str]]:
+        rows = self._query(
+            "SELECT target_path, type FROM links WHERE source_path = ?", (str(path),)
+        )
+        return [(row["target_path"], row["type"]) for row in rows]
+
+    def backlinks(self, target: str) -> list[str]:
+        """Files that link to target (absolute path or wikilink note name)."""
+        rows = self._query(
+            "SELECT source_path FROM links WHERE target_path = ?", (str(target),)
+        )
+        return [row["source_path"] for row in rows]
+
+    def stats(self) -> dict:
+        """Counts and schema version for diagnostics."""
+        conn = self._reader()
+        if conn is None:
+            return {"exists": False, "path": str(self.db_path)}
+        try:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("files", "tags", "file_tags", "links", "files_fts")
+            }
+            return {
+                "exists": True,
+                "path": str(self.db_path),
+                "schema_version": conn.execute("PRAGMA user_version").fetchone()[0],
+                "last_indexed": conn.execute(
+                    "SELECT MAX(last_modified) FROM files"
+                ).fetchone()[0],
+                **counts,
+            }
+        finally:
+            conn.close()
+
+
+def _chunks(items: list, size: int = SQL_VARIABLE_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+# Singleton Instance
+_local_index: Optional[LocalIndex] = None
+_local_index_lock = threading.Lock()
+
+
+def get_local_index() -> LocalIndex:
+    """Singleton accessor for the shared local index."""
+    global _local_index
+    with _local_index_lock:
+        if _local_index is None:
+            _local_index = LocalIndex()
+        return _local_index
@@ -7,10 +7,11 @@ Robustness: Handles absolute/relative path mismatches & Exponential Backoff.
 
 import re
 import time
+from collections import defaultdict
 from pathlib import Path
 
 from athena.memory.delta_manifest import DeltaManifest
-from athena.memory.vectors import get_client, get_embedding
+from athena.memory.vectors import get_client, get_embedding, get_embeddings
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
@@ -78,7 +79,6 @@ def sync_file_to_supabase(
     """
     Sync a single file with Exponential Backoff Retries.
     """
-    abs_root = PROJECT_ROOT.resolve()
     abs_file = file_path.resolve()
 
     if not abs_file.exists():
@@ -87,26 +87,9 @@ def sync_file_to_supabase(
     if manifest and not manifest.should_sync(abs_file):
         return True
 
-    content = abs_file.read_text(encoding="utf-8")
-    meta = extract_metadata(content, abs_file.name)
-    if extra_metadata:
-        meta.update(extra_metadata)
-
+    data, content = _prepare_record(abs_file, table_name, extra_metadata)
     client = get_client()
-    embedding = get_embedding(content[:30000])
-
-    try:
-        db_path = str(abs_file.relative_to(abs_root))
-    except ValueError:
-        db_path = str(abs_file)
-
-    data = {
-        "content": content,
-        "embedding": embedding,
-        "file_path": db_path,
-        "title": meta.get("title", abs_file.name),
-    }
-    _enrich_data_by_table(data, abs_file, table_name, meta)
+    data["embedding"] = get_embedding(content[:30000])
 
     # Retry Loop
     for attempt in range(max_retries):
@@ -135,6 +118,118 @@ def sync_file_to_supabase(
     return False
 
 
+def _prepare_record(
+    abs_file: Path, table_name: str, extra_metadata: dict | None = None
+) -> tuple[dict, str]:
+    """Read a file and build its upsert row (without the embedding)."""
+    content = abs_file.read_text(encoding="utf-8")
+    meta = extract_metadata(content, abs_file.name)
+    if extra_metadata:
+        meta.update(extra_metadata)
+
+    try:
+        db_path = str(abs_file.relative_to(PROJECT_ROOT.resolve()))
+    except ValueError:
+        db_path = str(abs_file)
+
+    data = {
+        "content": content,
+        "file_path": db_path,
+        "title": meta.get("title", abs_file.name),
+    }
+    _enrich_data_by_table(data, abs_file, table_name, meta)
+    return data, content
+
+
+def _upsert_rows(client, table_name: str, rows: list[dict], max_retries: int) -> bool:
+    """Upsert many rows in one request, with exponential backoff."""
+    for attempt in range(max_retries):
+        try:
+            client.table(table_name).upsert(rows, on_conflict="file_path").execute()
+            return True
+        except Exception:
+            if attempt < max_retries - 1:
+                time.sleep((2**attempt) + 0.5)
+    return False
+
+
+def sync_files_to_supabase(
+    files: list[tuple[Path, str]],
+    manifest: DeltaManifest | None = None,
+    batch_size: int = 50,
+    max_retries: int = 3,
+    prefiltered: bool = False,
+) -> dict:
+    """
+    Bulk sync: one batched embedding call and one upsert per (table, batch).
+
+    Files the manifest reports as unchanged are skipped, unless the caller
+    already ran manifest.should_sync on them (prefiltered=True). If a table's bulk
+    upsert fails, its rows fall back to sync_file_to_supabase one by one so a
+    single bad row cannot sink the batch.
+
+    Returns {"synced": n, "skipped": n, "errors": n}.
+    """
+    stats = {"synced": 0, "skipped": 0, "errors": 0}
+
+    pending = []
+    for file_path, table_name in files:
+        abs_file = file_path.resolve()
+        if not abs_file.exists() or (
+            manifest and not prefiltered and not manifest.should_sync(abs_file)
+        ):
+            stats["skipped"] += 1
+            continue
+        pending.append((abs_file, table_name))
+
+    if not pending:
+        return stats
+
+    client = get_client()
+    for start in range(0, len(pending), batch_size):
+        records = []
+        for abs_file, table_name in pending[start : start + batch_size]:
+            try:
+                data, content = _prepare_record(abs_file, table_name)
+                records.append((abs_file, table_name, data, content))
+            except (OSError, UnicodeDecodeError):
+                stats["errors"] += 1
+
+        try:
+            embeddings = get_embeddings([content[:30000] for *_, content in records])
+        except Exception:
+            stats["errors"] += len(records)
+            continue
+
+        by_table = defaultdict(list)
+        for (abs_file, table_name, data, _), embedding in zip(
+            records, embeddings, strict=True
+        ):
+            data["embedding"] = embedding
+            by_table[table_name].append((abs_file, data))
+
+        for table_name, rows in by_table.items():
+            if _upsert_rows(client, table_name, [data for _, data in rows], max_retries):
+                if manifest:
+                    for abs_file, _ in rows:
+                        manifest.update_entry(abs_file)
+                stats["synced"] += len(rows)
+                continue
+
+            for abs_file, _ in rows:
+                try:
+                    if sync_file_to_supabase(
+                        abs_file, table_name, manifest=manifest, max_retries=1
+                    ):
+                        stats["synced"] += 1
+                    else:
+                        stats["errors"] += 1
+                except Exception:
+                    stats["errors"] += 1
+
+    return stats
+
+
 def _enrich_data_by_table(data: dict, file_path: Path, table_name: str, meta: dict):
     if table_name == "sessions":
         date_match = re.search(r"(\d{4}-\d{2}-\d{2})", file_path.name)
@@ -36,9 +36,9 @@ def get_client() -> Any:
     """Returns a thread-safe Supabase client instance."""
     if not hasattr(_thread_local, "client"):
         from supabase import create_client
-        from dotenv import load_dotenv
+        from athena import load_env
 
-        load_dotenv()
+        load_env()
 
         url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
         key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -111,15 +111,32 @@ class PersistentEmbeddingCache:
             self._dirty = True
         self._save()
 
+    def dimensions(self) -> Optional[int]:
+        """Embedding width as stored locally (None if the cache is empty)."""
+        with self.lock:
+            for embedding in self._cache.values():
+                return len(embedding)
+        return None
+
+    def set_many(self, items: Dict[str, List[float]]):
+        """Store several embeddings with a single background save."""
+        if not items:
+            return
+        with self.lock:
+            self._cache.update(items)
+            self._dirty = True
+        self._save()
+
 
 def _hash_text(text: str) -> str:
     return hashlib.md5(text.encode()).hexdigest()
 
 
-def get_embedding(text: str) -> List[float]:
+def get_embedding(text: str, timeout: float = 30) -> List[float]:
     """Generate embedding with persistent disk caching.
 
-    Uses gemini-embedding-001 (3072 dimensions).
+    Uses gemini-embedding-001 (3072 dimensions). timeout bounds the HTTP
+    request on a cache miss.
     """
     text_hash = _hash_text(text)
     cache = get_embedding_cache()
@@ -129,9 +146,9 @@ def get_embedding(text: str) -> List[float]:
 
     # Fetch remote (Gemini) - Lazy load requests
     import requests
-    from dotenv import load_dotenv
+    from athena import load_env
 
-    load_dotenv()
+    load_env()
 
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
@@ -143,7 +160,7 @@ def get_embedding(text: str) -> List[float]:
         "content": {"parts": [{"text": text}]},
     }
 
-    response = requests.post(url, json=payload, timeout=30)
+    response = requests.post(url, json=payload, timeout=timeout)
     response.raise_for_status()
     embedding = response.json()["embedding"]["values"]
 
@@ -151,6 +168,53 @@ def get_embedding(text: str) -> List[float]:
     return embedding
 
 
+EMBED_BATCH_LIMIT = 100  # Gemini batchEmbedContents max requests per call
+
+
+def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """Batch variant of get_embedding (one HTTP round trip per 100 uncached texts).
+
+    Returns embeddings in the same order as ``texts``.
+    """
+    cache = get_embedding_cache()
+    hashes = [_hash_text(t) for t in texts]
+    results: List[Optional[List[float]]] = [cache.get(h) for h in hashes]
+    missing = [i for i, emb in enumerate(results) if not emb]
+    if not missing:
+        return results
+
+    import requests
+    from athena import load_env
+
+    load_env()
+
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY missing.")
+
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:batchEmbedContents?key={api_key}"
+    for start in range(0, len(missing), EMBED_BATCH_LIMIT):
+        chunk = missing[start : start + EMBED_BATCH_LIMIT]
+        payload = {
+            "requests": [
+                {
+                    "model": "models/gemini-embedding-001",
+                    "content": {"parts": [{"text": texts[i]}]},
+                }
+                for i in chunk
+            ]
+        }
+        response = requests.post(url, json=payload, timeout=60)
+        response.raise_for_status()
+        fetched = {}
+        for i, item in zip(chunk, response.json()["embeddings"], strict=True):
+            results[i] = item["values"]
+            fetched[hashes[i]] = item["values"]
+        cache.set_many(fetched)
+
+    return results
+
+
 def search_rpc(
     rpc_name: str, query_embedding: List[float], limit: int = 5, threshold: float = 0.3
 ) -> List[Dict]:
@@ -5,6 +5,7 @@ athena.sessions
 Unified session lifecycle and checkpointing logic.
 """
 
+import json
 import re
 from pathlib import Path
 from datetime import datetime
@@ -49,19 +50,10 @@ def recall_last_session() -> Optional[Path]:
 
 def get_next_session_number() -> int:
     """Find the highest session number for today and return the next one."""
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    if not SESSIONS_DIR.exists():
-        return 1
-
-    pattern = re.compile(rf"^{today}-session-(\d{{2,3}})\.md$")
-    max_session = 0
-    for file in SESSIONS_DIR.iterdir():
-        match = pattern.match(file.name)
-        if match:
-            max_session = max(max_session, int(match.group(1)))
+    from athena.core.session_catalog import get_session_catalog
 
-    return max_session + 1
+    today = datetime.now().strftime("%Y-%m-%d")
+    return get_session_catalog().next_number(today)
 
 
 def update_forward_lineage(prev_session_id: str, current_session_id: str):
@@ -222,6 +214,9 @@ lambda_coverage_d:
     if prev_session_id:
         update_forward_lineage(prev_session_id, session_id)
 
+    from athena.core.session_catalog import get_session_catalog
+
+    get_session_catalog().register(filepath)
     return filepath
 
 
@@ -317,6 +312,9 @@ def append_checkpoint(
     with open(log_path, "a", encoding="utf-8") as f:
         f.write(checkpoint_block)
 
+    from athena.core.session_catalog import get_session_catalog
+
+    get_session_catalog().refresh(log_path)
     return log_path
 
 
@@ -336,6 +334,51 @@ def log_to_decision_ledger(summary: str, rationale: Optional[str] = None):
         f.write(entry)
 
 
+FRONTMATTER_SCAN_BYTES = 8192
+# Fixed-width value slots so later updates overwrite bytes in place
+METADATA_SLOT_WIDTHS = {"tokens": 20, "thread_id": 64}
+_FRONTMATTER_LINE = re.compile(rb"^([A-Za-z_][\w-]*):[ ]?([^\n]*)$", re.MULTILINE)
+
+
+def _frontmatter_slots(head: bytes) -> Optional[Dict[str, tuple[int, int]]]:
+    """Byte spans of each top-level frontmatter value: {key: (start, end)}."""
+    if not head.startswith(b"---\n"):
+        return None
+    close = head.find(b"\n---\n", 3)
+    if close == -1:
+        return None
+    return {
+        m.group(1).decode(): m.span(2)
+        for m in _FRONTMATTER_LINE.finditer(head, 4, close + 1)
+    }
+
+
+def _reserve_metadata_slots(log_path: Path, updates: Dict[str, str]):
+    """One-time rewrite that writes the (YAML-encoded) values into padded slots."""
+    content = log_path.read_bytes()
+    slots = _frontmatter_slots(content[:FRONTMATTER_SCAN_BYTES]) or {}
+    close = content.find(b"\n---\n", 3) + 1
+
+    # Apply edits back to front so earlier spans stay valid
+    edits = []
+    for key, value in updates.items():
+        width = max(METADATA_SLOT_WIDTHS.get(key, 0), len(value.encode()))
+        padded = value.encode().ljust(width)
+        if key in slots:
+            start, end = slots[key]
+            if content[start - 1 : start] != b" ":
+                padded = b" " + padded
+            edits.append((start, end, padded))
+        else:
+            edits.append((close, close, key.encode() + b": " + padded + b"\n"))
+    for start, end, data in sorted(edits, key=lambda e: e[0], reverse=True):
+        content = content[:start] + data + content[end:]
+
+    tmp = log_path.with_suffix(".md.tmp")
+    tmp.write_bytes(content)
+    tmp.replace(log_path)
+
+
 def update_session_metadata(
     new_tokens: int = 0,
     thread_id: Optional[str] = None,
@@ -343,6 +386,10 @@ def update_session_metadata(
 ):
     """
     Update YAML frontmatter in session log.
+
+    Values live in fixed-width slots (padded with spaces, which YAML ignores),
+    so an update overwrites a few bytes in place instead of rewriting the log.
+    The first update of a log without slots reserves them once.
     """
     if log_path is None:
         log_path = get_current_session_log()
@@ -350,24 +397,39 @@ def update_session_metadata(
     if not log_path or not log_path.exists():
         return
 
-    content = log_path.read_text(encoding="utf-8")
-
-    # Simple YAML extraction (assumes it starts with ---)
-    if content.startswith("---"):
-        try:
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                import yaml
-
-                frontmatter = yaml.safe_load(parts[1]) or {}
-
-                # Update logic
-                frontmatter["tokens"] = frontmatter.get("tokens", 0) + new_tokens
-                if thread_id:
-                    frontmatter["thread_id"] = thread_id
-
-                new_content = "---\n" + yaml.dump(frontmatter) + "---\n" + parts[2]
-                log_path.write_text(new_content, encoding="utf-8")
-        except Exception:
-            # Fallback if YAML is malformed
-            pass
+    try:
+        with open(log_path, "r+b") as f:
+            head = f.read(FRONTMATTER_SCAN_BYTES)
+            slots = _frontmatter_slots(head)
+            if slots is None:
+                return
+
+            try:
+                start, end = slots.get("tokens", (0, 0))
+                tokens = int(head[start:end].strip() or 0)
+            except ValueError:
+                tokens = 0
+
+            updates = {"tokens": str(tokens + new_tokens)}
+            if thread_id:
+                # A JSON string is a valid YAML double-quoted scalar
+                updates["thread_id"] = json.dumps(thread_id)
+
+            in_place = all(
+                key in slots and len(value.encode()) <= slots[key][1] - slots[key][0]
+                for key, value in updates.items()
+            )
+            if in_place:
+                for key, value in updates.items():
+                    start, end = slots[key]
+                    f.seek(start)
+                    f.write(value.encode().ljust(end - start))
+
+        if not in_place:
+            _reserve_metadata_slots(log_path, updates)
+
+        from athena.core.session_catalog import get_session_catalog
+
+        get_session_catalog().refresh(log_path)
+    except OSError:
+        pass
@@ -7,7 +7,8 @@ Read-Only File Watcher — Auto-indexes new/modified documents to Supabase.
 Design constraints:
     - READ-ONLY: Only reads source files, writes to Supabase + log
     - Never modifies source files
-    - Debounces rapid edits (5s window)
+    - Debounces rapid edits (5s window) on a single scheduler thread
+    - Syncs in batches on a bounded worker pool; bulk mode for large bursts
     - Watches all CORE_DIRS and EXTENDED_DIRS from config.py
 
 Usage:
@@ -19,10 +20,12 @@ Dependencies:
     pip install watchdog
 """
 
+import heapq
 import logging
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -64,6 +67,21 @@ def setup_logging():
 
 # ── Table Routing ─────────────────────────────────────────────────────────────
 
+_TABLE_PREFIXES: Optional[list[tuple[str, str]]] = None
+
+
+def _table_prefixes() -> list[tuple[str, str]]:
+    """
+    Resolved (directory prefix, table) pairs, computed once.
+    CORE_DIRS come first because they are more specific.
+    """
+    global _TABLE_PREFIXES
+    if _TABLE_PREFIXES is None:
+        prefixes = [(str(p.resolve()), t) for t, p in CORE_DIRS.items()]
+        prefixes.extend((str(p.resolve()), t) for p, t in EXTENDED_DIRS)
+        _TABLE_PREFIXES = prefixes
+    return _TABLE_PREFIXES
+
 
 def resolve_table(file_path: Path) -> Optional[str]:
     """
@@ -72,14 +90,8 @@ def resolve_table(file_path: Path) -> Optional[str]:
     """
     str_path = str(file_path.resolve())
 
-    # Check CORE_DIRS first (more specific)
-    for table_name, dir_path in CORE_DIRS.items():
-        if str_path.startswith(str(dir_path.resolve())):
-            return table_name
-
-    # Check EXTENDED_DIRS
-    for dir_path, table_name in EXTENDED_DIRS:
-        if str_path.startswith(str(dir_path.resolve())):
+    for prefix, table_name in _table_prefixes():
+        if str_path.startswith(prefix):
             return table_name
 
     return None
@@ -91,17 +103,53 @@ def resolve_table(file_path: Path) -> Optional[str]:
 class DebouncedSyncHandler(FileSystemEventHandler if Observer else object):
     """
     File event handler with debouncing.
-    Batches rapid edits into a single sync operation per file.
+
+    A single scheduler thread owns a time-ordered heap of pending paths.
+    Re-edits push the deadline back (stale heap entries are skipped lazily),
+    due paths are grouped into batches, and a bounded worker pool syncs each
+    batch with one embedding call and one upsert per table.
+
+    Bursts (e.g. a git checkout) above BURST_THRESHOLD switch to bulk-reindex
+    mode: the scheduler waits for the burst to go quiet, then hands every
+    pending path to a single job, so the burst costs one local-index
+    transaction, one manifest pass and save, and embedding calls of
+    BULK_BATCH_SIZE instead of many small concurrent batches.
+
+    The scheduler thread starts on the first event, so one-shot scans that
+    never receive events do not spawn it.
     """
 
     DEBOUNCE_SECONDS = 5.0
+    COALESCE_SECONDS = 1.0  # Also take paths due this soon into the same batch
+    SYNC_WORKERS = 4
+    SYNC_BATCH_SIZE = 25
+    BURST_THRESHOLD = 200
+    BURST_QUIET_SECONDS = 10.0
+    BULK_BATCH_SIZE = 100
 
     def __init__(self, dry_run: bool = False):
         super().__init__()
         self.dry_run = dry_run
-        self._pending: Dict[str, threading.Timer] = {}
-        self._lock = threading.Lock()
-        self._stats = {"synced": 0, "skipped": 0, "errors": 0}
+        self._heap: list[tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._last_event = 0.0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._stats = {"synced": 0, "skipped": 0, "errors": 0, "bulk_runs": 0}
+        self._stats_lock = threading.Lock()
+        self._manifest = None
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.SYNC_WORKERS, thread_name_prefix="heartbeat-sync"
+        )
+        self._scheduler: Optional[threading.Thread] = None
+
+    def _ensure_scheduler(self):
+        """Start the scheduler thread (caller holds self._cond)."""
+        if self._scheduler is None and not self._stopping:
+            self._scheduler = threading.Thread(
+                target=self._scheduler_loop, name="heartbeat-scheduler", daemon=True
+            )
+            self._scheduler.start()
 
     def on_modified(self, event):
         if event.is_directory:
@@ -125,52 +173,145 @@ class DebouncedSyncHandler(FileSystemEventHandler if Observer else object):
         if file_path.name.startswith(".") or file_path.name.startswith("~"):
             return
 
-        with self._lock:
-            # Cancel any pending timer for this file
-            if path in self._pending:
-                self._pending[path].cancel()
+        now = time.monotonic()
+        due = now + self.DEBOUNCE_SECONDS
+        with self._cond:
+            self._ensure_scheduler()
+            self._last_event = now
+            self._due[path] = due
+            heapq.heappush(self._heap, (due, path))
+            self._cond.notify()
+
+    def _pop_due(self) -> list[str]:
+        """
+        Wait (holding the condition) until work is due; return due paths.
+        In burst mode, everything pending is drained once events go quiet.
+        """
+        while not self._stopping:
+            now = time.monotonic()
+
+            if len(self._due) > self.BURST_THRESHOLD:
+                quiet_at = self._last_event + self.BURST_QUIET_SECONDS
+                if now < quiet_at:
+                    self._cond.wait(quiet_at - now)
+                    continue
+                paths = list(self._due)
+                self._due.clear()
+                self._heap.clear()
+                return paths
+
+            # Discard heap entries superseded by a later edit
+            while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
 
-            # Schedule new sync after debounce period
-            timer = threading.Timer(
-                self.DEBOUNCE_SECONDS,
-                self._do_sync,
-                args=(file_path,),
-            )
-            timer.daemon = True
-            timer.start()
-            self._pending[path] = timer
-
-    def _do_sync(self, file_path: Path):
-        """Execute the actual sync operation."""
-        table = resolve_table(file_path)
-        if not table:
-            logger.debug(f"⏩ Ignored (no table mapping): {file_path.name}")
-            self._stats["skipped"] += 1
+            if not self._heap:
+                self._cond.wait()
+                continue
+
+            if self._heap[0][0] > now:
+                self._cond.wait(self._heap[0][0] - now)
+                continue
+
+            paths = []
+            horizon = now + self.COALESCE_SECONDS
+            while self._heap and self._heap[0][0] <= horizon:
+                due, path = heapq.heappop(self._heap)
+                if self._due.get(path) == due:
+                    del self._due[path]
+                    paths.append(path)
+            if paths:
+                return paths
+        return []
+
+    def _scheduler_loop(self):
+        while True:
+            with self._cond:
+                paths = self._pop_due()
+            if not paths:
+                return
+
+            if len(paths) > self.BURST_THRESHOLD:
+                logger.info(f"🌊 Burst of {len(paths)} files → bulk reindex mode")
+                self._bump("bulk_runs")
+                self._pool.submit(
+                    self._do_sync_batch, [Path(p) for p in paths], self.BULK_BATCH_SIZE
+                )
+                continue
+
+            for i in range(0, len(paths), self.SYNC_BATCH_SIZE):
+                batch = [Path(p) for p in paths[i : i + self.SYNC_BATCH_SIZE]]
+                self._pool.submit(self._do_sync_batch, batch)
+
+    def _get_manifest(self):
+        if self._manifest is None:
+            from athena.memory.delta_manifest import DeltaManifest
+
+            self._manifest = DeltaManifest()
+        return self._manifest
+
+    def _bump(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def _do_sync_batch(self, file_paths: list[Path], batch_size: int = SYNC_BATCH_SIZE):
+        """Sync a batch of files (batched embeddings + per-table upserts)."""
+        routed = []
+        for file_path in file_paths:
+            table = resolve_table(file_path)
+            if not table:
+                logger.debug(f"⏩ Ignored (no table mapping): {file_path.name}")
+                self._bump("skipped")
+                continue
+            routed.append((file_path, table))
+
+        if not routed:
             return
 
         if self.dry_run:
-            logger.info(f"🔍 [DRY RUN] Would sync: {file_path.name} → {table}")
+            for file_path, table in routed:
+                logger.info(f"🔍 [DRY RUN] Would sync: {file_path.name} → {table}")
             return
 
         try:
-            from athena.memory.sync import sync_file_to_supabase
-
-            logger.info(f"📡 Syncing: {file_path.name} → {table}")
-            sync_file_to_supabase(file_path, table)
-            self._stats["synced"] += 1
-            logger.info(f"✅ Synced: {file_path.name}")
+            from athena.memory.local_index import get_local_index
 
+            # Keep the shared local index fresh even when athenad is not running
+            get_local_index().index_paths(str(p.resolve()) for p, _ in routed)
         except Exception as e:
-            self._stats["errors"] += 1
-            logger.error(f"❌ Sync failed for {file_path.name}: {e}")
+            logger.warning(f"⚠️ Local index update failed: {e}")
+
+        try:
+            from athena.memory.sync import sync_files_to_supabase
+
+            logger.info(f"📡 Syncing {len(routed)} file(s)...")
+            manifest = self._get_manifest()
+            result = sync_files_to_supabase(routed, manifest=manifest, batch_size=batch_size)
+            manifest.save()
+            for key in ("synced", "skipped", "errors"):
+                self._bump(key, result[key])
+            logger.info(
+                f"✅ Batch done: {result['synced']} synced, "
+                f"{result['skipped']} unchanged, {result['errors']} errors"
+            )
 
-        # Cleanup pending reference
-        with self._lock:
-            self._pending.pop(str(file_path), None)
+        except Exception as e:
+            self._bump("errors", len(routed))
+            logger.error(f"❌ Sync failed for batch of {len(routed)}: {e}")
+
+    def close(self):
+        """Stop the scheduler and wait for in-flight batches."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+            scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.join(timeout=5)
+        self._pool.shutdown(wait=True)
 
     @property
     def stats(self):
-        return dict(self._stats)
+        with self._stats_lock:
+            return dict(self._stats)
 
 
 # ── Heartbeat Daemon ──────────────────────────────────────────────────────────
@@ -227,6 +368,7 @@ class Heartbeat:
         if self.observer:
             self.observer.stop()
             self.observer.join()
+            self.handler.close()
             stats = self.handler.stats
             logger.info(
                 f"💓 Heartbeat stopped. "
@@ -248,54 +390,95 @@ class Heartbeat:
         finally:
             self.stop()
 
-    def scan_once(self):
-        """Single scan: find all unsynced files and sync them."""
-        setup_logging()
-        logger.info("🔍 Running single-pass scan...")
-
-        from athena.memory.sync import sync_file_to_supabase, load_manifest, get_file_hash
-
-        manifest = load_manifest()
-        synced = 0
-        skipped = 0
-
-        for dir_path in self.watch_dirs:
-            table = None
-            # Resolve table for this directory
-            for tname, tpath in CORE_DIRS.items():
-                if dir_path == tpath:
-                    table = tname
-                    break
-            if not table:
-                for tpath, tname in EXTENDED_DIRS:
-                    if dir_path == tpath:
-                        table = tname
-                        break
-
+    def _scan_dir(self, dir_path: Path, manifest) -> tuple[list[tuple[Path, str]], int]:
+        """Stat-first scan of one directory. Returns (changed files, unchanged count)."""
+        changed = []
+        unchanged = 0
+        for md_file in dir_path.rglob("*.md"):
+            if md_file.name.startswith((".", "~")):
+                continue
+            table = resolve_table(md_file)
             if not table:
                 continue
+            if manifest.should_sync(md_file):
+                changed.append((md_file, table))
+            else:
+                unchanged += 1
+        return changed, unchanged
+
+    def scan_once(self, max_workers: int = 8) -> dict:
+        """
+        Single scan: find all unsynced files and sync them.
+
+        Directories are scanned in parallel using DeltaManifest's size/mtime
+        quick-check (files are only hashed when their stats changed). Changed
+        files then go through the bulk sync pipeline. In dry-run mode nothing
+        is synced; the report lists exactly what would be, per table.
+        """
+        setup_logging()
+        logger.info("🔍 Running single-pass scan...")
 
-            for md_file in dir_path.rglob("*.md"):
-                rel = str(md_file.relative_to(PROJECT_ROOT))
-                content = md_file.read_text(encoding="utf-8", errors="replace")
-                current_hash = get_file_hash(content)
+        from athena.memory.delta_manifest import DeltaManifest
+
+        started = time.perf_counter()
+        manifest = DeltaManifest()
+
+        pending: Dict[str, tuple[Path, str]] = {}
+        unchanged = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self._scan_dir, d, manifest) for d in self.watch_dirs]
+            for future in futures:
+                changed, skipped = future.result()
+                unchanged += skipped
+                for md_file, table in changed:
+                    pending.setdefault(str(md_file.resolve()), (md_file, table))
+
+        by_table: Dict[str, list[str]] = {}
+        for md_file, table in pending.values():
+            by_table.setdefault(table, []).append(_display_path(md_file))
+
+        report = {
+            "dry_run": self.dry_run,
+            "tables": {t: sorted(files) for t, files in sorted(by_table.items())},
+            "pending": len(pending),
+            "unchanged": unchanged,
+            "scan_seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info(
+            f"⏱️  Scanned {len(self.watch_dirs)} dirs in {report['scan_seconds']}s: "
+            f"{len(pending)} pending, {unchanged} unchanged"
+        )
 
-                if manifest.get(rel) == current_hash:
-                    skipped += 1
-                    continue
-
-                if self.dry_run:
-                    logger.info(f"🔍 [DRY RUN] Would sync: {md_file.name} → {table}")
-                else:
-                    try:
-                        sync_file_to_supabase(
-                            md_file, table, manifest=manifest, save_on_success=False
-                        )
-                        synced += 1
-                    except Exception as e:
-                        logger.error(f"❌ {md_file.name}: {e}")
-
-        logger.info(f"✅ Scan complete. Synced: {synced}, Skipped (unchanged): {skipped}")
+        if self.dry_run:
+            for table, files in report["tables"].items():
+                logger.info(f"🔍 [DRY RUN] {table}: {len(files)} file(s) would sync")
+                for rel in files:
+                    logger.info(f"     {rel}")
+            return report
+
+        from athena.memory.sync import sync_files_to_supabase
+
+        # _scan_dir already ran manifest.should_sync on every pending file
+        result = sync_files_to_supabase(
+            list(pending.values()), manifest=manifest, prefiltered=True
+        )
+        manifest.save()
+        report.update(result)
+        report["total_seconds"] = round(time.perf_counter() - started, 3)
+
+        logger.info(
+            f"✅ Scan complete. Synced: {result['synced']}, "
+            f"Skipped (unchanged): {unchanged + result['skipped']}, "
+            f"Errors: {result['errors']} ({report['total_seconds']}s)"
+        )
+        return report
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(PROJECT_ROOT.resolve()))
+    except ValueError:
+        return str(path)
 
 
 # ── CLI Entry Point ───────────────────────────────────────────────────────────
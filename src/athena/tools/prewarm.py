@@ -0,0 +1,184 @@
+"""
+athena.tools.prewarm
+====================
+
+Search-cache prewarm driven by real query history.
+
+Mines the most frequent/recent queries from search telemetry, fetches their
+embeddings in one batch, then replays them through the retrieval pipeline
+concurrently on low-priority daemon threads until a time budget is spent.
+Workers stop taking queries at the deadline and a query still running then
+is abandoned rather than joined, so the budget also bounds how long the
+boot/CLI process can be held open at exit. Both the exact and the semantic
+cache are filled, so paraphrases of a warmed query also hit.
+
+The warmed set is recorded in .agent/state/prewarm_state.json; the next
+boot reports how many searches in between were served by a warmed entry.
+
+Usage:
+    from athena.tools.prewarm import PrewarmEngine
+
+    engine = PrewarmEngine(budget_seconds=20)
+    print(engine.last_report())   # Warm-hit rate of the previous prewarm
+    print(engine.run())
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+from athena.core.config import STATE_DIR
+
+PREWARM_STATE_PATH = STATE_DIR / "prewarm_state.json"
+SEED_QUERIES = ["recent session context"]
+DEFAULT_BUDGET_SECONDS = 20.0
+DEFAULT_MAX_QUERIES = 8
+LOW_PRIORITY_NICE = 10
+
+
+def _lower_thread_priority():
+    """Renice the calling worker thread (Linux), best effort."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), LOW_PRIORITY_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class PrewarmEngine:
+    """Concurrent, budgeted replay of top queries into the search cache."""
+
+    def __init__(
+        self,
+        budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+        max_queries: int = DEFAULT_MAX_QUERIES,
+        max_workers: int = 4,
+    ):
+        self.budget_seconds = budget_seconds
+        self.max_queries = max_queries
+        self.max_workers = max_workers
+
+    def plan(self) -> list[dict]:
+        """Top queries from telemetry, topped up with the seed queries."""
+        from athena.core.search_telemetry import get_top_queries
+
+        planned = get_top_queries(limit=self.max_queries)
+        seen = {p["query"] for p in planned}
+        for seed in SEED_QUERIES:
+            if len(planned) >= self.max_queries:
+                break
+            if seed not in seen:
+                planned.append(
+                    {
+                        "query": seed,
+                        "limit": 10,
+                        "strict": False,
+                        "rerank": False,
+                        "skills_only": False,
+                        "score": 0.0,
+                    }
+                )
+        return planned
+
+    @staticmethod
+    def _batch_embeddings(queries: list[str]) -> list:
+        try:
+            from athena.memory.vectors import get_embeddings
+
+            return get_embeddings(queries)
+        except Exception:
+            return [None] * len(queries)  # retrieve() falls back per query
+
+    def run(self) -> dict:
+        """
+        Warm the cache within the time budget.
+
+        Returns:
+            {"planned": int, "warmed": [query, ...], "skipped": int, "elapsed": float}
+        """
+        from athena.core.search_telemetry import compact_log
+
+        start = time.monotonic()
+        deadline = start + self.budget_seconds
+        planned = self.plan()
+        embeddings = self._batch_embeddings([p["query"] for p in planned])
+        warmed = self._replay(planned, embeddings, deadline)
+
+        self._save_state(warmed)
+        compact_log()
+        return {
+            "planned": len(planned),
+            "warmed": warmed,
+            "skipped": len(planned) - len(warmed),
+            "elapsed": round(time.monotonic() - start, 2),
+        }
+
+    def _replay(self, planned: list[dict], embeddings: list, deadline: float) -> list[str]:
+        """Run the planned queries on daemon workers; return those warmed by the deadline."""
+        from athena.tools.search import retrieve
+
+        jobs: queue.SimpleQueue[tuple[dict, object]] = queue.SimpleQueue()
+        for job in zip(planned, embeddings, strict=True):
+            jobs.put(job)
+        results: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+
+        def worker():
+            _lower_thread_priority()
+            while time.monotonic() < deadline:
+                try:
+                    p, emb = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    retrieve(
+                        p["query"],
+                        limit=p["limit"],
+                        strict=p["strict"],
+                        rerank=p["rerank"],
+                        json_output=True,
+                        skills_only=p["skills_only"],
+                        embedding=emb,
+                    )
+                    results.put(p["query"])
+                except Exception:
+                    results.put(None)
+
+        for i in range(min(self.max_workers, len(planned))):
+            threading.Thread(target=worker, name=f"prewarm-{i}", daemon=True).start()
+
+        warmed = []
+        for _ in planned:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                query = results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if query is not None:
+                warmed.append(query)
+        return warmed
+
+    @staticmethod
+    def _save_state(warmed: list[str]):
+        try:
+            PREWARM_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = PREWARM_STATE_PATH.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"warmed_at": time.time(), "queries": warmed}))
+            tmp.replace(PREWARM_STATE_PATH)
+        except OSError:
+            pass
+
+    @staticmethod
+    def last_report() -> dict | None:
+        """Warm-hit rate since the previous prewarm (None if never run)."""
+        from athena.core.search_telemetry import get_warm_hit_rate
+
+        try:
+            state = json.loads(PREWARM_STATE_PATH.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        report = get_warm_hit_rate(state.get("queries", []), since=state["warmed_at"])
+        report["warmed"] = len(state.get("queries", []))
+        return report
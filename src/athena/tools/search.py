@@ -11,9 +11,11 @@ import contextlib
 import json
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, wait, ALL_COMPLETED
+from concurrent.futures import TimeoutError as FutureTimeout
 
 from athena.core.config import (
     PROJECT_ROOT,
@@ -24,6 +26,7 @@ from athena.core.config import (
 )
 from athena.core.models import SearchResult
 from athena.core.cache import get_search_cache
+from athena.core.content_cache import get_content_cache
 # Lazy imports to speed up CLI startup
 # from athena.memory.vectors import ... (Moved inside functions)
 # from athena.tools.reranker import ... (Moved inside functions)
@@ -41,6 +44,10 @@ RESET = "\033[0m"
 # God Mode: Aggressive latency optimization
 GOD_MODE = True
 
+# Query embeddings (Supabase/Gemini cold starts) are bounded on every thread
+EMBED_TIMEOUT = 3.0
+EMBED_WORKERS = 4
+
 # Config
 # NOTE: Vector subtypes (case_study, session, protocol, etc.) each get their own
 # weight so RRF applies them correctly.
@@ -114,7 +121,7 @@ def collect_canonical(query: str) -> list[SearchResult]:
         return []
 
     try:
-        text = CANONICAL_PATH.read_text(encoding="utf-8")
+        text = get_content_cache().read_text(CANONICAL_PATH)
         for line_num, line in enumerate(text.splitlines(), 1):
             line_lower = line.lower()
             # Require 2+ keyword matches to reduce noise
@@ -201,7 +208,6 @@ def collect_vectors(
     results = []
     try:
         from athena.memory.vectors import (
-            get_embedding,
             get_client,
             search_sessions,
             search_case_studies,
@@ -216,7 +222,7 @@ def collect_vectors(
             search_system_docs,
         )
 
-        query_embedding = embedding if embedding else get_embedding(query)
+        query_embedding = embedding if embedding else _fetch_query_embedding(query)
 
         # God Mode Limits
         high_limit = 10
@@ -485,7 +491,7 @@ def collect_framework_docs(query: str) -> list[SearchResult]:
         # Use grep -rl to find files containing any keyword, then score by density
         for md_file in framework_dir.rglob("*.md"):
             try:
-                text = md_file.read_text(encoding="utf-8")[:5000]  # First 5k chars
+                text = get_content_cache().read_text(md_file)[:5000]  # First 5k chars
                 text_lower = text.lower()
                 hits = sum(1 for k in keywords if k.lower() in text_lower)
                 if hits >= min(2, len(keywords)):
@@ -518,7 +524,7 @@ def collect_framework_docs(query: str) -> list[SearchResult]:
         if memory_bank_dir.exists():
             for md_file in memory_bank_dir.rglob("*.md"):
                 try:
-                    text = md_file.read_text(encoding="utf-8")[:3000]
+                    text = get_content_cache().read_text(md_file)[:3000]
                     text_lower = text.lower()
                     hits = sum(1 for k in keywords if k.lower() in text_lower)
                     if hits >= min(2, len(keywords)):
@@ -556,29 +562,18 @@ def collect_framework_docs(query: str) -> list[SearchResult]:
 
 
 def collect_sqlite(query: str, limit: int = 10) -> list[SearchResult]:
-    """Sovereign Fallback: Search the local SQLite index (athena.db)."""
-    import sqlite3
-    from athena.core.config import INPUTS_DIR
+    """Sovereign Fallback: Search the shared local index (athena.db)."""
+    from athena.memory.local_index import get_local_index
 
-    db_path = INPUTS_DIR / "athena.db"
-    if not db_path.exists():
+    index = get_local_index()
+    if not index.exists():
         return []
 
     results = []
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Keyword search on tags and filenames
-        query_sanitized = f"%{query}%"
-
         # 1. Search Files by Path/Name
-        cursor.execute(
-            "SELECT path FROM files WHERE path LIKE ? LIMIT ?", (query_sanitized, limit)
-        )
-        for row in cursor.fetchall():
-            filepath = Path(row["path"])
+        for path in index.search_paths(query, limit):
+            filepath = Path(path)
             results.append(
                 SearchResult(
                     id=f"Local:File:{filepath.name}",
@@ -590,31 +585,30 @@ def collect_sqlite(query: str, limit: int = 10) -> list[SearchResult]:
             )
 
         # 2. Search by Tags
-        cursor.execute(
-            """
-            SELECT f.path, t.name 
-            FROM files f
-            JOIN file_tags ft ON f.path = ft.file_path
-            JOIN tags t ON ft.tag_id = t.id
-            WHERE t.name LIKE ?
-            LIMIT ?
-        """,
-            (query_sanitized, limit),
-        )
-
-        for row in cursor.fetchall():
-            filepath = Path(row["path"])
+        for path, tag in index.search_tags(query, limit):
+            filepath = Path(path)
             results.append(
                 SearchResult(
-                    id=f"Local:Tag:{row['name']}:{filepath.name}",
-                    content=f"Tag match: #{row['name']}",
+                    id=f"Local:Tag:{tag}:{filepath.name}",
+                    content=f"Tag match: #{tag}",
                     source="sqlite",
                     score=0.9,
                     metadata={"path": str(filepath)},
                 )
             )
 
-        conn.close()
+        # 3. Full-text content (FTS5, best rank first)
+        for i, hit in enumerate(index.search_content(query, limit)):
+            filepath = Path(hit["path"])
+            results.append(
+                SearchResult(
+                    id=f"Local:Content:{filepath.name}",
+                    content=hit["snippet"] or hit["title"] or filepath.name,
+                    source="sqlite",
+                    score=max(0.95 - i * 0.05, 0.5),
+                    metadata={"path": str(filepath)},
+                )
+            )
     except Exception as e:
         print(f"   ⚠️ SQLite fallback failed: {e}", file=sys.stderr)
 
@@ -640,7 +634,7 @@ def collect_exocortex(query: str, limit: int = 5) -> list[SearchResult]:
         # Sanitize term for FTS5
         # Tokenize and wrap in quotes to prevent column syntax interpretation (e.g. 1:1)
         # "trend" "continuation" "1:1"
-        tokens = [f'"{token.replace('"', '""')}"' for token in query.split()]
+        tokens = ['"' + token.replace('"', '""') + '"' for token in query.split()]
         clean_query = " ".join(tokens)
 
         # FTS query syntax
@@ -701,16 +695,56 @@ def weighted_rrf(
 # --- Main Entry Point ---
 
 
-def run_search(
+_embed_pool: ThreadPoolExecutor | None = None
+_embed_pool_lock = threading.Lock()
+
+
+def _get_embed_pool() -> ThreadPoolExecutor:
+    global _embed_pool
+    if _embed_pool is None:
+        with _embed_pool_lock:
+            if _embed_pool is None:
+                _embed_pool = ThreadPoolExecutor(
+                    max_workers=EMBED_WORKERS, thread_name_prefix="athena-embed"
+                )
+    return _embed_pool
+
+
+def _fetch_query_embedding(query: str) -> list[float]:
+    """get_embedding bounded to EMBED_TIMEOUT seconds, from any thread.
+
+    The caller stops waiting at the deadline; the fetch itself carries the
+    same HTTP timeout, so an abandoned request does not linger either.
+    """
+    from athena.memory.vectors import get_embedding
+
+    future = _get_embed_pool().submit(get_embedding, query, timeout=EMBED_TIMEOUT)
+    try:
+        return future.result(timeout=EMBED_TIMEOUT)
+    except FutureTimeout:
+        future.cancel()  # Still queued behind other slow fetches
+        raise TimeoutError("Embedding fetch timed out") from None
+
+
+def retrieve(
     query: str,
     limit: int = 10,
     strict: bool = False,
     rerank: bool = False,
-    debug: bool = False,
     json_output: bool = False,
     include_personal: bool = False,
     skills_only: bool = False,
-):
+    embedding: list[float] | None = None,
+) -> tuple[list[SearchResult], str]:
+    """
+    Cache lookup + parallel hybrid collection + fusion (+ rerank).
+
+    Fills both the exact and the semantic cache on a miss. Safe to call from
+    worker threads (used by the prewarm engine with a precomputed embedding).
+
+    Returns:
+        (fused_results, hit) where hit is "exact" | "semantic" | "miss".
+    """
     # 0. Check cache first
     cache = get_search_cache()
     cache_key = f"{query}|{limit}|{strict}|{rerank}|{skills_only}"
@@ -720,198 +754,268 @@ def run_search(
         if not json_output:
             print(f'\n⚡ CACHE HIT: "{query}"')
             print("=" * 60)
-        fused_results = cached_results
-    else:
-        # 0.5. Check Semantic Cache (if miss on exact)
-        query_embedding = None
-        if not json_output:
-            print("   ⚡ Checking semantic cache...")
+        return cached_results, "exact"
 
-        try:
-            # We need the embedding for semantic check
-            # This corresponds to "Step 2: Fetch embedding" in the plan
-            from athena.memory.vectors import get_embedding
-            import signal
+    hit = "miss"
+    # 0.5. Check Semantic Cache (if miss on exact)
+    query_embedding = embedding
+    if not json_output:
+        print("   ⚡ Checking semantic cache...")
 
-            # Timeout wrapper for get_embedding (Supabase cold start issues)
-            def handler(signum, frame):
-                raise TimeoutError("Embedding fetch timed out")
+    try:
+        # We need the embedding for semantic check
+        if query_embedding is None:
+            query_embedding = _fetch_query_embedding(query)
 
-            # Set the signal handler and a 3-second alarm
-            signal.signal(signal.SIGALRM, handler)
-            signal.alarm(3)
+        semantic_hit = cache.get_semantic(query_embedding)
 
+        if semantic_hit:
+            if not json_output:
+                print(f'🔥 SEMANTIC CACHE HIT: "{query}"')
+                print("=" * 60)
+            fused_results = semantic_hit
+            hit = "semantic"
+        else:
+            raise ValueError("Semantic Miss")
+    except Exception as e:
+        # Embedding failed or semantic miss - continue with hybrid search
+        # Make embedding optional for non-vector search methods
+        if "404" in str(e) or "GOOGLE_API_KEY" in str(e) or "timed out" in str(e):
+            if not json_output:
+                print(
+                    f"\n   {YELLOW}⚠️  FALLBACK: Vector search unavailable ({e}){RESET}",
+                    file=sys.stderr,
+                )
+                print(
+                    f"   {DIM}Primary: TAG_INDEX & GraphRAG active.{RESET}\n",
+                    file=sys.stderr,
+                )
+            query_embedding = None  # Proceed without vectors
+
+        # Fallback to full search
+        if not json_output:
+            print(
+                f'\n🔍 SMART SEARCH (Parallel Hybrid RRF{" + Rerank" if rerank else ""}): "{query}"'
+            )
+            print("=" * 60)
+
+        # 1. Collect (Parallel execution)
+        # Wrapper for robust execution
+
+        # 1. Collect (Parallel execution)
+        exclude_domains = [] if include_personal else ["personal"]
+
+        # Helper to create safe lambdas
+        def safe_exec(name, func):
             try:
-                query_embedding = get_embedding(query)
-            finally:
-                signal.alarm(0)  # Disable alarm
+                return func()
+            except Exception as e:
+                print(f"   ⚠️ {name} task failed: {e}", file=sys.stderr)
+                return []
 
-            semantic_hit = cache.get_semantic(query_embedding)
+        if skills_only:
+            collection_tasks = {
+                "vector": lambda: collect_vectors(
+                    query,
+                    embedding=query_embedding,
+                    exclude_domains=exclude_domains,
+                    skills_only=True,
+                )
+            }
+        else:
+            collection_tasks = {
+                "canonical": lambda: collect_canonical(query),
+                "tags": lambda: collect_tags(query),
+                "graphrag": lambda: collect_graphrag(query),
+                "vector": lambda: collect_vectors(
+                    query,
+                    embedding=query_embedding,
+                    exclude_domains=exclude_domains,
+                ),
+                "sqlite": lambda: collect_sqlite(query),
+                "filename": lambda: collect_filenames(query),
+                "framework_docs": lambda: collect_framework_docs(query),
+                "exocortex": lambda: collect_exocortex(query),
+            }
+
+        lists = {}
+        with ThreadPoolExecutor(max_workers=len(collection_tasks)) as executor:
+            future_to_source = {
+                executor.submit(safe_exec, source, func): source
+                for source, func in collection_tasks.items()
+                if source != "vector"  # Defer vector launch
+            }
+
+            # Adaptive Latency: Entropy Check
+            # If query is short (< 5 words) and generic, skip vectors
+            word_count = len(query.split())
+            is_low_entropy = word_count < 5 and not any(
+                x in query.lower()
+                for x in ["protocol", "session", "case study", "cs-"]
+            )
 
-            if semantic_hit:
-                if not json_output:
-                    print(f'🔥 SEMANTIC CACHE HIT: "{query}"')
-                    print("=" * 60)
-                fused_results = semantic_hit
-                # Proceed to display (skip collection)
-                pass
-            else:
-                raise ValueError("Semantic Miss")
-        except Exception as e:
-            # Embedding failed or semantic miss - continue with hybrid search
-            # Make embedding optional for non-vector search methods
-            if "404" in str(e) or "GOOGLE_API_KEY" in str(e) or "timed out" in str(e):
+            if is_low_entropy and not include_personal and not skills_only:
                 if not json_output:
                     print(
-                        f"\n   {YELLOW}⚠️  FALLBACK: Vector search unavailable ({e}){RESET}",
-                        file=sys.stderr,
+                        f"   ⚡ Low Entropy Query: Skipping deep retrieval (Vectors bypassed)"
                     )
+            else:
+                # Launch vector search
+                future_to_source[
+                    executor.submit(safe_exec, "vector", collection_tasks["vector"])
+                ] = "vector"
+
+            # God Mode Timeout
+            timeout = 8 if not GOD_MODE else 5
+
+            # Wait for ALL to finish (or timeout)
+            done, not_done = wait(
+                future_to_source.keys(), timeout=timeout, return_when=ALL_COMPLETED
+            )
+
+            # Collect finished results
+            for future in done:
+                source = future_to_source[future]
+                try:
+                    lists[source] = future.result()
+                except Exception:
+                    lists[source] = []
+
+            # Report timeouts
+            for future in not_done:
+                source = future_to_source[future]
+                if not json_output:
                     print(
-                        f"   {DIM}Primary: TAG_INDEX & GraphRAG active.{RESET}\n",
-                        file=sys.stderr,
+                        f"   ⚠️ {source} timed out (Tier 2 limit)", file=sys.stderr
                     )
-                query_embedding = None  # Proceed without vectors
+                # We simply don't add it to lists, effectively skipping it
+                # Ensure we cancel if possible (though Python threads can't be killed)
+                future.cancel()
+
+        # 2. Fuse
+        # Split vector results by their type-specific source for correct
+        # per-type RRF weighting (e.g., case_study=3.0, session=3.0, protocol=2.8)
+        vector_items = lists.pop("vector", [])
+        for item in vector_items:
+            type_key = item.source  # e.g., "case_study", "session", "protocol"
+            if type_key not in lists:
+                lists[type_key] = []
+            lists[type_key].append(item)
+
+        fused_results = weighted_rrf(lists)
+
+    # 3. Rerank
+    if rerank and fused_results:
+        candidates = fused_results[:25]
+        if not json_output:
+            print(f"   ⚡ Reranking top {len(candidates)} candidates...")
+        from athena.tools.reranker import rerank_results
 
-            # Fallback to full search
-            if not json_output:
-                print(
-                    f'\n🔍 SMART SEARCH (Parallel Hybrid RRF{" + Rerank" if rerank else ""}): "{query}"'
-                )
-                print("=" * 60)
+        fused_results = rerank_results(query, candidates, top_k=limit)
 
-            # 1. Collect (Parallel execution)
-            # Wrapper for robust execution
+    # Cache the result (Exact + Semantic)
+    if fused_results and query_embedding:
+        cache.set(query, fused_results, embedding=query_embedding)
 
-            # 1. Collect (Parallel execution)
-            exclude_domains = [] if include_personal else ["personal"]
+    # Store in cache for next time
+    cache.set(cache_key, fused_results)
+    return fused_results, hit
 
-            # Helper to create safe lambdas
-            def safe_exec(name, func):
-                try:
-                    return func()
-                except Exception as e:
-                    print(f"   ⚠️ {name} task failed: {e}", file=sys.stderr)
-                    return []
-
-            if skills_only:
-                collection_tasks = {
-                    "vector": lambda: collect_vectors(
-                        query,
-                        embedding=query_embedding,
-                        exclude_domains=exclude_domains,
-                        skills_only=True,
-                    )
-                }
-            else:
-                collection_tasks = {
-                    "canonical": lambda: collect_canonical(query),
-                    "tags": lambda: collect_tags(query),
-                    "graphrag": lambda: collect_graphrag(query),
-                    "vector": lambda: collect_vectors(
-                        query,
-                        embedding=query_embedding,
-                        exclude_domains=exclude_domains,
-                    ),
-                    "sqlite": lambda: collect_sqlite(query),
-                    "filename": lambda: collect_filenames(query),
-                    "framework_docs": lambda: collect_framework_docs(query),
-                    "exocortex": lambda: collect_exocortex(query),
-                }
-
-            lists = {}
-            with ThreadPoolExecutor(max_workers=len(collection_tasks)) as executor:
-                future_to_source = {
-                    executor.submit(safe_exec, source, func): source
-                    for source, func in collection_tasks.items()
-                    if source != "vector"  # Defer vector launch
-                }
-
-                # Adaptive Latency: Entropy Check
-                # If query is short (< 5 words) and generic, skip vectors
-                word_count = len(query.split())
-                is_low_entropy = word_count < 5 and not any(
-                    x in query.lower()
-                    for x in ["protocol", "session", "case study", "cs-"]
-                )
 
-                if is_low_entropy and not include_personal and not skills_only:
-                    if not json_output:
-                        print(
-                            f"   ⚡ Low Entropy Query: Skipping deep retrieval (Vectors bypassed)"
-                        )
-                else:
-                    # Launch vector search
-                    future_to_source[
-                        executor.submit(safe_exec, "vector", collection_tasks["vector"])
-                    ] = "vector"
-
-                # God Mode Timeout
-                timeout = 8 if not GOD_MODE else 5
-
-                # Wait for ALL to finish (or timeout)
-                done, not_done = wait(
-                    future_to_source.keys(), timeout=timeout, return_when=ALL_COMPLETED
-                )
+def _record_query(query, hit, limit, strict, rerank, skills_only):
+    with contextlib.suppress(Exception):
+        from athena.core.search_telemetry import log_search_query
 
-                # Collect finished results
-                for future in done:
-                    source = future_to_source[future]
-                    try:
-                        lists[source] = future.result()
-                    except Exception:
-                        lists[source] = []
-
-                # Report timeouts
-                for future in not_done:
-                    source = future_to_source[future]
-                    if not json_output:
-                        print(
-                            f"   ⚠️ {source} timed out (Tier 2 limit)", file=sys.stderr
-                        )
-                    # We simply don't add it to lists, effectively skipping it
-                    # Ensure we cancel if possible (though Python threads can't be killed)
-                    future.cancel()
-
-            # 2. Fuse
-            # Split vector results by their type-specific source for correct
-            # per-type RRF weighting (e.g., case_study=3.0, session=3.0, protocol=2.8)
-            vector_items = lists.pop("vector", [])
-            for item in vector_items:
-                type_key = item.source  # e.g., "case_study", "session", "protocol"
-                if type_key not in lists:
-                    lists[type_key] = []
-                lists[type_key].append(item)
-
-            fused_results = weighted_rrf(lists)
-
-        # 3. Rerank
-        if rerank and fused_results:
-            candidates = fused_results[:25]
-            if not json_output:
-                print(f"   ⚡ Reranking top {len(candidates)} candidates...")
-            from athena.tools.reranker import rerank_results
+        log_search_query(query, hit, limit, strict, rerank, skills_only)
 
-            fused_results = rerank_results(query, candidates, top_k=limit)
 
-        # Cache the result (Exact + Semantic)
-        if fused_results and query_embedding:
-            cache.set(query, fused_results, embedding=query_embedding)
+def filter_strict(
+    fused_results: list[SearchResult], strict: bool
+) -> tuple[list[SearchResult], int]:
+    """Drop results below CONFIDENCE_MED in strict mode. Returns (kept, suppressed)."""
+    if not strict:
+        return fused_results, 0
+    high_conf = [r for r in fused_results if r.rrf_score >= CONFIDENCE_MED]
+    return high_conf, len(fused_results) - len(high_conf)
 
-        # Store in cache for next time
-        cache.set(cache_key, fused_results)
+
+def json_payload(
+    fused_results: list[SearchResult], limit: int, suppressed_count: int
+) -> dict:
+    """The --json output shape (shared by the CLI and the MCP server)."""
+    if not fused_results:
+        return {
+            "results": [],
+            "suppressed": suppressed_count,
+            "message": "No high-confidence results",
+        }
+    return {
+        "results": [doc.to_dict() for doc in fused_results[:limit]],
+        "suppressed": suppressed_count,
+    }
+
+
+def search_payload(
+    query: str,
+    limit: int = 10,
+    strict: bool = False,
+    rerank: bool = False,
+    include_personal: bool = False,
+    skills_only: bool = False,
+    record_query: bool = True,
+) -> tuple[dict, str]:
+    """
+    run_search(json_output=True) without printing (no stdout capture needed).
+
+    Returns:
+        (payload, hit) — payload as json_payload(); hit as retrieve().
+    """
+    fused_results, hit = retrieve(
+        query,
+        limit=limit,
+        strict=strict,
+        rerank=rerank,
+        json_output=True,
+        include_personal=include_personal,
+        skills_only=skills_only,
+    )
+    if record_query:
+        _record_query(query, hit, limit, strict, rerank, skills_only)
+    kept, suppressed_count = filter_strict(fused_results, strict)
+    return json_payload(kept, limit, suppressed_count), hit
+
+
+def run_search(
+    query: str,
+    limit: int = 10,
+    strict: bool = False,
+    rerank: bool = False,
+    debug: bool = False,
+    json_output: bool = False,
+    include_personal: bool = False,
+    skills_only: bool = False,
+    record_query: bool = True,
+):
+    fused_results, hit = retrieve(
+        query,
+        limit=limit,
+        strict=strict,
+        rerank=rerank,
+        json_output=json_output,
+        include_personal=include_personal,
+        skills_only=skills_only,
+    )
+
+    # Query history feeds the boot-time cache prewarm
+    if record_query:
+        _record_query(query, hit, limit, strict, rerank, skills_only)
 
     # 4. Filter
-    if strict:
-        high_conf = [r for r in fused_results if r.rrf_score >= CONFIDENCE_MED]
-        low_conf = [r for r in fused_results if r.rrf_score < CONFIDENCE_MED]
-        suppressed_count = len(low_conf)
-        fused_results = high_conf
-        if not json_output and suppressed_count > 0:
-            print(
-                f"\n   🛡️ STRICT MODE: {suppressed_count} low-confidence result(s) suppressed"
-            )
-    else:
-        suppressed_count = 0
+    fused_results, suppressed_count = filter_strict(fused_results, strict)
+    if not json_output and suppressed_count > 0:
+        print(
+            f"\n   🛡️ STRICT MODE: {suppressed_count} low-confidence result(s) suppressed"
+        )
 
     if not json_output and fused_results:
         print("\n<athena_grounding>")
@@ -919,15 +1023,7 @@ def run_search(
     # 5. Present
     if not fused_results:
         if json_output:
-            print(
-                json.dumps(
-                    {
-                        "results": [],
-                        "suppressed": suppressed_count,
-                        "message": "No high-confidence results",
-                    }
-                )
-            )
+            print(json.dumps(json_payload(fused_results, limit, suppressed_count)))
         else:
             print(
                 "  (No high-confidence results found)"
@@ -970,8 +1066,7 @@ def run_search(
             pass
     else:
         # JSON output logic
-        output = [doc.to_dict() for doc in fused_results[:limit]]
-        print(json.dumps({"results": output, "suppressed": suppressed_count}))
+        print(json.dumps(json_payload(fused_results, limit, suppressed_count)))
 
 
 if __name__ == "__main__":
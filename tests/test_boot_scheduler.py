@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+test_boot_scheduler.py — Tests for the DAG boot scheduler
+=========================================================
+
+Covers athena.boot.scheduler: dependency ordering, required-task failure
+(including loaders that call sys.exit), deferred tasks, the critical path
+and the boot trace file.
+
+Usage: python3 -m pytest tests/test_boot_scheduler.py -v
+"""
+
+import json
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from athena.boot.scheduler import BootScheduler
+
+
+class TestBootScheduler:
+    """Scheduling and failure semantics."""
+
+    def test_dependencies_run_first_and_independent_tasks_overlap(self):
+        scheduler = BootScheduler()
+        order = []
+        lock = threading.Lock()
+        both_started = threading.Barrier(2, timeout=5)
+
+        def step(name, parallel=False):
+            def fn():
+                if parallel:
+                    both_started.wait()  # Deadlocks unless a and b overlap
+                with lock:
+                    order.append(name)
+                return name
+
+            return fn
+
+        scheduler.add("a", step("a", parallel=True))
+        scheduler.add("b", step("b", parallel=True))
+        scheduler.add("c", step("c"), deps=["a", "b"])
+        scheduler.add("d", step("d"), deps=["c"])
+
+        assert scheduler.run() is True
+        assert set(order[:2]) == {"a", "b"}
+        assert order[2:] == ["c", "d"]
+        assert scheduler.result("d") == "d"
+        assert {t.status for t in scheduler.tasks.values()} == {"ok"}
+
+    def test_required_failure_aborts_and_skips_dependents(self):
+        scheduler = BootScheduler()
+        scheduler.add("integrity", lambda: False, required=True)
+        scheduler.add("session", lambda: "s-1", deps=["integrity"])
+
+        assert scheduler.run() is False
+        assert scheduler.aborted
+        assert scheduler.tasks["integrity"].status == "failed"
+        assert scheduler.tasks["session"].status == "skipped"
+
+    def test_optional_failure_only_skips_dependents(self):
+        scheduler = BootScheduler()
+
+        def broken():
+            raise RuntimeError("no network")
+
+        scheduler.add("sync", broken)
+        scheduler.add("after_sync", lambda: True, deps=["sync"])
+        scheduler.add("independent", lambda: True)
+
+        assert scheduler.run() is True
+        assert scheduler.tasks["sync"].error == "RuntimeError: no network"
+        assert scheduler.tasks["after_sync"].status == "skipped"
+        assert scheduler.tasks["independent"].status == "ok"
+
+    def test_system_exit_in_a_loader_fails_the_boot(self):
+        scheduler = BootScheduler()
+        scheduler.add("integrity", lambda: sys.exit(1), required=True)
+        scheduler.add("session", lambda: "s-1", deps=["integrity"])
+
+        assert scheduler.run() is False  # Reported to main(), not raised in a worker
+        assert scheduler.tasks["integrity"].error == "SystemExit: 1"
+        assert scheduler.tasks["session"].status == "skipped"
+
+    def test_unknown_dependency_is_rejected(self):
+        scheduler = BootScheduler()
+        scheduler.add("session", lambda: True, deps=["missing"])
+        with pytest.raises(ValueError, match="missing"):
+            scheduler.run()
+
+    def test_deferred_tasks_wait_for_their_own_run(self):
+        scheduler = BootScheduler()
+        scheduler.add("session", lambda: "s-1")
+        scheduler.add("prewarm", lambda: True, deps=["session"], deferred=True)
+
+        assert scheduler.run() is True
+        assert scheduler.tasks["prewarm"].status == "pending"
+
+        assert scheduler.run(deferred=True) is True
+        assert scheduler.tasks["prewarm"].status == "ok"
+
+
+class TestBootOutput:
+    """Watchdog aborts and per-step output buffering."""
+
+    def test_output_is_printed_in_dependency_order(self, capsys):
+        scheduler = BootScheduler()
+        b_printed = threading.Event()
+
+        def a():
+            b_printed.wait(5)  # a prints after b in wall-clock time
+            print("from a")
+
+        def b():
+            print("from b")
+            b_printed.set()
+
+        scheduler.add("a", a)
+        scheduler.add("b", b)
+        scheduler.add("c", lambda: print("from c"), deps=["a", "b"])
+        assert scheduler.run() is True
+
+        assert capsys.readouterr().out == "from a\nfrom b\nfrom c\n"
+        assert scheduler.tasks["a"].output == "from a\n"
+
+    @pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="needs SIGALRM")
+    def test_watchdog_exit_is_not_blocked_by_a_hung_step(self, capsys):
+        scheduler = BootScheduler()
+        release = threading.Event()
+
+        def hung():
+            print("stuck in loader")
+            release.wait(30)
+
+        def watchdog(signum, frame):
+            sys.exit(1)
+
+        scheduler.add("quick", lambda: print("quick done"))
+        scheduler.add("hung", hung)
+        previous = signal.signal(signal.SIGALRM, watchdog)
+        signal.setitimer(signal.ITIMER_REAL, 0.2)
+        started = time.monotonic()
+        try:
+            with pytest.raises(SystemExit):
+                scheduler.run()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+            release.set()
+
+        assert time.monotonic() - started < 5
+        out = capsys.readouterr().out
+        assert "quick done" in out and "stuck in loader" in out
+
+
+class TestBootTrace:
+    """Critical path and trace output."""
+
+    def test_critical_path_follows_the_slowest_chain(self):
+        scheduler = BootScheduler()
+        scheduler.add("fast", lambda: True)
+        scheduler.add("slow", lambda: time.sleep(0.05))
+        scheduler.add("final", lambda: True, deps=["fast", "slow"])
+        scheduler.run()
+
+        assert scheduler.critical_path() == ["slow", "final"]
+
+    def test_critical_path_is_empty_before_run(self):
+        scheduler = BootScheduler()
+        scheduler.add("a", lambda: True)
+        assert scheduler.critical_path() == []
+
+    def test_write_trace(self, tmp_path):
+        scheduler = BootScheduler()
+        scheduler.add("integrity", lambda: True, required=True)
+        scheduler.add("session", lambda: time.sleep(0.01), deps=["integrity"])
+        scheduler.add("broken", lambda: 1 / 0)
+        scheduler.run()
+        scheduler.mark_ready()
+
+        path = scheduler.write_trace(tmp_path / "state" / "boot_trace.json")
+        trace = json.loads(path.read_text())
+
+        assert trace["critical_path"] == ["integrity", "session"]
+        assert trace["ready_ms"] >= trace["critical_path_ms"] > 0
+        tasks = {t["name"]: t for t in trace["tasks"]}
+        assert tasks["session"]["deps"] == ["integrity"]
+        assert tasks["session"]["duration_ms"] >= 10
+        assert tasks["broken"]["status"] == "failed"
+        assert tasks["broken"]["error"].startswith("ZeroDivisionError")
+
+    def test_write_trace_is_best_effort(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        scheduler = BootScheduler()
+        assert scheduler.write_trace(blocker / "boot_trace.json") is None
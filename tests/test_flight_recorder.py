@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+test_flight_recorder.py — Tests for the buffered flight recorder
+=================================================================
+
+Covers athena.core.flight_recorder: ordered group commits, flush on close,
+the time bound of the "interval" fsync policy, size-based rotation into
+gzip segments and backward tail reads.
+
+Usage: python3 -m pytest tests/test_flight_recorder.py -v
+"""
+
+import gzip
+import json
+import time
+
+from athena.core import flight_recorder
+from athena.core.flight_recorder import FlightRecorder, last_actions
+
+
+def entry(i: int) -> dict:
+    return {"timestamp": time.time(), "tool": f"tool_{i}", "status": "ok", "params": {"i": i}}
+
+
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestFlightRecorder:
+    """Writer thread, flush semantics and rotation."""
+
+    def test_entries_are_written_in_order(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log, fsync_policy="never")
+        for i in range(1000):
+            recorder.record(entry(i))
+        assert recorder.flush(timeout=5)
+        tools = [json.loads(line)["tool"] for line in log.read_text().splitlines()]
+        assert tools == [f"tool_{i}" for i in range(1000)]
+        recorder.close()
+
+    def test_params_are_snapshotted_at_record_time(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log)
+        params = {"path": "before"}
+        recorder.record({"tool": "write", "status": "ok", "params": params})
+        params["path"] = "after"
+        recorder.close()
+        assert json.loads(log.read_text())["params"] == {"path": "before"}
+
+    def test_close_flushes_pending_entries(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log, fsync_policy="always")
+        for i in range(50):
+            recorder.record(entry(i))
+        recorder.close()
+        assert len(log.read_text().splitlines()) == 50
+
+    def test_flush_after_close_returns(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log, fsync_policy="never")
+        recorder.close()
+        assert recorder.flush() is True  # No timeout: must not wait forever
+        recorder.record(entry(0))  # Written synchronously after shutdown
+        assert recorder.flush() is True
+        assert len(log.read_text().splitlines()) == 1
+
+    def test_records_without_fcntl(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(flight_recorder, "fcntl", None)
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log, fsync_policy="never", max_bytes=256)
+        for i in range(20):
+            recorder.record(entry(i))
+            recorder.flush(timeout=5)
+        recorder.close()
+        assert list(tmp_path.glob("flight_recorder.*.jsonl*"))  # Rotated too
+
+    def test_interval_policy_syncs_an_idle_tail(self, tmp_path, monkeypatch):
+        synced = []
+        real_fsync = flight_recorder.os.fsync
+        monkeypatch.setattr(flight_recorder, "FSYNC_INTERVAL", 0.2)
+        monkeypatch.setattr(
+            flight_recorder.os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd))
+        )
+
+        recorder = FlightRecorder(tmp_path / "flight_recorder.jsonl", fsync_policy="interval")
+        recorder.record(entry(0))
+        assert wait_until(lambda: len(synced) == 1)  # First write syncs immediately
+
+        recorder.record(entry(1))  # Inside the interval: left dirty, then the log goes idle
+        assert wait_until(lambda: len(synced) == 2)
+        recorder.close()
+
+    def test_rotation_compresses_old_segments(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        recorder = FlightRecorder(log, max_bytes=2048)
+        for i in range(200):
+            recorder.record(entry(i))
+            if i % 20 == 19:
+                recorder.flush(timeout=5)
+        recorder.close()
+
+        segments = sorted(tmp_path.glob("flight_recorder.*.jsonl.gz"))
+        assert segments
+        assert not list(tmp_path.glob("*.tmp"))
+        archived = []
+        for segment in segments:
+            with gzip.open(segment, "rt") as f:
+                archived += [json.loads(line)["params"]["i"] for line in f]
+        active = [json.loads(line)["params"]["i"] for line in log.read_text().splitlines()]
+        assert sorted(archived + active) == list(range(200))
+
+
+class TestLastActions:
+    """Tail reads from the end of the log."""
+
+    def test_last_actions_reads_from_the_end(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        log.write_text("".join(json.dumps(entry(i)) + "\n" for i in range(5000)))
+        assert [a["tool"] for a in last_actions(3, log_file=log)] == [
+            "tool_4997",
+            "tool_4998",
+            "tool_4999",
+        ]
+
+    def test_last_actions_continues_into_rotated_segment(self, tmp_path):
+        log = tmp_path / "flight_recorder.jsonl"
+        segment = tmp_path / "flight_recorder.20260101T000000.1.jsonl.gz"
+        with gzip.open(segment, "wt") as f:
+            f.write("".join(json.dumps(entry(i)) + "\n" for i in range(3)))
+        log.write_text(json.dumps(entry(3)) + "\n")
+        assert [a["tool"] for a in last_actions(3, log_file=log)] == [
+            "tool_1",
+            "tool_2",
+            "tool_3",
+        ]
+
+    def test_missing_log_returns_nothing(self, tmp_path):
+        assert last_actions(5, log_file=tmp_path / "flight_recorder.jsonl") == []
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+test_governance.py — Tests for the Doom Loop Detector
+=====================================================
+
+Covers athena.core.governance.DoomLoopDetector: threshold detection,
+sliding-window expiry, the hard history cap and argument hashing.
+
+Usage: python3 -m pytest tests/test_governance.py -v
+"""
+
+import pytest
+
+from athena.core import governance
+from athena.core.governance import DoomLoopDetector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDoomLoopDetector:
+    """Test the sliding-window repeat detector."""
+
+    @pytest.fixture(autouse=True)
+    def setup_clock(self, monkeypatch):
+        self.clock = FakeClock()
+        monkeypatch.setattr(governance.time, "monotonic", self.clock)
+
+    def test_flags_identical_calls_at_threshold(self):
+        detector = DoomLoopDetector(threshold=3, window=60)
+        args = {"query": "same", "limit": 5}
+        assert detector.record("smart_search", args) is False
+        assert detector.record("smart_search", {"limit": 5, "query": "same"}) is False
+        assert detector.record("smart_search", {"query": "other"}) is False
+        assert detector.record("quicksave", args) is False
+        assert detector.record("smart_search", args) is True
+        assert detector.get_stats()["total_violations"] == 1
+
+    def test_calls_expire_out_of_the_window(self):
+        detector = DoomLoopDetector(threshold=3, window=60)
+        detector.record("t", "x")
+        detector.record("t", "x")
+        self.clock.now += 61
+        assert detector.record("t", "x") is False
+        assert detector.get_stats()["history_size"] == 1
+
+        detector.reset()
+        assert detector.get_stats()["history_size"] == 0
+        assert detector._counts == {}
+
+    def test_history_is_capped(self):
+        detector = DoomLoopDetector(threshold=3, window=60, max_history=100)
+        for i in range(1000):
+            detector.record("t", i)
+        assert detector.get_stats()["history_size"] == 100
+        assert sum(detector._counts.values()) == 100
+
+        # Entries evicted by the cap no longer count toward a loop
+        detector = DoomLoopDetector(threshold=2, window=60, max_history=2)
+        detector.record("t", "x")
+        detector.record("t", "y")
+        detector.record("t", "z")
+        assert detector.record("t", "x") is False
+
+    def test_hash_distinguishes_types(self):
+        hashes = {
+            DoomLoopDetector._hash_args(value)
+            for value in (None, "1", b"1", 1, [1], {"a": 1}, "x" * 1_000_000)
+        }
+        assert len(hashes) == 7
+        assert DoomLoopDetector._hash_args({"a": 1, "b": 2}) == DoomLoopDetector._hash_args(
+            {"b": 2, "a": 1}
+        )
+
+    def test_streamed_hash_matches_serialized_json(self):
+        """Chunked hashing of large containers equals hashing json.dumps in one go."""
+        import hashlib
+        import json
+
+        args = {"rows": [{"id": i, "text": "é" * 50, "when": object} for i in range(5000)]}
+        serialized = json.dumps(args, sort_keys=True, default=str).encode("utf-8")
+        assert len(serialized) > 4 * 64 * 1024  # Spans several chunks
+        expected = hashlib.sha256(b"j" + serialized).hexdigest()[:16]
+        assert DoomLoopDetector._hash_args(args) == expected
+
+        circular: list = []
+        circular.append(circular)
+        assert len(DoomLoopDetector._hash_args(circular)) == 16  # Falls back to repr
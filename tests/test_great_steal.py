@@ -147,6 +147,46 @@ class TestSessionsRPC:
         assert len(active) == 1
         assert active[0]["session_id"] == "s2"
 
+    def test_batch_send_and_unread_counts(self):
+        """Batched sends get consecutive ids; unread counts are per session."""
+        for sid in ("master", "A", "idle"):
+            self.rpc.register_session(self.SessionRegister(session_id=sid, role=sid))
+
+        results = self.rpc.send_messages(
+            [
+                self.SessionMessage(from_session="A", to_session="master", content=f"m{i}")
+                for i in range(3)
+            ]
+            + [self.SessionMessage(from_session="master", to_session="A", content="ack")]
+        )
+        ids = [r["id"] for r in results]
+        assert ids == list(range(ids[0], ids[0] + 4))
+
+        unread = {s["session_id"]: s["unread_messages"] for s in self.rpc.list_sessions()}
+        assert unread == {"master": 3, "A": 1, "idle": 0}
+
+        assert len(self.rpc.get_history("master", limit=2, unread_only=True)) == 2
+        unread = {s["session_id"]: s["unread_messages"] for s in self.rpc.list_sessions()}
+        assert unread["master"] == 1
+
+    def test_concurrent_pollers_never_share_messages(self):
+        """Read-and-mark is atomic across threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.rpc.send_messages(
+            [
+                self.SessionMessage(from_session="A", to_session="master", content=f"m{i}")
+                for i in range(200)
+            ]
+        )
+
+        def poll(_):
+            return [m["id"] for m in self.rpc.get_history("master", limit=7, unread_only=True)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            seen = [mid for batch in pool.map(poll, range(40)) for mid in batch]
+        assert len(seen) == len(set(seen)) == 200
+
 
 # =============================================
 # FEATURE 2: Edge Node Tests
@@ -356,6 +396,50 @@ class TestSkillTelemetry:
         assert top[1] == ("Skill B", 3)
         assert top[2] == ("Skill C", 1)
 
+    def test_rollup_is_incremental_and_windowed(self):
+        """Stats come from (day, skill) roll-ups; only new lines are parsed."""
+        import json
+
+        old = {"skill": "Old Skill", "session": "s0", "trigger": "auto",
+               "timestamp": "2020-01-01T10:00:00"}
+        self.log_path.write_text(json.dumps(old) + "\n")
+        self.telem.log_skill_invocation("Protocol 367", "s1", trigger="auto")
+        assert self.telem.get_skill_stats(days=30)["total_invocations"] == 1
+
+        rollup = self.telem.refresh_rollup()
+        assert rollup["offset"] == self.log_path.stat().st_size
+        assert "Old Skill" not in rollup["days"].get("2020-01-01", {})  # Past retention
+
+        # A torn (unterminated) line waits; the next append completes it
+        with open(self.log_path, "a") as f:
+            f.write('{"skill": "Protocol 367", "session": "s2", "timestamp": "9999')
+        assert self.telem.get_skill_stats(days=30)["total_invocations"] == 1
+        with open(self.log_path, "a") as f:
+            f.write('-01-01T00:00:00"}\n')
+        stats = self.telem.get_skill_stats(days=30)
+        assert stats["skills"]["Protocol 367"]["count"] == 2
+        assert stats["skills"]["Protocol 367"]["sessions"] == ["s1", "s2"]
+        assert stats["skills"]["Protocol 367"]["auto_pct"] == 0.5
+
+    def test_log_rotates_after_rollup(self, monkeypatch):
+        """Past MAX_LOG_BYTES the log is rotated without losing counts."""
+        monkeypatch.setattr(self.telem, "MAX_LOG_BYTES", 500)
+        for i in range(20):
+            self.telem.log_skill_invocation("Skill A", f"s{i}")
+        assert self.telem.get_skill_stats(days=1)["total_invocations"] == 20
+        assert not self.log_path.exists()
+        assert self.log_path.with_name("skill_usage.jsonl.1").exists()
+
+        self.telem.log_skill_invocation("Skill A", "s20")
+        assert self.telem.get_skill_stats(days=1)["skills"]["Skill A"]["count"] == 21
+
+    def test_works_without_fcntl(self, monkeypatch):
+        """Platforms without fcntl (Windows) log and roll up without file locks."""
+        monkeypatch.setattr(self.telem, "fcntl", None)
+        self.telem.log_skill_invocation("Protocol 367", "s1")
+        assert self.telem.get_skill_stats(days=1)["total_invocations"] == 1
+        assert not self.log_path.with_name("skill_usage.jsonl.lock").exists()
+
 
 # =============================================
 # FEATURE 5: Skill Nudge (Great Steal III)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+test_import_budget.py — Startup import-time budget for the athena CLI
+=====================================================================
+
+Runs the CLI under `python -X importtime` and fails if the imports added on
+top of a bare interpreter exceed IMPORT_BUDGET_MS, or if heavy optional
+modules (python-dotenv, pydantic, supabase...) leak onto the fast path.
+
+Import times are the best of IMPORT_RUNS runs (cumulative µs as reported by
+-X importtime), so a noisy machine has to be slow every time to fail. The
+budget keeps ~2x headroom over a typical ~30ms and can be raised on slow
+CI with ATHENA_IMPORT_BUDGET_MS.
+
+Usage: python3 -m pytest tests/test_import_budget.py -v
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+IMPORT_BUDGET_MS = float(os.getenv("ATHENA_IMPORT_BUDGET_MS", "80"))
+IMPORT_RUNS = 5
+HEAVY_MODULES = {"dotenv", "pydantic", "supabase", "requests", "fastmcp", "tiktoken"}
+
+
+def _importtime(*args: str, cwd: Path) -> tuple[dict[str, int], set[str]]:
+    """Top-level cumulative import times (us) and all module names imported."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env=env,
+        timeout=60,
+    )
+    top_level, modules = {}, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip().split(".")[0])
+        if not name.startswith("  "):  # Depth 0: not counted by a parent
+            top_level[name.strip()] = int(cumulative)
+    return top_level, modules
+
+
+def _cli_import_ms(*cli_args: str, cwd: Path) -> tuple[float, set[str]]:
+    """Best-of-IMPORT_RUNS import time added by the CLI, and modules it imported."""
+    baseline, _ = _importtime("-c", "pass", cwd=cwd)
+    # Warm run compiles .pyc so the budget measures imports, not compilation
+    _importtime("-m", "athena", *cli_args, cwd=cwd)
+    best, modules = float("inf"), set()
+    for _ in range(IMPORT_RUNS):
+        top_level, run_modules = _importtime("-m", "athena", *cli_args, cwd=cwd)
+        added = sum(us for name, us in top_level.items() if name not in baseline)
+        best = min(best, added / 1000)
+        modules |= run_modules
+    return best, modules
+
+
+class TestImportBudget:
+    """The CLI fast path must not import credentials or service clients."""
+
+    @pytest.mark.parametrize(
+        "cli_args",
+        [("--version",), ("--root", "{tmp}", "save", "budget check")],
+        ids=["version", "save"],
+    )
+    def test_cli_import_budget(self, tmp_path, cli_args):
+        args = [a.format(tmp=tmp_path) for a in cli_args]
+        elapsed_ms, modules = _cli_import_ms(*args, cwd=tmp_path)
+
+        assert not modules & HEAVY_MODULES, f"heavy imports: {modules & HEAVY_MODULES}"
+        assert elapsed_ms < IMPORT_BUDGET_MS, (
+            f"`athena {' '.join(args)}` imports took {elapsed_ms:.1f}ms "
+            f"(budget {IMPORT_BUDGET_MS}ms)"
+        )
+
+    def test_subpackages_are_lazy(self):
+        """`import athena` resolves subpackages on attribute access (PEP 562)."""
+        code = (
+            "import sys, athena; "
+            "assert 'athena.memory' not in sys.modules; "
+            "athena.memory; "
+            "assert 'athena.memory' in sys.modules"
+        )
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True)
+        assert proc.returncode == 0, proc.stderr.decode()
+
+
+class TestLazyEnv:
+    """Library users still see .env values without an explicit load_env()."""
+
+    def test_getenv_loads_dotenv_on_first_miss(self, monkeypatch):
+        import athena
+
+        loads = []
+
+        def load_env():
+            loads.append(1)
+            athena._env_loaded = True
+            os.environ["ATHENA_TEST_FROM_DOTENV"] = "from-.env"
+
+        monkeypatch.setattr(athena, "_env_loaded", False)
+        monkeypatch.setattr(athena, "load_env", load_env)
+        monkeypatch.setenv("ATHENA_TEST_ALREADY_SET", "1")
+        try:
+            assert athena.getenv("ATHENA_TEST_ALREADY_SET") == "1"
+            assert loads == []  # Set variables never pay for dotenv
+            assert athena.getenv("ATHENA_TEST_FROM_DOTENV") == "from-.env"
+            assert athena.getenv("ATHENA_TEST_MISSING", "default") == "default"
+            assert loads == [1]
+        finally:
+            os.environ.pop("ATHENA_TEST_FROM_DOTENV", None)
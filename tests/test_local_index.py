@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+test_local_index.py — Tests for the shared local SQLite index
+=============================================================
+
+Covers athena.memory.local_index: schema migrations, batched writes with
+tag diffs, links, FTS content search and the athenad integration.
+
+Usage: python3 -m pytest tests/test_local_index.py -v
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+
+class TestLocalIndex:
+    """Test the schema-versioned local index store."""
+
+    @pytest.fixture(autouse=True)
+    def setup_index(self, tmp_path):
+        from athena.memory.local_index import SCHEMA_VERSION, LocalIndex
+
+        self.root = tmp_path / "notes"
+        self.root.mkdir()
+        self.index = LocalIndex(tmp_path / "athena.db")
+        self.schema_version = SCHEMA_VERSION
+
+    def write(self, name: str, content: str) -> str:
+        path = self.root / name
+        path.write_text(content)
+        return str(path)
+
+    def test_index_and_search(self):
+        """Indexed files are searchable by path, tag and content."""
+        path = self.write("kelly.md", "# Kelly Sizing\nUse fractional kelly. #risk")
+        assert self.index.index_paths([path]) == 1
+
+        assert self.index.search_paths("kelly") == [path]
+        assert self.index.search_tags("risk") == [(path, "risk")]
+        hits = self.index.search_content("fractional")
+        assert hits[0]["path"] == path
+        assert hits[0]["title"] == "Kelly Sizing"
+
+    def test_unchanged_files_skipped(self):
+        """A second pass over unchanged files writes nothing."""
+        path = self.write("a.md", "# A #one")
+        assert self.index.index_paths([path]) == 1
+        assert self.index.index_paths([path]) == 0
+
+    def test_tag_diff_on_update(self):
+        """Removed tags are unlinked, new tags are linked."""
+        path = self.write("a.md", "#one #two")
+        self.index.index_paths([path])
+
+        Path(path).write_text("#two #three plus more content")
+        self.index.index_paths([path])
+
+        tags = {t for _, t in self.index.search_tags("")}
+        assert tags == {"two", "three"}
+
+    def test_tags_written_by_another_writer_are_replaced(self):
+        """A second writer on the same DB cannot leave stale tag links behind."""
+        from athena.memory.local_index import LocalIndex
+
+        other = LocalIndex(self.index.db_path)
+        path = self.write("a.md", "#one")
+        self.index.index_paths([path])
+
+        Path(path).write_text("#two from the other process")
+        other.index_paths([path])
+
+        Path(path).write_text("#three back in the first process, longer")
+        self.index.index_paths([path])
+
+        assert {t for _, t in self.index.search_tags("")} == {"three"}
+        other.close()
+
+    def test_links_and_backlinks(self):
+        """Markdown links resolve to paths; wikilinks keep the note name."""
+        target = self.write("target.md", "# Target")
+        source = self.write("source.md", "See [t](target.md) and [[Protocol 42]]")
+        self.index.index_paths([target, source])
+
+        assert self.index.backlinks(target) == [source]
+        assert self.index.backlinks("Protocol 42.md") == [source]
+
+    def test_find_by_name_and_files_under(self):
+        """Name lookups respect directory prefixes."""
+        path = self.write("CS-001-test.md", "# Case")
+        self.index.index_paths([path])
+
+        assert self.index.find_by_name("CS-001-test.md", under=[self.root]) == [path]
+        assert self.index.find_by_name("CS-001-test.md", under=[Path("/elsewhere")]) == []
+        assert self.index.files_under(self.root, "CS-%") == [path]
+
+    def test_migrates_legacy_database(self, tmp_path):
+        """A pre-versioning athena.db is upgraded in place and re-indexed."""
+        from athena.memory.local_index import SCHEMA_PATH, LocalIndex
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        path = self.write("old.md", "# Old #legacy")
+        conn.execute(
+            "INSERT INTO files (path, checksum) VALUES (?, ?)", (path, "stale")
+        )
+        conn.commit()
+        conn.close()
+
+        index = LocalIndex(db_path)
+        assert index.stats()["schema_version"] == self.schema_version
+        assert index.index_paths([path]) == 1
+        assert index.search_tags("legacy") == [(path, "legacy")]
+
+    def test_concurrent_migration_of_legacy_database(self, tmp_path):
+        """Writers opening an un-migrated DB at once migrate it exactly once."""
+        from athena.memory.local_index import SCHEMA_PATH, LocalIndex
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA_PATH.read_text())
+        conn.close()
+
+        barrier = threading.Barrier(4)
+        errors = []
+
+        def open_index():
+            barrier.wait()
+            try:
+                LocalIndex(db_path).connect().close()
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=open_index) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert LocalIndex(db_path).stats()["schema_version"] == self.schema_version
+
+    def test_failed_migration_rolls_back(self, tmp_path, monkeypatch):
+        """A step that fails leaves neither schema changes nor a bumped version."""
+        from athena.memory import local_index
+
+        def broken(conn):
+            conn.execute("CREATE TABLE half_done (x)")
+            raise sqlite3.OperationalError("boom")
+
+        monkeypatch.setattr(local_index, "MIGRATIONS", [*local_index.MIGRATIONS[:1], (2, broken)])
+        db_path = tmp_path / "fresh.db"
+        conn = sqlite3.connect(db_path)
+        with pytest.raises(sqlite3.OperationalError, match="boom"):
+            local_index.migrate(conn)
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        assert "files" not in tables and "half_done" not in tables
+        conn.close()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+test_permissions.py — Tests for the permissioning layer
+=======================================================
+
+Covers athena.core.permissions: compiled sensitivity labeling and
+(streaming) redaction, compiled granular rules with the decision cache,
+and the audit ring buffer.
+
+Usage: python3 -m pytest tests/test_permissions.py -v
+"""
+
+import json
+import random
+
+import pytest
+
+from athena.core.permissions import (
+    INTERNAL_PATTERNS,
+    SECRET_PATTERNS,
+    Action,
+    AuditLog,
+    GranularPermissionEngine,
+    GranularRule,
+    Sensitivity,
+    SensitivityMatcher,
+    get_sensitivity_matcher,
+)
+
+
+def reference_label(content: str) -> Sensitivity:
+    """The original per-pattern substring scan."""
+    lowered = content.lower()
+    if any(p.lower() in lowered for p in SECRET_PATTERNS):
+        return Sensitivity.SECRET
+    if any(p.lower() in lowered for p in INTERNAL_PATTERNS):
+        return Sensitivity.INTERNAL
+    return Sensitivity.PUBLIC
+
+
+class TestSensitivityMatcher:
+    """The compiled matcher must agree with a naive scan."""
+
+    @pytest.fixture(autouse=True)
+    def setup_matcher(self):
+        self.matcher = get_sensitivity_matcher()
+        rng = random.Random(7)
+        words = [*SECRET_PATTERNS, *INTERNAL_PATTERNS, "notes", "the", " ", "\n", "Kelly"]
+        self.samples = [
+            "".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+            for _ in range(500)
+        ]
+
+    def test_label_matches_reference(self):
+        for sample in self.samples:
+            assert self.matcher.label(sample) == reference_label(sample), sample
+        assert self.matcher.label("see the Session_Log for API_KEY") == Sensitivity.SECRET
+        assert self.matcher.label("nothing here") == Sensitivity.PUBLIC
+
+    def test_redact_catches_case_variants(self):
+        text = "Password=1 PASSWORD=2 my Api_Key and a .ENV file"
+        redacted = self.matcher.redact(text)
+        assert redacted == "[REDACTED]=1 [REDACTED]=2 my [REDACTED] and a [REDACTED] file"
+        assert self.matcher.label(redacted) == Sensitivity.PUBLIC
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10_000])
+    def test_streaming_redact_matches_whole_text(self, chunk_size):
+        text = "\n".join(self.samples)
+        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+        assert "".join(self.matcher.redact_stream(chunks)) == self.matcher.redact(text)
+
+    def test_overlapping_patterns_prefer_longest(self):
+        matcher = SensitivityMatcher(["key", "secret_key"], ["secret"])
+        assert matcher.redact("SECRET_KEY") == "[REDACTED]"
+        assert matcher.label("secret") == Sensitivity.INTERNAL
+        assert matcher.label("my secretkey") == Sensitivity.SECRET
+
+
+class TestGranularRules:
+    """Compiled rules must give the same last-match-wins answer as fnmatch."""
+
+    def reference(self, engine: GranularPermissionEngine, tool: str, input_str: str) -> Action:
+        result = Action.ALLOW
+        for rule in engine._rules:
+            if rule.matches(tool, input_str):
+                result = rule.action
+        return result
+
+    def test_compiled_matches_reference(self, tmp_path):
+        engine = GranularPermissionEngine(rules_path=tmp_path / "rules.json")
+        rng = random.Random(11)
+        tools = ["bash", "read", "write", "doom_loop", "b*", "re?d", "*"]
+        patterns = ["*", "git *", "rm *", "*.env", "*.env.*", "[a-c]*", "*secret*", "ls"]
+        for _ in range(300):
+            engine._rules.append(
+                GranularRule(rng.choice(tools), rng.choice(patterns), rng.choice(list(Action)))
+            )
+        engine._invalidate()
+
+        inputs = ["git status", "rm -rf /", ".env", "a.env.local", "cat", "ls", "my secret", "*"]
+        for tool in ["bash", "read", "write", "doom_loop", "other"]:
+            for input_str in inputs:
+                expected = self.reference(engine, tool, input_str)
+                assert engine.check(tool, input_str) == expected, (tool, input_str)
+                assert engine.check(tool, input_str) == expected  # Cached
+
+    def test_add_rule_invalidates_cache(self, tmp_path):
+        engine = GranularPermissionEngine(rules_path=tmp_path / "rules.json")
+        assert engine.check("bash", "git push") == Action.ALLOW
+        engine.add_rule("bash", "git push*", Action.ASK)
+        assert engine.check("bash", "git push") == Action.ASK
+        assert engine.check("read", ".env.example") == Action.ALLOW
+        assert engine.check("read", "prod.env") == Action.DENY
+        assert json.loads((tmp_path / "rules.json").read_text())[-1]["action"] == "ask"
+
+
+class TestAuditLog:
+    """Ring buffer bounds and the JSONL sink."""
+
+    def test_ring_buffer_and_sink(self, tmp_path):
+        sink = tmp_path / "audit.jsonl"
+        log = AuditLog(size=10, sink=sink)
+        for i in range(25):
+            log.record("check", f"tool{i}", {"allowed": True})
+
+        assert len(log) == 10
+        entries = log.entries()
+        assert entries[0]["target"] == "tool15"
+        assert entries[-1] == {**entries[-1], "action": "check", "allowed": True}
+
+        log.flush()
+        lines = sink.read_text().splitlines()
+        assert len(lines) == 25
+        assert json.loads(lines[-1])["target"] == "tool24"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+test_prewarm.py — Tests for the budgeted search-cache prewarm
+=============================================================
+
+Covers athena.tools.prewarm: queries finished within the budget are
+reported as warmed, and a query still running at the deadline neither
+delays run() nor holds the process open at exit. Also covers compaction
+of the search query log it plans from.
+
+Usage: python3 -m pytest tests/test_prewarm.py -v
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+from athena.core import search_telemetry
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+SCRIPT = textwrap.dedent(
+    """
+    import json, sys, time
+    from pathlib import Path
+    import athena.core.search_telemetry as telemetry
+    import athena.tools.prewarm as prewarm
+    import athena.tools.search as search
+
+    def retrieve(query, **kwargs):
+        time.sleep(60 if query == "slow" else 0.01)
+
+    search.retrieve = retrieve
+    telemetry.compact_log = lambda: 0
+    prewarm.PREWARM_STATE_PATH = Path(sys.argv[1])
+    prewarm.PrewarmEngine.plan = lambda self: [
+        {"query": q, "limit": 10, "strict": False, "rerank": False, "skills_only": False}
+        for q in ("fast-1", "slow", "fast-2")
+    ]
+    prewarm.PrewarmEngine._batch_embeddings = staticmethod(lambda qs: [None] * len(qs))
+
+    report = prewarm.PrewarmEngine(budget_seconds=0.5, max_workers=2).run()
+    print(json.dumps(report))
+    """
+)
+
+
+class TestPrewarmBudget:
+    """The time budget bounds the whole process, not just run()."""
+
+    def test_slow_query_does_not_outlive_the_budget(self, tmp_path):
+        started = time.monotonic()
+        proc = subprocess.run(
+            [sys.executable, "-c", SCRIPT, str(tmp_path / "prewarm_state.json")],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+        )
+        elapsed = time.monotonic() - started
+
+        assert proc.returncode == 0, proc.stderr
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        assert sorted(report["warmed"]) == ["fast-1", "fast-2"]
+        assert report["skipped"] == 1
+        assert elapsed < 15  # Exits without joining the 60s query
+
+
+class TestSearchTelemetry:
+    """Compaction never loses appends that race with it."""
+
+    def test_compaction_keeps_concurrent_appends(self, tmp_path, monkeypatch):
+        log = tmp_path / "search_queries.jsonl"
+        monkeypatch.setattr(search_telemetry, "_get_telemetry_path", lambda: log)
+        writers_done = threading.Event()
+        dropped = []
+
+        def writer(w):
+            for i in range(200):
+                search_telemetry.log_search_query(f"q{w}-{i}")
+
+        def compactor():
+            while not writers_done.is_set():
+                dropped.append(search_telemetry.compact_log(max_lines=50))
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        compacting = threading.Thread(target=compactor)
+        compacting.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writers_done.set()
+        compacting.join()
+
+        kept = len(log.read_text().splitlines())
+        assert kept + sum(dropped) == 800
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+test_search_embedding.py — Tests for the bounded query embedding fetch
+======================================================================
+
+Covers athena.tools.search._fetch_query_embedding: the EMBED_TIMEOUT
+bound holds on the main thread and on worker threads alike, and the HTTP
+timeout is passed through to get_embedding.
+
+Usage: python3 -m pytest tests/test_search_embedding.py -v
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from athena.memory import vectors
+from athena.tools import search
+
+
+@pytest.fixture
+def slow_embedder(monkeypatch):
+    release = threading.Event()
+    timeouts = []
+
+    def get_embedding(text, timeout=30):
+        timeouts.append(timeout)
+        release.wait(10)
+        return [0.0]
+
+    monkeypatch.setattr(vectors, "get_embedding", get_embedding)
+    monkeypatch.setattr(search, "EMBED_TIMEOUT", 0.2)
+    yield timeouts
+    release.set()
+
+
+class TestFetchQueryEmbedding:
+    """The embedding deadline does not depend on the calling thread."""
+
+    def test_times_out_on_the_main_thread(self, slow_embedder):
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="timed out"):
+            search._fetch_query_embedding("kelly")
+        assert time.monotonic() - started < 2
+        assert slow_embedder == [0.2]
+
+    def test_times_out_on_a_worker_thread(self, slow_embedder):
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(search._fetch_query_embedding, "kelly")
+            with pytest.raises(TimeoutError, match="timed out"):
+                future.result(timeout=5)
+        assert time.monotonic() - started < 2
+
+    def test_returns_the_embedding(self, monkeypatch):
+        monkeypatch.setattr(vectors, "get_embedding", lambda text, timeout=30: [1.0, 2.0])
+        assert search._fetch_query_embedding("kelly") == [1.0, 2.0]
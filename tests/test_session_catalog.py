@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+test_session_catalog.py — Tests for the persisted session log index
+===================================================================
+
+Covers athena.core.session_catalog: latest/next-number lookups, header
+extraction, and staying correct when logs are added or edited outside athena.
+
+Usage: python3 -m pytest tests/test_session_catalog.py -v
+"""
+
+import pytest
+
+LOG = """---
+session_id: {sid}
+---
+
+# Session Log
+
+**Focus**: {focus}
+
+## 3. Action Items & Deferred
+
+| Action | Owner | Status |
+|--------|-------|--------|
+| Ship the catalog | AI | Pending |
+| Already done | AI | Done |
+
+## 4. Artifacts & Outputs
+"""
+
+
+class TestSessionCatalog:
+    """Test the session catalog against a temporary logs directory."""
+
+    @pytest.fixture(autouse=True)
+    def setup_catalog(self, tmp_path):
+        from athena.core.session_catalog import SessionCatalog
+
+        self.logs = tmp_path / "session_logs"
+        self.logs.mkdir()
+        self.catalog_path = tmp_path / "session_catalog.json"
+        self.catalog = SessionCatalog(self.logs, self.catalog_path)
+        self.make_catalog = lambda: SessionCatalog(self.logs, self.catalog_path)
+
+    def write(self, sid: str, focus: str = "..."):
+        path = self.logs / f"{sid}.md"
+        path.write_text(LOG.format(sid=sid, focus=focus))
+        return path
+
+    def test_latest_and_next_number(self):
+        """Latest sorts by date then number; next number is per date."""
+        self.write("2026-01-01-session-09")
+        self.write("2026-01-02-session-02")
+        self.write("2026-01-02-session-10")
+        (self.logs / "notes.md").write_text("not a session")
+
+        assert self.catalog.latest_path().name == "2026-01-02-session-10.md"
+        assert self.catalog.next_number("2026-01-02") == 11
+        assert self.catalog.next_number("2026-01-03") == 1
+
+    def test_header_fields(self):
+        """Focus and pending action items are extracted; placeholders are not."""
+        path = self.write("2026-01-01-session-01", focus="Catalog design")
+        assert self.catalog.header(path) == {
+            "focus": "Catalog design",
+            "deferred": ["Ship the catalog"],
+        }
+        placeholder = self.write("2026-01-01-session-02")
+        assert self.catalog.header(placeholder)["focus"] == ""
+
+    def test_external_changes_are_picked_up(self):
+        """New files and edits made outside athena invalidate the catalog."""
+        first = self.write("2026-01-01-session-01", focus="Before")
+        assert self.catalog.header(first)["focus"] == "Before"
+
+        catalog = self.make_catalog()  # Fresh process, loads the persisted file
+        self.write("2026-01-01-session-01", focus="After edit")
+        self.write("2026-01-01-session-02")
+        assert catalog.latest_path().name == "2026-01-01-session-02.md"
+        assert catalog.header(first)["focus"] == "After edit"
+
+    def test_register_and_refresh(self):
+        """Create/save hooks keep the catalog current without a rescan."""
+        self.catalog.latest_path()  # Build the catalog
+        path = self.write("2026-01-01-session-01", focus="New")
+        self.catalog.register(path)
+        assert self.catalog.latest_path() == path
+
+        with open(path, "a") as f:
+            f.write("\n### [10:00 SGT] Checkpoint\n")
+        self.catalog.refresh(path)
+        assert self.make_catalog().header(path)["focus"] == "New"
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+test_session_log.py — Tests for session log tailing and in-place metadata
+=========================================================================
+
+Covers athena.core.session_log (reverse-block tail, incremental line index,
+cached text) and in-place frontmatter updates in athena.sessions.
+
+Usage: python3 -m pytest tests/test_session_log.py -v
+"""
+
+import pytest
+import yaml
+
+from athena.core.session_log import SessionLogReader, tail_lines
+from athena.sessions import update_session_metadata
+
+FRONTMATTER = "---\nsession_id: 2026-01-01-session-01\nstatus: in_progress\nfocus:\n---\n"
+
+
+class TestSessionLogReader:
+    """Tail and line counts must match a full read + splitlines()."""
+
+    @pytest.fixture(autouse=True)
+    def setup_log(self, tmp_path):
+        self.path = tmp_path / "2026-01-01-session-01.md"
+        self.reader = SessionLogReader()
+
+    def append(self, text: str):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+    def expected(self, n: int) -> str:
+        return "\n".join(self.path.read_text(encoding="utf-8").splitlines()[-n:])
+
+    @pytest.mark.parametrize("n", [1, 3, 50, 10_000])
+    def test_tail_matches_splitlines(self, n):
+        body = "".join(f"line {i} {'é' * (i % 7)}\n" for i in range(2000))
+        self.path.write_text(FRONTMATTER + body + "no trailing newline", encoding="utf-8")
+        assert "\n".join(tail_lines(self.path, n, block_size=64)) == self.expected(n)
+
+    def test_line_index_and_text_follow_appends(self):
+        self.path.write_text(FRONTMATTER, encoding="utf-8")
+        assert self.reader.line_count(self.path) == 5
+        assert self.reader.read_text(self.path) == FRONTMATTER
+
+        for i in range(3):
+            self.append(f"\n### [10:0{i} SGT] Checkpoint\n\n**Summary**: step {i}\n")
+            content = self.path.read_text(encoding="utf-8")
+            assert self.reader.line_count(self.path) == len(content.splitlines())
+            assert self.reader.read_text(self.path) == content
+            assert self.reader.tail(self.path, 2) == self.expected(2)
+
+    def test_rewritten_log_is_reindexed(self):
+        self.path.write_text(FRONTMATTER + "a\nb\nc\n", encoding="utf-8")
+        self.reader.line_count(self.path)
+        self.path.write_text(FRONTMATTER.replace("in_progress", "closed") + "a\nb\nc\nd\n")
+        assert self.reader.read_text(self.path) == self.path.read_text()
+        assert self.reader.line_count(self.path) == 9
+
+
+class TestInPlaceMetadata:
+    """update_session_metadata reserves slots once, then writes in place."""
+
+    def test_tokens_accumulate_in_place(self, tmp_path):
+        path = tmp_path / "2026-01-01-session-01.md"
+        body = "# Session Log\n\n" + "x" * 10_000 + "\n"
+        path.write_text(FRONTMATTER + body, encoding="utf-8")
+
+        update_session_metadata(new_tokens=100, thread_id="t-1", log_path=path)
+        size = path.stat().st_size
+        ino = path.stat().st_ino
+
+        update_session_metadata(new_tokens=250, log_path=path)
+        update_session_metadata(new_tokens=1, thread_id="t-2", log_path=path)
+
+        content = path.read_text(encoding="utf-8")
+        meta = yaml.safe_load(content.split("---\n")[1])
+        assert meta["tokens"] == 351
+        assert meta["thread_id"] == "t-2"
+        assert meta["status"] == "in_progress"  # Other fields untouched
+        assert content.endswith(body)
+        assert (path.stat().st_size, path.stat().st_ino) == (size, ino)
+
+    @pytest.mark.parametrize(
+        "thread_id",
+        ["a: b # c", "- [x]", 'say "hi" \\ bye', "yes", "12", "naïve\ttab"],
+    )
+    def test_thread_id_is_yaml_encoded(self, tmp_path, thread_id):
+        path = tmp_path / "2026-01-01-session-01.md"
+        path.write_text(FRONTMATTER + "# Session Log\n", encoding="utf-8")
+
+        update_session_metadata(new_tokens=5, thread_id=thread_id, log_path=path)
+        update_session_metadata(new_tokens=5, thread_id=thread_id, log_path=path)
+
+        meta = yaml.safe_load(path.read_text(encoding="utf-8").split("---\n")[1])
+        assert meta["thread_id"] == thread_id
+        assert meta["tokens"] == 10
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+test_state_store.py — Tests for the shared engine state store
+=============================================================
+
+Covers athena.core.state_store (coalesced writes, atomic read-and-reset,
+cross-connection visibility, legacy JSON import) and the GovernanceEngine
+Triple-Lock state built on it.
+
+Usage: python3 -m pytest tests/test_state_store.py -v
+"""
+
+import json
+
+import pytest
+
+from athena.core.governance import GovernanceEngine, RiskLevel
+from athena.core.state_store import StateStore
+
+
+class TestStateStore:
+    """Two StateStore instances on one file stand in for two processes."""
+
+    @pytest.fixture(autouse=True)
+    def setup_db(self, tmp_path):
+        self.path = tmp_path / "state.db"
+        self.stores = []
+        yield
+        for store in self.stores:
+            store.close()
+
+    def open(self, **kwargs) -> StateStore:
+        store = StateStore(self.path, **kwargs)
+        self.stores.append(store)
+        return store
+
+    def test_writes_are_coalesced_and_visible_to_other_processes(self):
+        writer = self.open(flush_interval=60)  # Background flush never fires
+        other = self.open()
+
+        for i in range(100):
+            writer.update("ns", {"count": i, "flag": True})
+        assert writer.get("ns") == {"count": 99, "flag": True}
+        assert other.get("ns") == {}  # Not committed yet
+
+        writer.flush()
+        assert writer.flushes == 1
+        assert other.get("ns") == {"count": 99, "flag": True}
+
+    def test_disjoint_keys_do_not_clobber(self):
+        a, b = self.open(), self.open()
+        a.update("governance", {"semantic_search_performed": True})
+        b.update("governance", {"web_search_performed": True})
+        a.flush()
+        b.flush()
+        expected = {"semantic_search_performed": True, "web_search_performed": True}
+        assert a.get("governance") == b.get("governance") == expected
+
+    def test_update_returns_previous_state(self):
+        store = self.open()
+        store.update("ns", {"x": 1})
+        assert store.update("ns", {"x": 0, "y": 2}) == {"x": 1}
+        assert store.get("ns") == {"x": 0, "y": 2}
+
+    def test_legacy_json_is_imported_once(self, tmp_path):
+        legacy = tmp_path / "permissions.json"
+        legacy.write_text(json.dumps({"secret_mode": True, "caller_level": "read"}))
+        store = self.open()
+        assert store.seed("permissions", legacy)["secret_mode"] is True
+
+        store.update("permissions", {"secret_mode": False})
+        assert store.seed("permissions", legacy)["secret_mode"] is False
+
+
+class TestGovernanceState:
+    """Triple-Lock state round-trips through the store."""
+
+    def test_integrity_read_and_reset(self, tmp_path):
+        gov = GovernanceEngine(state_dir=tmp_path)
+        gov.mark_search_performed("q")
+        assert gov.verify_exchange_integrity() is False  # Web search missing
+
+        gov.mark_search_performed("q")
+        gov.mark_web_search_performed("q")
+        assert gov.get_integrity_score() == 1.0
+        assert gov.verify_exchange_integrity() is True
+        assert gov.get_status()["triple_lock"]["semantic_search"] is False
+
+        gov.set_risk_level(RiskLevel.SNIPER)
+        assert gov.verify_exchange_integrity() is True
+
+    def test_state_is_shared_across_engines(self, tmp_path):
+        (tmp_path / "exchange_state.json").write_text(
+            json.dumps({"semantic_search_performed": True})
+        )
+        first = GovernanceEngine(state_dir=tmp_path)
+        assert first._state["semantic_search_performed"] is True
+
+        first.mark_web_search_performed("q")
+        first._store.flush()
+        second = StateStore(tmp_path / "state.db")
+        try:
+            assert second.get("governance")["web_search_performed"] is True
+        finally:
+            second.close()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+test_supervisor.py — Tests for the background service supervisor
+=================================================================
+
+Covers athena.core.supervisor: single-instance claims, the unix-socket
+health endpoint (including stats published by the supervised child),
+restart-with-backoff of a crashing service and the command line.
+
+Usage: python3 -m pytest tests/test_supervisor.py -v
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from athena.core import supervisor
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+PROBE_SCRIPT = """
+import sys, time
+from athena.core import supervisor
+
+deadline = time.monotonic() + float(sys.argv[2])
+hits = probes = 0
+while time.monotonic() < deadline:
+    hits += supervisor.is_running("svc", sys.argv[1])
+    probes += 1
+print(hits, probes)
+"""
+
+HOLD_SCRIPT = """
+import sys
+from athena.core import supervisor
+
+handle = supervisor.claim("svc", run_dir=sys.argv[1])
+print("held" if handle else "busy", flush=True)
+sys.stdin.read()
+"""
+
+
+def spawn(script: str, *args: str, **kwargs) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", script, *args],
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        **kwargs,
+    )
+
+
+class TestSupervisor:
+    """Test the supervisor against a temporary run directory."""
+
+    @pytest.fixture(autouse=True)
+    def setup_run_dir(self, tmp_path, monkeypatch):
+        self.run_dir = tmp_path / "services"
+        self.tmp_path = tmp_path
+        monkeypatch.setattr(supervisor, "BACKOFF_INITIAL", 0.01)
+
+    def test_claim_is_single_instance(self):
+        """A second claim fails while the first is held; release frees it."""
+        first = supervisor.claim("svc", lambda: {"queue": 3}, self.run_dir)
+        assert first is not None
+        try:
+            assert supervisor.claim("svc", run_dir=self.run_dir) is None
+            assert supervisor.is_running("svc", self.run_dir)
+
+            status = supervisor.status("svc", self.run_dir)
+            assert status["state"] == "running"
+            assert status["queue"] == 3
+        finally:
+            first.release()
+
+        assert not supervisor.is_running("svc", self.run_dir)
+        assert supervisor.status("svc", self.run_dir)["state"] == "stopped"
+
+    def test_runner_restarts_crashes_with_backoff(self):
+        """A crashing child is restarted until it exits cleanly."""
+        counter = self.tmp_path / "runs"
+        script = self.tmp_path / "flaky.py"
+        script.write_text(
+            "import pathlib, sys\n"
+            f"p = pathlib.Path({str(counter)!r})\n"
+            "n = int(p.read_text()) + 1 if p.exists() else 1\n"
+            "p.write_text(str(n))\n"
+            "sys.exit(0 if n >= 3 else 1)\n"
+        )
+        runner = supervisor.ServiceRunner(
+            supervisor.ServiceSpec("flaky", script), run_dir=self.run_dir
+        )
+
+        thread = threading.Thread(target=runner.run)
+        thread.start()
+        thread.join(timeout=30)
+
+        assert not thread.is_alive()
+        assert counter.read_text() == "3"
+        assert runner.restarts == 2
+        assert runner.last_exit == 0
+        assert runner.backoff == pytest.approx(0.04)
+        assert not supervisor.is_running("flaky", self.run_dir)
+
+    def test_runner_serves_the_child_stats(self, monkeypatch):
+        """Stats a supervised child publishes show up on the runner's health socket."""
+        stop = self.tmp_path / "stop"
+        script = self.tmp_path / "service.py"
+        script.write_text(
+            "import pathlib, time\n"
+            "from athena.core.supervisor import publish_stats\n"
+            "publish_stats({'queue_depth': 4, 'worker_respawns': 1})\n"
+            f"while not pathlib.Path({str(stop)!r}).exists():\n"
+            "    time.sleep(0.01)\n"
+        )
+        monkeypatch.setenv("PYTHONPATH", str(SRC))  # Inherited by the child
+        runner = supervisor.ServiceRunner(
+            supervisor.ServiceSpec("svc", script), run_dir=self.run_dir
+        )
+        thread = threading.Thread(target=runner.run)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10
+            while not (supervisor.probe("svc", self.run_dir) or {}).get("stats"):
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+            status = supervisor.status("svc", self.run_dir)
+            assert status["stats"] == {"queue_depth": 4, "worker_respawns": 1}
+        finally:
+            stop.touch()
+            thread.join(timeout=30)
+
+        assert not list(self.run_dir.glob("*.stats.json"))
+
+    def test_run_requires_a_service_name(self):
+        proc = subprocess.run(
+            [sys.executable, "-m", "athena.core.supervisor", "run"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+            timeout=30,
+        )
+        assert proc.returncode == 2
+        assert "run requires a service name" in proc.stderr
+
+    def test_stale_socket_is_replaced(self):
+        """A socket left by a crashed holder does not block a new claim."""
+        self.run_dir.mkdir(parents=True)
+        stale = supervisor.socket_path("svc", self.run_dir)
+        open(stale, "w").close()
+
+        handle = supervisor.claim("svc", run_dir=self.run_dir)
+        try:
+            deadline = time.monotonic() + 2
+            while supervisor.probe("svc", self.run_dir) is None:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            handle.release()
+
+    def test_lock_held_by_another_process_is_seen(self):
+        """Probes see a holder in another process; its exit frees the service."""
+        holder = spawn(HOLD_SCRIPT, str(self.run_dir), stdin=subprocess.PIPE)
+        try:
+            assert holder.stdout.readline().strip() == "held"
+            assert supervisor.is_running("svc", self.run_dir)
+            assert supervisor.claim("svc", run_dir=self.run_dir) is None
+        finally:
+            holder.communicate("", timeout=10)
+
+        assert not supervisor.is_running("svc", self.run_dir)
+
+    def test_probes_do_not_take_the_lock(self):
+        """Concurrent probers never see each other, and never block a claim."""
+        self.run_dir.mkdir(parents=True)
+        supervisor.claim("svc", run_dir=self.run_dir).release()  # Create the lock file
+
+        probers = [spawn(PROBE_SCRIPT, str(self.run_dir), "1.0") for _ in range(2)]
+        for prober in probers:
+            hits, probes = map(int, prober.communicate(timeout=30)[0].split())
+            assert probes > 0
+            assert hits == 0
+
+        prober = spawn(PROBE_SCRIPT, str(self.run_dir), "1.0")
+        failed_claims = 0
+        while prober.poll() is None:
+            handle = supervisor.claim("svc", run_dir=self.run_dir)
+            if handle is None:
+                failed_claims += 1
+            else:
+                handle.release()
+        prober.communicate(timeout=30)
+        assert failed_claims == 0
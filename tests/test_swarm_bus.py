@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_swarm_bus.py — Tests for push delivery on the swarm message bus
+=====================================================================
+
+Covers athena.core.swarm_bus doorbells and SessionsRPC.subscribe():
+wake-up latency, batch acks, exactly-once delivery across concurrent
+subscribers, stale socket cleanup and the asyncio path.
+
+Usage: python3 -m pytest tests/test_swarm_bus.py -v
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from athena.core.sessions_rpc import SessionMessage, SessionsRPC
+from athena.core.swarm_bus import Doorbell, ring, topic_key
+
+
+class TestDoorbell:
+    """Ring/wait semantics of the unix datagram doorbell."""
+
+    def test_ring_wakes_only_its_topic(self, tmp_path):
+        with Doorbell(tmp_path, "master") as master, Doorbell(tmp_path, "A") as other:
+            assert master.wait(0) is False
+            assert ring(tmp_path, "master") == 1
+            assert master.wait(1) is True
+            assert other.wait(0) is False
+            assert master.wait(0) is False  # Rings were drained
+
+    def test_stale_doorbells_are_removed(self, tmp_path):
+        bell = Doorbell(tmp_path, "master")
+        bell._sock.close()  # Simulate a subscriber that died without closing
+        assert os.path.exists(bell.path)
+        assert ring(tmp_path, "master") == 0
+        assert not any(p.name.startswith(topic_key("master")) for p in tmp_path.iterdir())
+
+    def test_ring_is_best_effort_without_unix_sockets(self, tmp_path, monkeypatch):
+        from athena.core import swarm_bus
+
+        def unsupported(*args, **kwargs):
+            raise OSError("Address family not supported by protocol")
+
+        monkeypatch.setattr(swarm_bus, "_sender", None)
+        monkeypatch.setattr(swarm_bus.socket, "socket", unsupported)
+        assert ring(tmp_path, "master") == 0
+        monkeypatch.setattr(swarm_bus, "HAS_UNIX_DGRAM", False)
+        assert ring(tmp_path, "master") == 0
+
+
+class TestSubscribe:
+    """Subscribers are woken by the writer instead of polling."""
+
+    @pytest.fixture(autouse=True)
+    def setup_rpc(self, tmp_path):
+        self.rpc = SessionsRPC(db_path=tmp_path / "swarm.db")
+        self.rpc.init_tables()
+        yield
+        self.rpc.close()
+
+    def send(self, content: str, to: str = "master"):
+        return self.rpc.send_message(
+            SessionMessage(from_session="A", to_session=to, content=content)
+        )
+
+    def test_receive_is_woken_by_send(self):
+        with self.rpc.subscribe("master") as sub:
+            sent_at = []
+
+            def writer():
+                time.sleep(0.2)
+                sent_at.append(time.monotonic())
+                self.send("ping")
+
+            threading.Thread(target=writer).start()
+            batch = sub.receive(timeout=10)
+            latency = time.monotonic() - sent_at[0]
+
+        assert [m["content"] for m in batch] == ["ping"]
+        assert latency < 1.0  # Far below the 5s fallback re-check
+
+    def test_batches_are_acked_in_order(self):
+        for i in range(5):
+            self.send(f"m{i}")
+        self.send("not for master", to="B")
+
+        with self.rpc.subscribe("master", batch_size=3) as sub:
+            first = sub.receive(timeout=1)
+            second = sub.receive(timeout=1)
+            assert sub.receive(timeout=0.05) == []
+
+        assert [len(first), len(second)] == [3, 2]
+        assert [m["content"] for m in first + second] == [f"m{i}" for i in range(5)]
+        assert self.rpc.get_history("master", unread_only=True) == []
+        assert len(self.rpc.get_history("B", unread_only=True)) == 1
+
+    def test_unacked_messages_stay_in_the_log(self):
+        self.send("keep me")
+        with self.rpc.subscribe("master") as sub:
+            batch = sub.receive(timeout=1, ack=False)
+            assert sub.receive(timeout=0.05) == []  # Not redelivered to this subscriber
+        assert [m["content"] for m in self.rpc.get_history("master", unread_only=True)] == [
+            "keep me"
+        ]
+        self.rpc.ack([m["id"] for m in batch])
+
+    def test_concurrent_subscribers_get_each_message_once(self):
+        total = 2000
+        delivered = []
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def subscriber():
+            with self.rpc.subscribe("master", batch_size=25) as sub:
+                while not stop.is_set():
+                    batch = sub.receive(timeout=0.1)
+                    with lock:
+                        delivered.extend(m["id"] for m in batch)
+
+        def poller():
+            while not stop.is_set():
+                batch = self.rpc.get_history("master", limit=10, unread_only=True)
+                with lock:
+                    delivered.extend(m["id"] for m in batch)
+                time.sleep(0.01)
+
+        workers = [threading.Thread(target=subscriber) for _ in range(4)]
+        workers.append(threading.Thread(target=poller))
+        for worker in workers:
+            worker.start()
+        for start in range(0, total, 50):
+            self.rpc.send_messages(
+                [
+                    SessionMessage(from_session="A", to_session="master", content=f"m{i}")
+                    for i in range(start, start + 50)
+                ]
+            )
+
+        deadline = time.monotonic() + 30
+        while len(delivered) < total and time.monotonic() < deadline:
+            time.sleep(0.05)
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=10)
+
+        assert len(delivered) == total
+        assert len(set(delivered)) == total
+
+    def test_async_receive(self):
+        async def main():
+            with self.rpc.subscribe("master") as sub:
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.1, lambda: threading.Thread(target=self.send, args=("async",)).start())
+                return await sub.areceive(timeout=10)
+
+        assert [m["content"] for m in asyncio.run(main())] == ["async"]
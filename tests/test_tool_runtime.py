@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+test_tool_runtime.py — Tests for the MCP tool runtime
+=====================================================
+
+Covers athena.core.tool_runtime: bounded pool execution, latency
+percentiles, in-flight tracking, error counts and cache hit ratios, and
+that a slow embedder cannot pin a pool slot during smart_search.
+
+Usage: python3 -m pytest tests/test_tool_runtime.py -v
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from athena.core.tool_runtime import ToolRuntime, ToolStats
+
+
+class TestToolRuntime:
+    """Test metrics and concurrency of the shared tool runtime."""
+
+    def test_percentiles_and_cache_ratio(self):
+        """Nearest-rank p50/p95/p99 over the window; hit ratio per tool."""
+        stats = ToolStats()
+        for ms in range(1, 101):
+            stats.begin("search")
+            stats.end("search", float(ms), ok=ms != 100)
+        for hit in (True, True, False, True):
+            stats.record_cache("search", hit)
+
+        report = stats.snapshot()["search"]
+        assert (report["p50_ms"], report["p95_ms"], report["p99_ms"]) == (50, 95, 99)
+        assert report["calls"] == 100
+        assert report["errors"] == 1
+        assert report["in_flight"] == 0
+        assert report["cache_hit_ratio"] == 0.75
+
+    def test_blocking_tools_run_concurrently_on_the_pool(self):
+        """Blocking calls overlap (bounded by max_workers) and report in-flight."""
+        runtime = ToolRuntime(max_workers=4)
+        barrier = threading.Barrier(4, timeout=5)
+        seen_in_flight = []
+
+        def slow():
+            barrier.wait()  # Only passes if 4 calls run at once
+            seen_in_flight.append(runtime.stats.snapshot()["slow"]["in_flight"])
+            return threading.current_thread().name
+
+        async def main():
+            return await asyncio.gather(*(runtime.run("slow", slow) for _ in range(4)))
+
+        names = asyncio.run(main())
+        assert all(n.startswith("mcp-tool") for n in names)
+        assert max(seen_in_flight) == 4
+        assert runtime.snapshot()["tools"]["slow"]["in_flight"] == 0
+
+    def test_errors_propagate_and_are_counted(self):
+        runtime = ToolRuntime(max_workers=1)
+
+        def boom():
+            raise PermissionError("gated")
+
+        with pytest.raises(PermissionError):
+            asyncio.run(runtime.run("gated", boom))
+        assert runtime.stats.snapshot()["gated"]["errors"] == 1
+
+    def test_slow_embedder_releases_the_pool_slot(self, tmp_path, monkeypatch):
+        """smart_search's embedding fetch is bounded even on a pool thread."""
+        from athena.core import cache
+        from athena.memory import vectors
+        from athena.tools import search
+
+        release = threading.Event()
+        monkeypatch.setattr(
+            vectors, "get_embedding", lambda text, timeout=30: release.wait(10) and [0.0]
+        )
+        monkeypatch.setattr(search, "EMBED_TIMEOUT", 0.2)
+        monkeypatch.setattr(search, "_record_query", lambda *args: None)
+        monkeypatch.setattr(cache, "_search_cache", cache.QueryCache(cache_dir=tmp_path))
+        runtime = ToolRuntime(max_workers=1)
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    runtime.run("smart_search", search.search_payload, q, skills_only=True)
+                    for q in ("first", "second")  # second waits for the only slot
+                )
+            )
+
+        started = time.monotonic()
+        try:
+            results = asyncio.run(main())
+        finally:
+            release.set()
+        assert time.monotonic() - started < 5  # Not the embedder's 10s
+        assert [hit for _, hit in results] == ["miss", "miss"]